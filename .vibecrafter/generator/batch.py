@@ -0,0 +1,67 @@
+"""VibeCrafter - Headless batch generation from answer files."""
+
+import argparse
+import sys
+
+from vibecrafter.infrastructure.batch.answer_spec_loader import AnswerSpecLoader
+from vibecrafter.infrastructure.config.dependencies import create_batch_generator
+from vibecrafter.infrastructure.emitters.output_targets import OUTPUT_TARGETS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate project.md files from JSON/TOML answer files."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Answer files (.json, .toml, .jsonl), directories of them, or - for JSONL on stdin",
+    )
+    parser.add_argument("--output-dir", default="out", help="Default output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument(
+        "--fsync", action="store_true", help="fsync each project.md before renaming it"
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Inline every referenced doc into each project.md",
+    )
+    parser.add_argument(
+        "--render-cache",
+        action="store_true",
+        help="Reuse rendered documents for identical answers across runs",
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        choices=sorted(OUTPUT_TARGETS),
+        help="Also write this format beside project.md (repeatable)",
+    )
+    parser.add_argument(
+        "--suggest-docs",
+        action="store_true",
+        help="Suggest related docs for the listed features",
+    )
+    args = parser.parse_args()
+
+    specs = AnswerSpecLoader(args.output_dir).load(args.sources)
+    generator = create_batch_generator(
+        workers=args.workers,
+        fsync=args.fsync,
+        bundle=args.bundle,
+        render_cache=args.render_cache,
+        targets=tuple(args.target),
+        suggest_docs=args.suggest_docs,
+    )
+    report = generator.execute(specs)
+
+    for name, error in report.failures:
+        print(f"FAILED {name}: {error}", file=sys.stderr)
+    print(report.summary())
+    sys.exit(1 if report.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Benchmark suite: wizard traversal, option resolution, scanning, rendering and
+catalog memory per step.
+
+Usage:
+    poetry run python benchmarks/run_benchmarks.py --sizes 10,1000,100000 \
+        --shapes wide,deep --output bench_results.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from synthetic_catalog import (
+    FirstOptionPrompter,
+    build_docs_tree,
+    build_steps,
+    write_database,
+)
+
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+from vibecrafter.infrastructure.repositories.docs_index import DocsIndex
+from vibecrafter.infrastructure.repositories.file_scanner_impl import FileScannerImpl
+from vibecrafter.infrastructure.repositories.indexed_file_scanner import (
+    IndexedFileScanner,
+)
+from vibecrafter.infrastructure.repositories.memoized_file_scanner import (
+    MemoizedFileScanner,
+)
+from vibecrafter.infrastructure.repositories.sqlite_step_repository import (
+    SqliteStepRepository,
+)
+from vibecrafter.infrastructure.writers.file_template_writer import FileTemplateWriter
+
+GENERATOR_DIR = Path(__file__).resolve().parent.parent
+SCAN_PATHS = ("languages", "designs", "languages/lang0/project_types")
+
+
+def measure(fn: Callable[[], object], repeat: int) -> dict[str, float]:
+    timings: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "mean_ms": round(statistics.fmean(timings), 4),
+        "repeat": repeat,
+    }
+
+
+def measure_catalog_memory(sqlite_repo: SqliteStepRepository) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    steps = sqlite_repo.find_all()
+    cached = CachedStepRepository(steps)
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cached
+    return {
+        "bytes_per_step": round(allocated / max(1, len(steps)), 1),
+        "total_kb": round(allocated / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_case(size: int, shape: str, repeat: int, workdir: Path) -> list[dict]:
+    case_dir = workdir / f"{shape}-{size}"
+    docs_dir = case_dir / "docs"
+    case_dir.mkdir()
+    build_docs_tree(docs_dir, languages=max(2, size // 1000), files_per_dir=20)
+    steps = build_steps(size, shape)
+    db_path = case_dir / "steps.db"
+    write_database(steps, db_path, GENERATOR_DIR / "migrations")
+
+    sqlite_repo = SqliteStepRepository(str(db_path), read_only=True)
+    cached_repo = CachedStepRepository(sqlite_repo.find_all())
+    fs_scanner = FileScannerImpl(str(docs_dir))
+    indexed_scanner = IndexedFileScanner(DocsIndex.load(str(docs_dir)))
+    memoized_scanner = MemoizedFileScanner(fs_scanner)
+    prompter = FirstOptionPrompter()
+    instructions = (GENERATOR_DIR / "instructions.md").read_text(encoding="utf-8")
+
+    def wizard(repo, scanner) -> RunWizard:
+        return RunWizard(step_repository=repo, user_prompter=prompter, file_scanner=scanner)
+
+    session = wizard(cached_repo, indexed_scanner).execute()
+    select_steps = [r.step for r in session.all_results() if r.step.type == StepType.SELECT]
+    cached_wizard = wizard(cached_repo, indexed_scanner)
+    renderer = RenderTemplate(
+        template_writer=FileTemplateWriter(), instructions_content=instructions
+    )
+    output_path = str(case_dir / "project.md")
+
+    benchmarks: dict[str, Callable[[], object]] = {
+        "catalog_load.sqlite_find_all": sqlite_repo.find_all,
+        "catalog_load.cached_index_build": lambda: CachedStepRepository(steps),
+        "wizard.execute.sqlite_repo": lambda: wizard(sqlite_repo, indexed_scanner).execute(),
+        "wizard.execute.cached_repo": lambda: cached_wizard.execute(),
+        "wizard.resolve_options": lambda: [
+            cached_wizard._resolve_options(step, session) for step in select_steps
+        ],
+        "scanner.file_scanner_impl": lambda: [fs_scanner.list_md_files(p) for p in SCAN_PATHS],
+        "scanner.indexed": lambda: [indexed_scanner.list_md_files(p) for p in SCAN_PATHS],
+        "scanner.memoized": lambda: [memoized_scanner.list_md_files(p) for p in SCAN_PATHS],
+        "scanner.docs_index_refresh": lambda: DocsIndex.load(str(docs_dir)),
+        "session.results_by_section": session.results_by_section,
+        "render.execute": lambda: renderer.execute(session, output_path),
+    }
+
+    results = []
+    for name, fn in benchmarks.items():
+        results.append(
+            {
+                "name": name,
+                "size": size,
+                "shape": shape,
+                "answered_steps": len(session.all_results()),
+                **measure(fn, repeat),
+            }
+        )
+    results.append(
+        {
+            "name": "memory.catalog_per_step",
+            "size": size,
+            "shape": shape,
+            **measure_catalog_memory(sqlite_repo),
+        }
+    )
+    sqlite_repo.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the VibeCrafter benchmark suite.")
+    parser.add_argument("--sizes", default="10,1000,10000", help="Comma-separated step counts")
+    parser.add_argument("--shapes", default="wide,deep", help="Comma-separated: wide, deep")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args()
+
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for shape in args.shapes.split(","):
+            for size in (int(s) for s in args.sizes.split(",")):
+                case_results = run_case(size, shape, args.repeat, Path(tmpdir))
+                results.extend(case_results)
+                for result in case_results:
+                    if "bytes_per_step" in result:
+                        figure = f"{result['bytes_per_step']:>10.1f} B/step"
+                    else:
+                        figure = f"median {result['median_ms']:>10.3f} ms"
+                    print(
+                        f"{shape:>4} {size:>7} {result['name']:<34} {figure}",
+                        file=sys.stderr,
+                    )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
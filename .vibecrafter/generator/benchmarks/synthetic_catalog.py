@@ -0,0 +1,132 @@
+"""Synthetic step catalogs and docs trees for the benchmark suite."""
+
+import sqlite3
+from pathlib import Path
+
+from vibecrafter.application.ports.user_prompter import UserPrompter
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_result import StepResult
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
+
+SECTIONS = ("datos_proyecto", "contexto")
+# RunWizard recurses once per nested step, so chains stay below the recursion limit.
+MAX_CHAIN_DEPTH = 400
+
+
+class FirstOptionPrompter(UserPrompter):
+    """Answers every text step with a fixed value and every select with its first option."""
+
+    def show_welcome(self) -> None:
+        pass
+
+    def show_step_header(self, step_number: int, question: str) -> None:
+        pass
+
+    def ask_text(self, question: str) -> str:
+        return "valor"
+
+    def ask_multiline(self, question: str) -> str:
+        return "  - uno\n  - dos"
+
+    def ask_select(self, question: str, options: list[str]) -> str:
+        return options[0]
+
+    def show_summary(self, results: list[StepResult]) -> None:
+        pass
+
+    def show_success(self, output_path: str) -> None:
+        pass
+
+
+def build_steps(size: int, shape: str, fanout: int = 4) -> list[Step]:
+    """Builds `size` steps.
+
+    `wide`: many roots, each a select whose options each trigger one text child.
+    `deep`: a few roots, each heading a chain of selects triggered by "opt0".
+    Every fifth root scans the docs tree, half of them through a placeholder.
+    """
+    steps: list[Step] = []
+    next_id = 1
+    root_order = 0
+
+    def add(parent_id, trigger, order, step_type, options, template) -> int:
+        nonlocal next_id
+        step_id = next_id
+        next_id += 1
+        steps.append(
+            Step(
+                id=step_id,
+                parent_id=parent_id,
+                trigger_value=trigger,
+                order=order,
+                type=step_type,
+                question=f"Pregunta {step_id}?",
+                options=options,
+                variable=f"VAR_{step_id}",
+                md_section=SECTIONS[step_id % len(SECTIONS)],
+                md_template=template,
+                md_order=step_id,
+            )
+        )
+        return step_id
+
+    static_options = "|".join(f"opt{i}" for i in range(fanout))
+    while len(steps) < size:
+        root_order += 1
+        if root_order == 1:
+            add(None, None, 0, StepType.SELECT, "@scan:languages", "- **Lang:** {value}")
+            continue
+        if root_order % 5 == 0:
+            path = "languages/{VAR_1}/project_types" if root_order % 10 == 0 else "designs"
+            add(None, None, root_order, StepType.SELECT, f"@scan:{path}|Ninguno",
+                "- **Scan:** {value}\\n  > `.vibecrafter/docs/" + path + "/{value}.md`")
+            continue
+
+        root = add(None, None, root_order, StepType.SELECT, static_options,
+                   "- **Root:** {value} ({VAR_1})")
+        if shape == "deep":
+            parent = root
+            depth = 0
+            while len(steps) < size and depth < MAX_CHAIN_DEPTH:
+                parent = add(parent, "opt0", 1, StepType.SELECT, static_options,
+                             "- **Nivel:** {value}")
+                depth += 1
+        else:
+            for i in range(fanout):
+                if len(steps) >= size:
+                    break
+                add(root, f"opt{i}", i, StepType.TEXT, None, "- **Hijo:** {value}")
+    return steps
+
+
+def write_database(steps: list[Step], db_path: Path, migrations_dir: Path) -> None:
+    connection = sqlite3.connect(db_path)
+    try:
+        SqliteMigrator(connection, str(migrations_dir)).migrate()
+        connection.executemany(
+            'INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, '
+            "options, variable, md_section, md_template, md_order) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (s.id, s.parent_id, s.trigger_value, s.order, s.type.value, s.question,
+                 s.options, s.variable, s.md_section, s.md_template, s.md_order)
+                for s in steps
+            ],
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def build_docs_tree(root: Path, languages: int, files_per_dir: int) -> None:
+    for lang in range(languages):
+        lang_dir = root / "languages" / f"lang{lang}"
+        (lang_dir / "project_types").mkdir(parents=True, exist_ok=True)
+        (lang_dir / "conventions.md").write_text("# Conventions\n", encoding="utf-8")
+        for i in range(files_per_dir):
+            (lang_dir / "project_types" / f"type{i}.md").write_text("# Type\n")
+    designs = root / "designs"
+    designs.mkdir(parents=True, exist_ok=True)
+    for i in range(files_per_dir):
+        (designs / f"design{i}.md").write_text("# Design\n", encoding="utf-8")
@@ -1,17 +1,90 @@
 """VibeCrafter - Interactive project wizard."""
 
+import argparse
+import json
 import sys
+from pathlib import Path
 
-from vibecrafter.infrastructure.config.dependencies import create_wizard_runner
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.infrastructure.config.dependencies import (
+    PROMPTER_UIS,
+    create_wizard_runner,
+)
+from vibecrafter.infrastructure.emitters.output_targets import OUTPUT_TARGETS
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
 
 
 def main() -> None:
-    runner = create_wizard_runner()
+    parser = argparse.ArgumentParser(description="Interactive project.md wizard.")
+    parser.add_argument("--trace-json", help="Write a Chrome/Perfetto JSON trace here")
+    parser.add_argument("--metrics", help="Write a Prometheus text summary here")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted session from its saved answers",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Precompute what each option leads to while a selection is open",
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Inline every referenced doc into project.md",
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        choices=sorted(OUTPUT_TARGETS),
+        help="Also write this format beside project.md (repeatable)",
+    )
+    parser.add_argument(
+        "--ui",
+        choices=PROMPTER_UIS,
+        default="rich",
+        help="Terminal UI: rich panels, minimal-redraw ansi (slow SSH) or plain",
+    )
+    parser.add_argument(
+        "--suggest-docs",
+        action="store_true",
+        help="Suggest related docs for the listed features",
+    )
+    args = parser.parse_args()
+
+    recorder = SpanRecorder() if args.trace_json or args.metrics else None
+    runner = create_wizard_runner(
+        recorder=recorder,
+        bundle=args.bundle,
+        prefetch=args.prefetch,
+        targets=tuple(args.target),
+        ui=args.ui,
+        suggest_docs=args.suggest_docs,
+    )
     try:
-        runner.execute()
+        if args.resume:
+            stale = runner.discard_stale_answers()
+            if stale is not None:
+                print(
+                    "Las respuestas guardadas ya no encajan con el catalogo o los "
+                    f"docs actuales. Se volvera a preguntar desde {stale}."
+                )
+                input("  Pulsa Enter para continuar...")
+        runner.execute(resume=args.resume)
     except KeyboardInterrupt:
-        print("\nCancelado.")
+        print("\nCancelado. Usa --resume para continuar donde lo dejaste.")
+        sys.exit(1)
+    except WizardError as error:
+        print(f"\nError: {error}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if recorder and args.trace_json:
+            Path(args.trace_json).write_text(
+                json.dumps(recorder.to_chrome_trace()), encoding="utf-8"
+            )
+        if recorder and args.metrics:
+            Path(args.metrics).write_text(recorder.to_prometheus(), encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+"""VibeCrafter - Upgrade steps.db to the latest schema and optionally reseed it."""
+
+import argparse
+import sqlite3
+
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply pending steps.db migrations.")
+    parser.add_argument(
+        "--seed", action="store_true", help="Replace the catalog rows with seed.sql"
+    )
+    args = parser.parse_args()
+
+    paths = GeneratorPaths.default()
+    connection = sqlite3.connect(paths.db_path)
+    try:
+        migrator = SqliteMigrator(connection, str(paths.migrations_dir))
+        applied = migrator.migrate()
+        for version in applied:
+            print(f"Applied migration {version:04d}")
+        if args.seed:
+            migrator.seed(paths.seed_path.read_text(encoding="utf-8"))
+            print("Catalog seeded from seed.sql")
+        print(f"steps.db at schema version {migrator.current_version()}")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+-- Tabla de pasos del asistente. IF NOT EXISTS permite adoptar bases creadas
+-- por el antiguo `make seed` sin perder datos.
+CREATE TABLE IF NOT EXISTS steps (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER REFERENCES steps(id),
+    trigger_value TEXT,
+    "order" INTEGER NOT NULL,
+    type TEXT NOT NULL CHECK(type IN ('text', 'multiline', 'select', 'confirm')),
+    question TEXT NOT NULL,
+    options TEXT,
+    variable TEXT NOT NULL,
+    md_section TEXT,
+    md_template TEXT,
+    md_order INTEGER NOT NULL DEFAULT 0
+);
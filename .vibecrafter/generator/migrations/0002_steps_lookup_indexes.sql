@@ -0,0 +1,5 @@
+-- find_children: parent_id = ? AND (trigger_value IS NULL OR trigger_value = ?) ORDER BY "order"
+CREATE INDEX IF NOT EXISTS idx_steps_children ON steps (parent_id, trigger_value, "order");
+
+-- find_roots: parent_id IS NULL ORDER BY "order"
+CREATE INDEX IF NOT EXISTS idx_steps_parent_order ON steps (parent_id, "order");
@@ -0,0 +1,78 @@
+"""VibeCrafter - Regenerate project.md after changing some answers."""
+
+import argparse
+import sys
+
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.infrastructure.config.dependencies import create_regenerator
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.emitters.output_targets import OUTPUT_TARGETS
+
+
+def parse_assignment(raw: str) -> tuple[str, str]:
+    variable, separator, value = raw.partition("=")
+    if not separator or not variable:
+        raise argparse.ArgumentTypeError(f"Expected VARIABLE=valor, got: {raw}")
+    return variable, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-render project.md from its recorded answers plus changes."
+    )
+    parser.add_argument(
+        "assignments",
+        nargs="*",
+        type=parse_assignment,
+        metavar="VARIABLE=valor",
+        help="Answers to change, e.g. NOTAS='Usar Docker'",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(GeneratorPaths.default().output_path),
+        help="project.md to regenerate",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Write even if the content is unchanged"
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Inline every referenced doc into project.md",
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        choices=sorted(OUTPUT_TARGETS),
+        help="Also write this format beside project.md (repeatable)",
+    )
+    parser.add_argument(
+        "--suggest-docs",
+        action="store_true",
+        help="Suggest related docs for the listed features",
+    )
+    args = parser.parse_args()
+
+    try:
+        regenerator = create_regenerator(
+            bundle=args.bundle,
+            targets=tuple(args.target),
+            suggest_docs=args.suggest_docs,
+        )
+        outcome = regenerator.execute(
+            args.output, dict(args.assignments), force=args.force
+        )
+    except WizardError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        sys.exit(1)
+
+    if not outcome.written:
+        print(f"Sin cambios: {args.output} no se ha reescrito.")
+        return
+    sections = ", ".join(outcome.rendered_sections) or "ninguna"
+    print(f"Regenerado {args.output} (secciones renderizadas: {sections})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,4 @@
-CREATE TABLE IF NOT EXISTS steps (
-    id INTEGER PRIMARY KEY,
-    parent_id INTEGER REFERENCES steps(id),
-    trigger_value TEXT,
-    "order" INTEGER NOT NULL,
-    type TEXT NOT NULL CHECK(type IN ('text', 'multiline', 'select', 'confirm')),
-    question TEXT NOT NULL,
-    options TEXT,
-    variable TEXT NOT NULL,
-    md_section TEXT,
-    md_template TEXT,
-    md_order INTEGER NOT NULL DEFAULT 0
-);
+-- Datos del catalogo de pasos. El esquema vive en migrations/ (ver migrate.py).
 
 -- Step 1: Nombre del proyecto
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
@@ -32,7 +20,7 @@ VALUES (4, NULL, NULL, 4, 'select', 'Que lenguaje quieres usar?', '@scan:languag
 -- Step 5: Tipo de proyecto (escanea project_types/ del lenguaje elegido)
 -- {LENGUAJE} se resuelve en tiempo de ejecucion con el valor de la sesion
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
-VALUES (5, NULL, NULL, 5, 'select', 'Que tipo de proyecto es?', '@scan:languages/{LENGUAJE}/project_types', 'TIPO_PROYECTO', 'datos_proyecto', '- **Tipo de proyecto:** {value}\n  > Tipo de proyecto: `.vibecrafter/docs/languages/[lenguaje]/project_types/{value}.md`', 5);
+VALUES (5, NULL, NULL, 5, 'select', 'Que tipo de proyecto es?', '@scan:languages/{LENGUAJE}/project_types', 'TIPO_PROYECTO', 'datos_proyecto', '- **Tipo de proyecto:** {value}\n  > Tipo de proyecto: `.vibecrafter/docs/languages/{LENGUAJE}/project_types/{value}.md`', 5);
 
 -- Step 6: Frontend (hijo de step 5, trigger "webapp")
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
@@ -40,11 +28,11 @@ VALUES (6, 5, 'webapp', 1, 'select', 'Como quieres el frontend?', 'Motor de plan
 
 -- Step 7: Base de datos (escanea docs/databases/)
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
-VALUES (7, NULL, NULL, 6, 'select', 'Necesitas base de datos?', '@scan:databases|Ninguna', 'BASE_DATOS', 'contexto', '- **Base de datos:** {value}\n  > Base de datos: `.vibecrafter/docs/databases/{value}.md`\n  > Persistencia: `.vibecrafter/docs/languages/[lenguaje]/persistence.md`', 1);
+VALUES (7, NULL, NULL, 6, 'select', 'Necesitas base de datos?', '@scan:databases|Ninguna', 'BASE_DATOS', 'contexto', '- **Base de datos:** {value}\n  > Base de datos: `.vibecrafter/docs/databases/{value}.md`\n  > Persistencia: `.vibecrafter/docs/languages/{LENGUAJE}/persistence.md`', 1);
 
 -- Step 8: Autenticacion - Python (hijo de step 4, trigger "python")
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
-VALUES (8, 4, 'python', 1, 'select', 'Necesitas autenticacion?', 'No|JWT|OAuth2|Session', 'AUTH', 'contexto', '- **Autenticacion:** {value}\n  > Autenticacion: `.vibecrafter/docs/languages/[lenguaje]/auth.md`', 2);
+VALUES (8, 4, 'python', 1, 'select', 'Necesitas autenticacion?', 'No|JWT|OAuth2|Session', 'AUTH', 'contexto', '- **Autenticacion:** {value}\n  > Autenticacion: `.vibecrafter/docs/languages/{LENGUAJE}/auth.md`', 2);
 
 -- Step 9: Testing
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
@@ -65,7 +53,7 @@ VALUES (12, NULL, NULL, 8, 'text', 'Notas adicionales (opcional, Enter para salt
 
 -- Step 13: Autenticacion - Kotlin (hijo de step 4, trigger "kotlin")
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
-VALUES (13, 4, 'kotlin', 1, 'select', 'Necesitas autenticacion?', 'No|Firebase Auth|JWT (backend propio)|OAuth2', 'AUTH', 'contexto', '- **Autenticacion:** {value}\n  > Autenticacion: `.vibecrafter/docs/languages/[lenguaje]/auth.md`', 2);
+VALUES (13, 4, 'kotlin', 1, 'select', 'Necesitas autenticacion?', 'No|Firebase Auth|JWT (backend propio)|OAuth2', 'AUTH', 'contexto', '- **Autenticacion:** {value}\n  > Autenticacion: `.vibecrafter/docs/languages/{LENGUAJE}/auth.md`', 2);
 
 -- Step 14: Diseno visual (hijo de step 5, trigger "android-app")
 INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, options, variable, md_section, md_template, md_order)
@@ -0,0 +1,55 @@
+"""VibeCrafter - HTTP service mode with a preloaded catalog."""
+
+import argparse
+import asyncio
+
+from vibecrafter.infrastructure.config.dependencies import create_wizard_server
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
+
+# Only totals feed /metrics; keep a small window of raw spans.
+SERVER_MAX_SPANS = 1_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve project.md generation over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--metrics", action="store_true", help="Instrument ports and expose GET /metrics"
+    )
+    parser.add_argument(
+        "--prerender",
+        action="store_true",
+        help="Pre-render every wizard path at startup and serve /render from it",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes for --prerender"
+    )
+    parser.add_argument(
+        "--no-render-cache",
+        action="store_true",
+        help="Disable the in-memory and on-disk rendered-output cache",
+    )
+    parser.add_argument(
+        "--suggest-docs",
+        action="store_true",
+        help="Suggest related docs for the listed features (ignored with --prerender)",
+    )
+    args = parser.parse_args()
+
+    recorder = SpanRecorder(max_spans=SERVER_MAX_SPANS) if args.metrics else None
+    server = create_wizard_server(
+        recorder=recorder,
+        prerender=args.prerender,
+        workers=args.workers,
+        render_cache=not args.no_render_cache,
+        suggest_docs=args.suggest_docs,
+    )
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+
+class AnswerJournal(ABC):
+    @abstractmethod
+    def append(self, variable: str, value: str) -> None:
+        """Durably records one answer as soon as it is given."""
+        ...
+
+    @abstractmethod
+    def replay(self) -> dict[str, str]:
+        """Returns the recorded answers; the first answer per variable wins."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Discards every recorded answer."""
+        ...
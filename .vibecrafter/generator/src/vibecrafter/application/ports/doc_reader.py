@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class DocReader(ABC):
+    @abstractmethod
+    def read(self, relative_path: str) -> str | None:
+        """Returns the content of a doc relative to docs/, or None if it does not exist."""
+        ...
+
+    @abstractmethod
+    def list_md(self, relative_dir: str) -> list[str]:
+        """Lists .md paths (relative to docs/) directly inside the given directory."""
+        ...
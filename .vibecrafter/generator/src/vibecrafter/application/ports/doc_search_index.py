@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class DocSearchIndex(ABC):
+    @abstractmethod
+    def search(self, text: str, limit: int) -> list[str]:
+        """Docs most relevant to `text`, best first, as paths relative to docs/."""
+        ...
+
+    @abstractmethod
+    def version(self) -> str:
+        """Changes whenever the indexed docs change."""
+        ...
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+from vibecrafter.domain.models.project_document import ProjectDocument
+
+
+class DocumentEmitter(ABC):
+    @abstractmethod
+    def emit(self, document: ProjectDocument) -> Iterator[str]:
+        """Yields the document in this emitter's target format, in chunks."""
+        ...
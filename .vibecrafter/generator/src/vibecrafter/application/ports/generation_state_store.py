@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from vibecrafter.domain.models.generation_state import GenerationState
+
+
+class GenerationStateStore(ABC):
+    @abstractmethod
+    def load(self, output_path: str) -> GenerationState | None:
+        """Returns the state recorded for `output_path`, or None if there is none."""
+        ...
+
+    @abstractmethod
+    def save(self, output_path: str, state: GenerationState) -> None:
+        """Records the state of the last write to `output_path`."""
+        ...
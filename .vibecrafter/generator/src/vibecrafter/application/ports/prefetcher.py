@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+from vibecrafter.domain.models.step import Step
+
+
+class Prefetcher(ABC):
+    @abstractmethod
+    def prefetch(
+        self, step: Step, options: list[str], values: Mapping[str, str]
+    ) -> None:
+        """Starts warming whatever each option of `step` leads to; never blocks."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Drops pending work and releases the workers; must not block."""
+        ...
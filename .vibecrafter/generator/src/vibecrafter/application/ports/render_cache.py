@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class RenderCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Returns the document cached under `key`, or None on a miss."""
+        ...
+
+    @abstractmethod
+    def put(self, key: str, content: str) -> None:
+        """Caches `content`; implementations may evict older entries to stay bounded."""
+        ...
@@ -9,6 +9,11 @@ class StepRepository(ABC):
         """Returns all root steps (parent_id IS NULL), ordered by order."""
         ...
 
+    @abstractmethod
+    def find_all(self) -> list[Step]:
+        """Returns every step in the catalog, ordered by id."""
+        ...
+
     @abstractmethod
     def find_children(self, parent_id: int, trigger_value: str) -> list[Step]:
         """Returns children where trigger_value IS NULL or matches the given value."""
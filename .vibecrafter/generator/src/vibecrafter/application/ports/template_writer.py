@@ -1,6 +1,24 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 
 class TemplateWriter(ABC):
     @abstractmethod
-    def write(self, path: str, content: str) -> None: ...
+    def write(self, path: str, chunks: Iterable[str]) -> None:
+        """Writes the chunks, in order, as the full content of `path`."""
+        ...
+
+    @abstractmethod
+    def write_if_changed(
+        self, path: str, chunks: Iterable[str], force: bool = False
+    ) -> tuple[str, bool]:
+        """Like `write`, but keeps `path` as is when it already holds these bytes.
+
+        Returns the chunks' SHA-256 hex digest and whether `path` was replaced.
+        """
+        ...
+
+    @abstractmethod
+    def digest(self, path: str) -> str | None:
+        """SHA-256 hex digest of `path` as it is now, or None if it is missing."""
+        ...
@@ -0,0 +1,39 @@
+from collections.abc import Callable, Iterator
+
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.models.document_skeleton import slot_marker
+from vibecrafter.domain.models.pending_step import PendingStep
+from vibecrafter.domain.models.step_type import StepType
+
+
+class EnumeratePaths:
+    """Walks every reachable path of the step graph.
+
+    SELECT steps branch on each of their options; free-text steps are answered
+    with a slot marker so the path can be rendered as a skeleton.
+    """
+
+    def __init__(self, run_wizard: RunWizard) -> None:
+        self._run_wizard = run_wizard
+
+    def execute(
+        self,
+        on_select: Callable[[PendingStep, dict[str, str]], None] | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """`on_select` sees each SELECT reached, with the answers leading to it."""
+        pending_paths: list[dict[str, str]] = [{}]
+        while pending_paths:
+            answers = pending_paths.pop()
+            pending = self._run_wizard.next_step(answers)
+            if pending is None:
+                yield answers
+                continue
+            variable = pending.step.variable
+            if pending.step.type == StepType.SELECT:
+                if on_select is not None:
+                    on_select(pending, answers)
+                # Reversed so paths come out in option order.
+                for option in reversed(pending.options):
+                    pending_paths.append({**answers, variable: option})
+            else:
+                pending_paths.append({**answers, variable: slot_marker(variable)})
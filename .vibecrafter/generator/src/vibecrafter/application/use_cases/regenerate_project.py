@@ -0,0 +1,124 @@
+import hashlib
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+
+from vibecrafter.application.ports.document_emitter import DocumentEmitter
+from vibecrafter.application.ports.generation_state_store import GenerationStateStore
+from vibecrafter.application.ports.template_writer import TemplateWriter
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.domain.models.generation_state import GenerationState
+from vibecrafter.domain.models.render_outcome import RenderOutcome
+from vibecrafter.domain.models.rendered_section import RenderedSection
+from vibecrafter.domain.models.wizard_session import WizardSession
+
+
+class RegenerateProject:
+    """Re-renders a project.md from its recorded answers plus a set of changes.
+
+    Only sections whose inputs changed are rendered again, and each file is
+    left untouched (mtime included) when its content on disk already matches.
+    A file that was deleted or edited since the last run is written again.
+
+    `emitters` maps extra file names, written beside project.md, to the emitter
+    that renders them from the same ProjectDocument. They share its digest.
+    """
+
+    def __init__(
+        self,
+        run_wizard: RunWizard,
+        render_template: RenderTemplate,
+        template_writer: TemplateWriter,
+        state_store: GenerationStateStore,
+        emitters: Mapping[str, DocumentEmitter] | None = None,
+    ) -> None:
+        self._run_wizard = run_wizard
+        self._render_template = render_template
+        self._template_writer = template_writer
+        self._state_store = state_store
+        self._emitters = dict(emitters or {})
+
+    def execute(
+        self, output_path: str, changes: Mapping[str, str], force: bool = False
+    ) -> RenderOutcome:
+        previous = self._state_store.load(output_path)
+        if previous is None:
+            raise WizardError(f"No recorded answers for {output_path}")
+        # Unchanged answers replay straight from the state; only subtrees under a
+        # changed SELECT can reach steps that still need an answer.
+        session = self._run_wizard.execute({**previous.answers, **changes})
+        return self._write(session, output_path, previous, force)
+
+    def write(
+        self, session: WizardSession, output_path: str, force: bool = False
+    ) -> RenderOutcome:
+        previous = self._state_store.load(output_path)
+        return self._write(session, output_path, previous, force)
+
+    def _write(
+        self,
+        session: WizardSession,
+        output_path: str,
+        previous: GenerationState | None,
+        force: bool,
+    ) -> RenderOutcome:
+        reused = previous.sections if previous else {}
+        digests = self._render_template.section_digests(session)
+        sections: dict[str, RenderedSection] = {}
+        rendered: list[str] = []
+        for section_id, digest in digests.items():
+            cached = reused.get(section_id)
+            if cached is not None and cached.digest == digest:
+                sections[section_id] = cached
+                continue
+            text = self._render_template.render_section(session, section_id) or ""
+            sections[section_id] = RenderedSection(digest=digest, text=text)
+            rendered.append(section_id)
+
+        section_texts = {sid: section.text for sid, section in sections.items()}
+        content_hash = hashlib.sha256()
+        written = False
+        for path, chunks in self._render_outputs(session, output_path, section_texts):
+            # Streamed straight into the writer, which hashes as it goes.
+            file_digest, replaced = self._template_writer.write_if_changed(
+                path, chunks, force
+            )
+            if path != output_path:
+                content_hash.update(Path(path).name.encode("utf-8"))
+            content_hash.update(file_digest.encode("ascii"))
+            written = written or replaced
+        content_digest = content_hash.hexdigest()
+
+        self._state_store.save(
+            output_path,
+            GenerationState(
+                answers=self._answers(session),
+                content_digest=content_digest,
+                sections=sections,
+            ),
+        )
+        return RenderOutcome(
+            written=written,
+            content_digest=content_digest,
+            rendered_sections=rendered,
+        )
+
+    def _render_outputs(
+        self, session: WizardSession, output_path: str, sections: dict[str, str]
+    ) -> Iterator[tuple[str, Iterable[str]]]:
+        if not self._emitters:
+            # project.md alone can still come from the render cache.
+            yield output_path, self._render_template.render(session, sections)
+            return
+        document = self._render_template.build_document(session, sections)
+        yield output_path, self._render_template.render_document(document)
+        for filename, emitter in self._emitters.items():
+            yield str(Path(output_path).with_name(filename)), emitter.emit(document)
+
+    @staticmethod
+    def _answers(session: WizardSession) -> dict[str, str]:
+        answers: dict[str, str] = {}
+        for result in session.all_results():
+            answers.setdefault(result.step.variable, result.value)
+        return answers
@@ -1,4 +1,17 @@
+import hashlib
+import json
+import re
+from collections.abc import Iterator, Mapping
+
+from vibecrafter.application.ports.doc_reader import DocReader
+from vibecrafter.application.ports.doc_search_index import DocSearchIndex
+from vibecrafter.application.ports.render_cache import RenderCache
 from vibecrafter.application.ports.template_writer import TemplateWriter
+from vibecrafter.domain.models.compiled_template import compile_template
+from vibecrafter.domain.models.document_section import DocumentSection
+from vibecrafter.domain.models.project_document import ProjectDocument
+from vibecrafter.domain.models.step_result import StepResult
+from vibecrafter.domain.models.step_type import StepType
 from vibecrafter.domain.models.wizard_session import WizardSession
 
 SECTION_ORDER: list[tuple[str, str]] = [
@@ -8,44 +21,277 @@ SECTION_ORDER: list[tuple[str, str]] = [
 
 DEFAULT_EMPTY_VALUE = "Ninguna"
 
+DOCS_REFERENCE_PATTERN = re.compile(r"`\.vibecrafter/docs/([^`]+)`")
+BUNDLE_HEADER = "## Anexo: documentacion incluida"
+
+SUGGESTIONS_SECTION = ("sugerencias", "## 3. Documentacion sugerida")
+SUGGESTIONS_PER_LINE = 2
+SUGGESTION_CANDIDATES = 6
+MAX_SUGGESTIONS = 5
+# Bumped when what a cache entry holds changes, so older entries are not reused.
+CACHE_FORMAT = 2
+
 
 class RenderTemplate:
     def __init__(
         self,
         template_writer: TemplateWriter,
         instructions_content: str,
+        doc_reader: DocReader | None = None,
+        render_cache: RenderCache | None = None,
+        catalog_version: str = "",
+        doc_search: DocSearchIndex | None = None,
     ) -> None:
+        """With a `doc_reader`, every referenced doc is inlined after the instructions.
+
+        With a `render_cache`, whole documents are cached by `cache_key`. Bundled
+        renders bypass it, since doc contents are not part of the key.
+
+        With a `doc_search`, each line of the multiline answers is matched
+        against the docs and the best hits are listed as suggested reading.
+        """
         self._template_writer = template_writer
         self._instructions_content = instructions_content
+        self._doc_reader = doc_reader
+        self._render_cache = render_cache
+        self._catalog_version = catalog_version
+        self._doc_search = doc_search
+        self._instructions_digest = hashlib.sha256(
+            instructions_content.encode("utf-8")
+        ).hexdigest()
+        self._instructions_references = DOCS_REFERENCE_PATTERN.findall(
+            instructions_content
+        )
 
     def execute(self, session: WizardSession, output_path: str) -> None:
-        lines: list[str] = []
-        project_name = session.get_value("NOMBRE") or "Sin nombre"
-        lines.append(f"# Proyecto: {project_name}")
-        lines.append("")
+        self._template_writer.write(output_path, self.render(session))
+
+    def render(
+        self, session: WizardSession, sections: Mapping[str, str] | None = None
+    ) -> Iterator[str]:
+        """Yields project.md in chunks; cached when a render cache is set.
+
+        Sections present in `sections` are emitted as given instead of rendered.
+        The cache holds only the rendered text before the instructions, which a
+        hit yields again as the original chunk, so a StaticSegment keeps its
+        zero-copy write.
+        """
+        if self._render_cache is None or self._doc_reader is not None:
+            yield from self.render_document(self.build_document(session, sections))
+            return
 
+        key = self.cache_key(session)
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            yield cached
+            yield self._instructions_content
+            return
+        rendered: list[str] = []
+        for chunk in self.render_document(self.build_document(session, sections)):
+            if chunk is not self._instructions_content:
+                rendered.append(chunk)
+            yield chunk
+        self._render_cache.put(key, "".join(rendered))
+
+    def cache_key(self, session: WizardSession) -> str:
+        """Canonical hash of the catalog version, instructions and answers.
+
+        Answers are keyed by step id, so the order they were given in and the
+        variable names shared between branches do not matter.
+        """
+        answers = sorted(
+            (result.step.id, result.value) for result in session.all_results()
+        )
+        docs_version = self._doc_search.version() if self._doc_search else ""
+        encoded = json.dumps(
+            [
+                CACHE_FORMAT,
+                self._catalog_version,
+                self._instructions_digest,
+                docs_version,
+                answers,
+            ]
+        ).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def build_document(
+        self, session: WizardSession, sections: Mapping[str, str] | None = None
+    ) -> ProjectDocument:
+        """Groups, orders and substitutes the answers once for every emitter.
+
+        Sections present in `sections` keep the given text instead of rendering.
+        """
         grouped = session.results_by_section()
+        variables = self._variables(session)
+        references: dict[str, None] = dict.fromkeys(self._instructions_references)
+        built: list[DocumentSection] = []
 
         for section_id, section_header in SECTION_ORDER:
             results = grouped.get(section_id, [])
             if not results:
                 continue
 
-            lines.append(section_header)
-            lines.append("")
+            text = sections.get(section_id) if sections else None
+            if text is None:
+                text = self._render_section(section_header, results, variables)
+            references.update(dict.fromkeys(DOCS_REFERENCE_PATTERN.findall(text)))
+            built.append(
+                DocumentSection(
+                    id=section_id,
+                    header=section_header,
+                    text=text,
+                    answers=tuple(
+                        (result.step.variable, result.value) for result in results
+                    ),
+                )
+            )
+
+        suggestions = self._suggest(session, references)
+        if suggestions:
+            section_id, section_header = SUGGESTIONS_SECTION
+            text = self._render_suggestions(section_header, suggestions)
+            references.update(dict.fromkeys(suggestions))
+            built.append(DocumentSection(section_id, section_header, text, ()))
+
+        return ProjectDocument(
+            project_name=session.get_value("NOMBRE") or "Sin nombre",
+            sections=tuple(built),
+            instructions=self._instructions_content,
+            references=tuple(references),
+        )
+
+    def render_document(self, document: ProjectDocument) -> Iterator[str]:
+        """Yields project.md for an already built document."""
+        yield f"# Proyecto: {document.project_name}\n\n"
+        for section in document.sections:
+            yield section.text
+
+        yield "---\n\n"
+        yield document.instructions
 
+        if self._doc_reader is not None:
+            yield from self._render_bundle(self._doc_reader, list(document.references))
+
+    def render_section(self, session: WizardSession, section_id: str) -> str | None:
+        results = session.results_by_section().get(section_id)
+        if not results:
+            return None
+        header = dict(SECTION_ORDER)[section_id]
+        return self._render_section(header, results, self._variables(session))
+
+    def section_digests(self, session: WizardSession) -> dict[str, str]:
+        """Hashes each section's inputs; equal digests render to equal text."""
+        grouped = session.results_by_section()
+        variables = self._variables(session)
+        digests: dict[str, str] = {}
+        for section_id, section_header in SECTION_ORDER:
+            results = grouped.get(section_id)
+            if not results:
+                continue
+            inputs: list[object] = [section_header]
             for result in results:
-                template = result.step.md_template or ""
-                value = result.value if result.value.strip() else DEFAULT_EMPTY_VALUE
-                rendered = template.replace("{value}", value)
-                rendered = rendered.replace("\\n", "\n")
-                lines.append(rendered)
+                template = compile_template(result.step.md_template or "")
+                inputs.append(result.step.md_template or "")
+                inputs.append(result.value)
+                inputs.append(
+                    {name: variables.get(name) for name in template.placeholders}
+                )
+            encoded = json.dumps(inputs, sort_keys=True).encode("utf-8")
+            digests[section_id] = hashlib.sha256(encoded).hexdigest()
+        return digests
 
-            lines.append("")
+    def _render_section(
+        self, header: str, results: list[StepResult], variables: dict[str, str]
+    ) -> str:
+        lines = [header, ""]
+        for result in results:
+            template = compile_template(result.step.md_template or "")
+            value = result.value if result.value.strip() else DEFAULT_EMPTY_VALUE
+            lines.append(template.render(value, variables))
+        lines.append("")
+        return "\n".join(lines) + "\n"
 
-        lines.append("---")
+    def _suggest(
+        self, session: WizardSession, references: Mapping[str, None]
+    ) -> list[str]:
+        if self._doc_search is None:
+            return []
+        suggestions: dict[str, None] = {}
+        for result in session.all_results():
+            if result.step.type != StepType.MULTILINE:
+                continue
+            for line in result.value.splitlines():
+                if not line.strip():
+                    continue
+                hits = [
+                    path
+                    for path in self._doc_search.search(line, SUGGESTION_CANDIDATES)
+                    if path not in references and not _off_branch(path, references)
+                ]
+                suggestions.update(dict.fromkeys(hits[:SUGGESTIONS_PER_LINE]))
+        return list(suggestions)[:MAX_SUGGESTIONS]
+
+    @staticmethod
+    def _render_suggestions(header: str, suggestions: list[str]) -> str:
+        lines = [
+            header,
+            "",
+            "Segun las funcionalidades descritas, estos docs pueden ser relevantes. "
+            "Leelos solo si aplican:",
+            "",
+        ]
+        lines.extend(f"- `.vibecrafter/docs/{path}`" for path in suggestions)
         lines.append("")
-        lines.append(self._instructions_content)
+        return "\n".join(lines) + "\n"
+
+    def _render_bundle(
+        self, doc_reader: DocReader, references: list[str]
+    ) -> Iterator[str]:
+        yield f"\n\n---\n\n{BUNDLE_HEADER}\n"
+        for relative_path in self._expand_references(doc_reader, references):
+            content = doc_reader.read(relative_path)
+            if content is None:
+                continue
+            yield f"\n### `.vibecrafter/docs/{relative_path}`\n\n"
+            yield content
+            if not content.endswith("\n"):
+                yield "\n"
+
+    def _expand_references(
+        self, doc_reader: DocReader, references: list[str]
+    ) -> list[str]:
+        expanded: dict[str, None] = {}
+        for reference in references:
+            if reference.endswith("/"):
+                for relative_path in doc_reader.list_md(reference):
+                    expanded.setdefault(relative_path)
+            else:
+                expanded.setdefault(reference)
+        return list(expanded)
+
+    def _variables(self, session: WizardSession) -> dict[str, str]:
+        variables: dict[str, str] = {}
+        for result in session.all_results():
+            value = result.value if result.value.strip() else DEFAULT_EMPTY_VALUE
+            variables.setdefault(result.step.variable, value)
+        return variables
+
+
+def _off_branch(path: str, references: Mapping[str, None]) -> bool:
+    """True if `path` sits in a sibling of a directory the answers chose.
 
-        content = "\n".join(lines)
-        self._template_writer.write(output_path, content)
+    `languages/kotlin/auth.md` is off-branch once `languages/python/...` is
+    referenced; top-level directories such as `databases/` never are.
+    """
+    directories = path.split("/")[:-1]
+    for depth in range(2, len(directories) + 1):
+        parent = "/".join(directories[: depth - 1]) + "/"
+        branch = "/".join(directories[:depth]) + "/"
+        chosen = [
+            reference
+            for reference in references
+            if reference.startswith(parent) and "/" in reference[len(parent):]
+        ]
+        if chosen and not any(reference.startswith(branch) for reference in chosen):
+            return True
+    return False
@@ -1,48 +1,114 @@
+from collections.abc import Callable, Iterator, Mapping
+from itertools import count
+
+from vibecrafter.application.ports.answer_journal import AnswerJournal
 from vibecrafter.application.ports.file_scanner import FileScanner
+from vibecrafter.application.ports.prefetcher import Prefetcher
 from vibecrafter.application.ports.step_repository import StepRepository
 from vibecrafter.application.ports.user_prompter import UserPrompter
-from vibecrafter.domain.models.option_source import OptionSource
+from vibecrafter.domain.exceptions.wizard_error import InvalidAnswerError
+from vibecrafter.domain.models.pending_step import PendingStep
 from vibecrafter.domain.models.step import Step
 from vibecrafter.domain.models.step_result import StepResult
 from vibecrafter.domain.models.step_type import StepType
 from vibecrafter.domain.models.wizard_session import WizardSession
 
 
+class _StepPending(Exception):
+    def __init__(self, pending: PendingStep) -> None:
+        super().__init__(pending.step.variable)
+        self.pending = pending
+
+
 class RunWizard:
     def __init__(
         self,
         step_repository: StepRepository,
         user_prompter: UserPrompter,
         file_scanner: FileScanner,
+        journal: AnswerJournal | None = None,
+        prefetcher: Prefetcher | None = None,
     ) -> None:
         self._step_repository = step_repository
         self._user_prompter = user_prompter
         self._file_scanner = file_scanner
-        self._step_counter = 0
+        self._journal = journal
+        self._prefetcher = prefetcher
 
-    def execute(self) -> WizardSession:
+    def execute(self, answers: Mapping[str, str] | None = None) -> WizardSession:
+        """Runs the wizard; steps whose variable is in `answers` are not prompted."""
         self._user_prompter.show_welcome()
-        self._step_counter = 0
+        return self._walk(answers or {}, self._prompt)
+
+    def next_step(self, answers: Mapping[str, str]) -> PendingStep | None:
+        """Replays `answers` without prompting; returns the first unanswered step."""
+        try:
+            self._walk(answers, self._stop)
+        except _StepPending as pending:
+            return pending.pending
+        return None
+
+    def _walk(
+        self,
+        answers: Mapping[str, str],
+        ask: Callable[[Step, WizardSession, int], str],
+    ) -> WizardSession:
+        # Numbered per walk: the server runs walks for several requests at once.
+        numbers = count(1)
         session = WizardSession()
         roots = self._step_repository.find_roots()
 
         for step in roots:
-            self._process_step(step, session)
+            self._process_step(step, session, answers, ask, numbers)
 
         return session
 
-    def _process_step(self, step: Step, session: WizardSession) -> None:
+    def _process_step(
+        self,
+        step: Step,
+        session: WizardSession,
+        answers: Mapping[str, str],
+        ask: Callable[[Step, WizardSession, int], str],
+        numbers: Iterator[int],
+    ) -> None:
         if session.get_value(step.variable) is not None:
             return
 
-        self._step_counter += 1
-        self._user_prompter.show_step_header(self._step_counter, step.question)
-        answer = self._ask(step, session)
+        number = next(numbers)
+        if step.variable in answers:
+            answer = self._check_answer(step, session, answers[step.variable])
+        else:
+            answer = ask(step, session, number)
         session.add_result(StepResult(step=step, value=answer))
 
         children = self._step_repository.find_children(step.id, answer)
         for child in children:
-            self._process_step(child, session)
+            self._process_step(child, session, answers, ask, numbers)
+
+    def _prompt(self, step: Step, session: WizardSession, number: int) -> str:
+        self._user_prompter.show_step_header(number, step.question)
+        answer = self._ask(step, session)
+        if self._journal is not None:
+            self._journal.append(step.variable, answer)
+        return answer
+
+    def _stop(self, step: Step, session: WizardSession, number: int) -> str:
+        options: list[str] = []
+        if step.type == StepType.SELECT:
+            options = self._resolve_options(step, session)
+        raise _StepPending(
+            PendingStep(step=step, number=number, options=options)
+        )
+
+    def _check_answer(self, step: Step, session: WizardSession, answer: str) -> str:
+        if step.type != StepType.SELECT:
+            return answer
+        options = self._resolve_options(step, session)
+        if answer not in options:
+            raise InvalidAnswerError(
+                f"'{answer}' is not a valid option for {step.variable}: {options}"
+            )
+        return answer
 
     def _ask(self, step: Step, session: WizardSession) -> str:
         match step.type:
@@ -52,29 +118,22 @@ class RunWizard:
                 return self._user_prompter.ask_multiline(step.question)
             case StepType.SELECT:
                 options = self._resolve_options(step, session)
+                if self._prefetcher is not None:
+                    # Runs while the user reads and picks, not after Enter.
+                    self._prefetcher.prefetch(step, options, session.values())
                 return self._user_prompter.ask_select(step.question, options)
 
     def _resolve_options(self, step: Step, session: WizardSession) -> list[str]:
-        if not step.options:
+        source = step.option_source
+        if source is None:
             return []
 
-        source = OptionSource(step.options)
-
         if not source.is_scan_directive():
-            return source.raw.split("|")
+            return source.static_options()
 
         scanned: list[str] = []
-        scan_path = source.scan_path()
+        scan_path = source.resolve_scan_path(session.get_value)
         if scan_path:
-            scan_path = self._resolve_scan_path(scan_path, session)
             scanned = self._file_scanner.list_md_files(scan_path)
 
-        static = source.static_options()
-        return scanned + static
-
-    def _resolve_scan_path(self, path: str, session: WizardSession) -> str:
-        for result in session.all_results():
-            placeholder = "{" + result.step.variable + "}"
-            if placeholder in path:
-                path = path.replace(placeholder, result.value)
-        return path
+        return scanned + source.static_options()
@@ -0,0 +1,173 @@
+from collections.abc import Mapping
+
+from vibecrafter.application.ports.doc_reader import DocReader
+from vibecrafter.application.ports.file_scanner import FileScanner
+from vibecrafter.application.ports.step_repository import StepRepository
+from vibecrafter.application.use_cases.enumerate_paths import EnumeratePaths
+from vibecrafter.application.use_cases.render_template import (
+    DEFAULT_EMPTY_VALUE,
+    DOCS_REFERENCE_PATTERN,
+)
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.models.catalog_issue import (
+    MISSING_DOC,
+    MISSING_SCAN_PATH,
+    UNREACHABLE_TRIGGER,
+    UNRESOLVED_PLACEHOLDER,
+    CatalogIssue,
+)
+from vibecrafter.domain.models.compiled_template import (
+    VALUE_PLACEHOLDER,
+    compile_template,
+)
+from vibecrafter.domain.models.document_skeleton import SLOT_DELIMITER
+from vibecrafter.domain.models.pending_step import PendingStep
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+
+
+class ValidateCatalog:
+    """Statically checks the step graph against the docs tree.
+
+    `enumerate_paths` walks every reachable combination of SELECT answers and
+    reports scan and trigger problems; `check_path` renders one path's doc
+    references and reports the ones that do not exist. The two halves are
+    separate so the per-path checks can be spread across processes.
+    """
+
+    def __init__(
+        self,
+        run_wizard: RunWizard,
+        step_repository: StepRepository,
+        file_scanner: FileScanner,
+        doc_reader: DocReader,
+    ) -> None:
+        self._run_wizard = run_wizard
+        self._step_repository = step_repository
+        self._file_scanner = file_scanner
+        self._doc_reader = doc_reader
+
+    def execute(self) -> list[CatalogIssue]:
+        paths, issues = self.enumerate_paths()
+        for answers in paths:
+            issues |= self.check_path(answers)
+        return sorted(issues)
+
+    def enumerate_paths(self) -> tuple[list[dict[str, str]], set[CatalogIssue]]:
+        issues: set[CatalogIssue] = set()
+        observed: dict[int, set[str]] = {}
+
+        def on_select(pending: PendingStep, answers: dict[str, str]) -> None:
+            issues.update(self._check_scan(pending.step, answers))
+            observed.setdefault(pending.step.id, set()).update(pending.options)
+
+        paths = list(EnumeratePaths(self._run_wizard).execute(on_select))
+        issues |= self._check_triggers(observed)
+        return paths, issues
+
+    def check_path(self, answers: Mapping[str, str]) -> set[CatalogIssue]:
+        session = self._run_wizard.execute(answers)
+        values = session.values()
+        issues: set[CatalogIssue] = set()
+        for result in session.all_results():
+            issues |= self._check_template(result.step, result.value, values)
+        return issues
+
+    def _check_scan(self, step: Step, answers: Mapping[str, str]) -> set[CatalogIssue]:
+        source = step.option_source
+        if source is None or not source.is_scan_directive():
+            return set()
+        missing = [name for name in source.placeholders if name not in answers]
+        if missing:
+            return {
+                CatalogIssue(
+                    step.id,
+                    UNRESOLVED_PLACEHOLDER,
+                    f"@scan:{source.scan_path()} uses {{{name}}} before it is answered",
+                )
+                for name in missing
+            }
+        scan_path = source.resolve_scan_path(answers.get)
+        if scan_path and not self._file_scanner.list_md_files(scan_path):
+            return {
+                CatalogIssue(
+                    step.id, MISSING_SCAN_PATH, f"@scan:{scan_path} has no options"
+                )
+            }
+        return set()
+
+    def _check_triggers(self, observed: Mapping[int, set[str]]) -> set[CatalogIssue]:
+        issues: set[CatalogIssue] = set()
+        steps = {step.id: step for step in self._step_repository.find_all()}
+        for step in steps.values():
+            if step.parent_id is None or step.trigger_value is None:
+                continue
+            parent = steps.get(step.parent_id)
+            if parent is None or parent.type != StepType.SELECT:
+                reason = "its parent is not a SELECT step"
+            elif step.parent_id not in observed:
+                reason = "its parent step is never reached"
+            elif step.trigger_value not in observed[step.parent_id]:
+                options = sorted(observed[step.parent_id])
+                reason = f"step {parent.id} only offers {options}"
+            else:
+                continue
+            issues.add(
+                CatalogIssue(
+                    step.id,
+                    UNREACHABLE_TRIGGER,
+                    f"trigger_value '{step.trigger_value}' can never match: {reason}",
+                )
+            )
+        return issues
+
+    def _check_template(
+        self, step: Step, value: str, values: Mapping[str, str]
+    ) -> set[CatalogIssue]:
+        if not step.md_template:
+            return set()
+        issues: set[CatalogIssue] = set()
+        template = compile_template(step.md_template)
+        for name in template.placeholders:
+            if name != VALUE_PLACEHOLDER and name not in values:
+                issues.add(
+                    CatalogIssue(
+                        step.id,
+                        UNRESOLVED_PLACEHOLDER,
+                        f"md_template uses {{{name}}}, which is not answered on "
+                        f"every path reaching it",
+                    )
+                )
+        # Static options next to a scan ("Ninguna") are fallbacks without docs.
+        source = step.option_source
+        is_fallback = (
+            source is not None
+            and source.is_scan_directive()
+            and value in source.static_options()
+        )
+        for reference in DOCS_REFERENCE_PATTERN.findall(step.md_template):
+            if is_fallback and "{value}" in reference:
+                continue
+            issues |= self._check_reference(step, reference, value, values)
+        return issues
+
+    def _check_reference(
+        self, step: Step, reference: str, value: str, values: Mapping[str, str]
+    ) -> set[CatalogIssue]:
+        resolved = compile_template(reference).render(
+            value if value.strip() else DEFAULT_EMPTY_VALUE, values
+        )
+        if SLOT_DELIMITER in resolved or "{" in resolved:
+            return set()
+        if resolved.endswith("/"):
+            exists = bool(self._doc_reader.list_md(resolved))
+        else:
+            exists = self._doc_reader.read(resolved) is not None
+        if exists:
+            return set()
+        return {
+            CatalogIssue(
+                step.id, MISSING_DOC, f"references missing .vibecrafter/docs/{resolved}"
+            )
+        }
+
@@ -8,3 +8,11 @@ class InvalidStepError(WizardError):
 
 class DuplicateVariableError(WizardError):
     """Raised when a variable name is added to the session twice."""
+
+
+class MissingAnswerError(WizardError):
+    """Raised when a non-interactive run reaches a step without an answer."""
+
+
+class InvalidAnswerError(WizardError):
+    """Raised when a provided answer is not a valid option for its step."""
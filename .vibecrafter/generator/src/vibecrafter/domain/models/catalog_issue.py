@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+MISSING_SCAN_PATH = "missing_scan_path"
+UNRESOLVED_PLACEHOLDER = "unresolved_placeholder"
+UNREACHABLE_TRIGGER = "unreachable_trigger"
+MISSING_DOC = "missing_doc"
+
+
+@dataclass(frozen=True, order=True)
+class CatalogIssue:
+    step_id: int
+    kind: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"step {self.step_id} [{self.kind}] {self.message}"
@@ -0,0 +1,44 @@
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+VALUE_PLACEHOLDER = "value"
+ESCAPED_NEWLINE = "\\n"
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """md_template split into literals and placeholder names.
+
+    `literals` always has one more item than `placeholders`; rendering
+    interleaves them. `{value}` is the step's own answer, any other
+    `{VARIABLE}` is looked up in the session and left untouched if unknown.
+    """
+
+    literals: tuple[str, ...]
+    placeholders: tuple[str, ...]
+
+    def render(self, value: str, variables: Mapping[str, str]) -> str:
+        parts = [self.literals[0]]
+        for name, literal in zip(self.placeholders, self.literals[1:]):
+            if name == VALUE_PLACEHOLDER:
+                parts.append(value)
+            else:
+                parts.append(variables.get(name, "{" + name + "}"))
+            parts.append(literal)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def compile_template(template: str) -> CompiledTemplate:
+    literals: list[str] = []
+    placeholders: list[str] = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(template):
+        literals.append(template[position:match.start()].replace(ESCAPED_NEWLINE, "\n"))
+        placeholders.append(match.group(1))
+        position = match.end()
+    literals.append(template[position:].replace(ESCAPED_NEWLINE, "\n"))
+    return CompiledTemplate(literals=tuple(literals), placeholders=tuple(placeholders))
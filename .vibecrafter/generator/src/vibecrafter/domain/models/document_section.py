@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DocumentSection:
+    """One rendered section: its Markdown `text` plus the raw answers behind it."""
+
+    id: str
+    header: str
+    text: str
+    answers: tuple[tuple[str, str], ...]
@@ -0,0 +1,43 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+SLOT_DELIMITER = "\x00"
+
+
+def slot_marker(variable: str) -> str:
+    return f"{SLOT_DELIMITER}{variable}{SLOT_DELIMITER}"
+
+
+def is_slot_marker(value: str) -> bool:
+    return value.startswith(SLOT_DELIMITER) and value.endswith(SLOT_DELIMITER)
+
+
+@dataclass(frozen=True)
+class DocumentSkeleton:
+    """A document rendered with slot markers in place of free-text answers.
+
+    Like CompiledTemplate, `literals` has one more item than `slots`.
+    """
+
+    literals: tuple[str, ...]
+    slots: tuple[str, ...]
+
+    @classmethod
+    def parse(cls, text: str) -> "DocumentSkeleton":
+        parts = text.split(SLOT_DELIMITER)
+        return cls(literals=tuple(parts[0::2]), slots=tuple(parts[1::2]))
+
+    def fill(self, values: Mapping[str, str]) -> str | None:
+        """Returns None if a slot has no usable value.
+
+        Blank answers render as fallbacks ("Ninguna", "Sin nombre") that depend
+        on where they appear, so only non-blank values can be filled in.
+        """
+        parts = [self.literals[0]]
+        for name, literal in zip(self.slots, self.literals[1:]):
+            value = values.get(name)
+            if value is None or not value.strip() or SLOT_DELIMITER in value:
+                return None
+            parts.append(value)
+            parts.append(literal)
+        return "".join(parts)
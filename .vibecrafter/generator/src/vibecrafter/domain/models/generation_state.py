@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+
+from vibecrafter.domain.models.rendered_section import RenderedSection
+
+
+@dataclass(frozen=True)
+class GenerationState:
+    """What was last written to a project.md: its answers, sections and digest."""
+
+    answers: dict[str, str]
+    content_digest: str
+    sections: dict[str, RenderedSection] = field(default_factory=dict)
@@ -0,0 +1,113 @@
+import heapq
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+EXACT, PREFIX, WORD_PREFIX, SUBSTRING, FUZZY = range(5)
+WORD_SEPARATORS = str.maketrans({separator: " " for separator in "-_./"})
+
+
+def normalize(text: str) -> str:
+    """Casefolded, accents stripped and `-_./` treated as word breaks."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.translate(WORD_SEPARATORS).split())
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class OptionIndex:
+    """Prefix and trigram index over a select's options, built once per list.
+
+    `search` ranks exact, prefix, word-prefix and substring matches in that
+    order, and falls back to options sharing most of the query's trigrams so
+    small typos still find something. Ties keep the original option order.
+    """
+
+    options: tuple[str, ...]
+    _keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _words: tuple[tuple[str, int], ...] = field(init=False, repr=False, compare=False)
+    _postings: dict[str, frozenset[int]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        keys = tuple(normalize(option) for option in self.options)
+        words = sorted(
+            (word, position)
+            for position, key in enumerate(keys)
+            for word in set(key.split())
+        )
+        postings: dict[str, set[int]] = {}
+        for position, key in enumerate(keys):
+            for gram in trigrams(key):
+                postings.setdefault(gram, set()).add(position)
+        object.__setattr__(self, "_keys", keys)
+        object.__setattr__(self, "_words", tuple(words))
+        object.__setattr__(
+            self,
+            "_postings",
+            {gram: frozenset(found) for gram, found in postings.items()},
+        )
+
+    def search(self, query: str, limit: int | None = None) -> list[str]:
+        needle = normalize(query)
+        if not needle:
+            return list(self.options[:limit])
+        found = ((rank, position) for position, rank in self._matches(needle).items())
+        ranked = sorted(found) if limit is None else heapq.nsmallest(limit, found)
+        return [self.options[position] for _, position in ranked]
+
+    def _matches(self, needle: str) -> dict[int, int]:
+        matches: dict[int, int] = {}
+        first_word = needle.split()[0]
+        start = bisect_left(self._words, (first_word, -1))
+        for word, position in self._words[start:]:
+            if not word.startswith(first_word):
+                break
+            key = self._keys[position]
+            if needle in key:
+                matches[position] = self._rank(key, needle)
+
+        if len(needle) >= 3:
+            # Unpadded trigrams of a substring are always trigrams of its key.
+            inner = {needle[i:i + 3] for i in range(len(needle) - 2)}
+            candidates = frozenset.intersection(
+                *(self._postings.get(gram, frozenset()) for gram in inner)
+            )
+            for position in candidates:
+                if position not in matches and needle in self._keys[position]:
+                    matches[position] = SUBSTRING
+        if matches:
+            return matches
+
+        grams = trigrams(needle)
+        counts: dict[int, int] = {}
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                counts[position] = counts.get(position, 0) + 1
+        threshold = max(2, len(grams) // 2)
+        return {
+            position: FUZZY for position, count in counts.items() if count >= threshold
+        }
+
+    @staticmethod
+    def _rank(key: str, needle: str) -> int:
+        if key == needle:
+            return EXACT
+        if key.startswith(needle):
+            return PREFIX
+        if f" {needle}" in key:
+            return WORD_PREFIX
+        return SUBSTRING
+
+
+@lru_cache(maxsize=64)
+def build_option_index(options: tuple[str, ...]) -> OptionIndex:
+    """Shared index per option list, so prompts over the same scan reuse it."""
+    return OptionIndex(options)
@@ -1,21 +1,58 @@
-from dataclasses import dataclass
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 SCAN_PREFIX = "@scan:"
+SCAN_PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionSource:
+    """Parsed `options` column: static options, one optional scan path and the
+    `{VARIABLE}` placeholders that path depends on. `raw` is split only once."""
+
     raw: str
+    _static: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _scan_path: str | None = field(init=False, repr=False, compare=False)
+    placeholders: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        static: list[str] = []
+        scan_path: str | None = None
+        for part in self.raw.split("|"):
+            if not part.startswith(SCAN_PREFIX):
+                static.append(part)
+            elif scan_path is None:
+                scan_path = part[len(SCAN_PREFIX):]
+        placeholders = SCAN_PLACEHOLDER_PATTERN.findall(scan_path) if scan_path else []
+        object.__setattr__(self, "_static", tuple(static))
+        object.__setattr__(self, "_scan_path", scan_path)
+        object.__setattr__(self, "placeholders", tuple(dict.fromkeys(placeholders)))
 
     def is_scan_directive(self) -> bool:
-        return any(part.startswith(SCAN_PREFIX) for part in self.raw.split("|"))
+        return self._scan_path is not None
 
     def static_options(self) -> list[str]:
-        return [part for part in self.raw.split("|") if not part.startswith(SCAN_PREFIX)]
+        return list(self._static)
 
     def scan_path(self) -> str | None:
-        for part in self.raw.split("|"):
-            if part.startswith(SCAN_PREFIX):
-                return part[len(SCAN_PREFIX):]
-        return None
+        return self._scan_path
+
+    def resolve_scan_path(self, lookup: Callable[[str], str | None]) -> str | None:
+        """Substitutes placeholders via `lookup`; unknown ones are left as-is."""
+        path = self._scan_path
+        if not path:
+            return path
+        for variable in self.placeholders:
+            value = lookup(variable)
+            if value is not None:
+                path = path.replace("{" + variable + "}", value)
+        return path
+
+
+@lru_cache(maxsize=4096)
+def parse_option_source(raw: str) -> OptionSource:
+    """Shared OptionSource per distinct `raw`; steps with equal options reuse it."""
+    return OptionSource(raw)
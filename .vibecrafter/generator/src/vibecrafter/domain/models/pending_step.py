@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from vibecrafter.domain.models.step import Step
+
+
+@dataclass(frozen=True)
+class PendingStep:
+    step: Step
+    number: int
+    options: list[str]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from vibecrafter.domain.models.document_section import DocumentSection
+
+
+@dataclass(frozen=True)
+class ProjectDocument:
+    """Format-independent result of a session, built once and shared by emitters.
+
+    `references` lists the `.vibecrafter/docs/` paths that the instructions and
+    sections mention, in order of first appearance.
+    """
+
+    project_name: str
+    sections: tuple[DocumentSection, ...]
+    instructions: str
+    references: tuple[str, ...]
@@ -0,0 +1,8 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class RenderOutcome:
+    written: bool
+    content_digest: str
+    rendered_sections: list[str] = field(default_factory=list)
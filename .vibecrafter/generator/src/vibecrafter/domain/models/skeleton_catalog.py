@@ -0,0 +1,50 @@
+from collections.abc import Mapping
+
+from vibecrafter.domain.models.document_skeleton import (
+    DocumentSkeleton,
+    is_slot_marker,
+)
+
+
+class SkeletonCatalog:
+    """Prebuilt skeletons keyed by the SELECT answers of the path that made them.
+
+    Two paths always differ in the value of some SELECT they both contain, so
+    at most one stored key matches a given set of answers. `tail` is the part
+    every document shares (the instructions) and is stored once.
+    """
+
+    def __init__(self, tail: str = "") -> None:
+        self.tail = tail
+        self._skeletons: dict[frozenset[tuple[str, str]], DocumentSkeleton] = {}
+        self._variable_sets: set[frozenset[str]] = set()
+
+    def add(self, answers: Mapping[str, str], skeleton: DocumentSkeleton) -> None:
+        choices = {
+            variable: value
+            for variable, value in answers.items()
+            if not is_slot_marker(value)
+        }
+        self._variable_sets.add(frozenset(choices))
+        self._skeletons[frozenset(choices.items())] = skeleton
+
+    def find(self, answers: Mapping[str, str]) -> DocumentSkeleton | None:
+        for variables in self._variable_sets:
+            if not variables <= answers.keys():
+                continue
+            key = frozenset((variable, answers[variable]) for variable in variables)
+            skeleton = self._skeletons.get(key)
+            if skeleton is not None:
+                return skeleton
+        return None
+
+    def render(self, answers: Mapping[str, str]) -> str | None:
+        """Fills the matching skeleton, or returns None to fall back to a render."""
+        skeleton = self.find(answers)
+        if skeleton is None:
+            return None
+        body = skeleton.fill(answers)
+        return None if body is None else body + self.tail
+
+    def __len__(self) -> int:
+        return len(self._skeletons)
@@ -0,0 +1,40 @@
+from collections.abc import Iterable
+
+
+class StaticSegment(str):
+    """Text that is identical in every render, kept with its UTF-8 bytes.
+
+    It is still a `str`, so renderers and caches treat it like any other chunk.
+    Writers that recognise it emit `encoded` as is, or copy straight from
+    `source_path` when `source_stamp` (size, mtime_ns) still matches that file.
+    """
+
+    encoded: bytes
+    source_path: str | None
+    source_stamp: tuple[int, int] | None
+
+    def __new__(
+        cls,
+        text: str,
+        source_path: str | None = None,
+        source_stamp: tuple[int, int] | None = None,
+    ) -> "StaticSegment":
+        segment = super().__new__(cls, text)
+        segment.encoded = text.encode("utf-8")
+        segment.source_path = source_path if source_stamp is not None else None
+        segment.source_stamp = source_stamp
+        return segment
+
+    def __reduce__(self):
+        return StaticSegment, (str(self), self.source_path, self.source_stamp)
+
+
+def encode_chunk(chunk: str) -> bytes:
+    """UTF-8 bytes of a rendered chunk, reusing them for static segments."""
+    if isinstance(chunk, StaticSegment):
+        return chunk.encoded
+    return chunk.encode("utf-8")
+
+
+def encode_chunks(chunks: Iterable[str]) -> bytes:
+    return b"".join(encode_chunk(chunk) for chunk in chunks)
@@ -1,11 +1,26 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
 from vibecrafter.domain.exceptions.wizard_error import InvalidStepError
+from vibecrafter.domain.models.option_source import OptionSource, parse_option_source
 from vibecrafter.domain.models.step_type import StepType
 
+INTERNED_FIELDS = (
+    "trigger_value",
+    "question",
+    "options",
+    "variable",
+    "md_section",
+    "md_template",
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Step:
+    """One catalog row. Slotted, with repeated strings interned and options
+    parsed once, so large cached catalogs share their text instead of copying it.
+    """
+
     id: int
     parent_id: int | None
     trigger_value: str | None
@@ -17,6 +32,9 @@ class Step:
     md_section: str | None
     md_template: str | None
     md_order: int
+    option_source: OptionSource | None = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not self.question.strip():
@@ -29,3 +47,10 @@ class Step:
             raise InvalidStepError("SELECT step must have options")
         if self.md_section and self.md_order < 0:
             raise InvalidStepError("md_order must be >= 0 when md_section is set")
+        for name in INTERNED_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, sys.intern(value))
+        # Parsed once here, so catalogs loaded (or unpickled) once never re-split it.
+        source = parse_option_source(self.options) if self.options else None
+        object.__setattr__(self, "option_source", source)
@@ -6,15 +6,23 @@ from vibecrafter.domain.models.step_result import StepResult
 @dataclass
 class WizardSession:
     _results: list[StepResult] = field(default_factory=list)
+    _values: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        for result in self._results:
+            self._values.setdefault(result.step.variable, result.value)
 
     def add_result(self, result: StepResult) -> None:
         self._results.append(result)
+        self._values.setdefault(result.step.variable, result.value)
 
     def get_value(self, variable: str) -> str | None:
-        for result in self._results:
-            if result.step.variable == variable:
-                return result.value
-        return None
+        """First value recorded for `variable`; O(1) through an index."""
+        return self._values.get(variable)
+
+    def values(self) -> dict[str, str]:
+        """Copy of the first value recorded for each variable."""
+        return dict(self._values)
 
     def results_by_section(self) -> dict[str, list[StepResult]]:
         grouped: dict[str, list[StepResult]] = {}
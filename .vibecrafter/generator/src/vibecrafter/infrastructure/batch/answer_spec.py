@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AnswerSpec:
+    name: str
+    answers: dict[str, str]
+    output_path: str
+    # Set when the source could not be parsed; the batch reports it as a failure.
+    error: str | None = None
@@ -0,0 +1,124 @@
+import json
+import sys
+import tomllib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.infrastructure.batch.answer_spec import AnswerSpec
+
+SPEC_SUFFIXES = (".json", ".toml")
+STDIN_PATH = "-"
+PARSE_ERRORS = (
+    OSError,
+    UnicodeDecodeError,
+    json.JSONDecodeError,
+    tomllib.TOMLDecodeError,
+    WizardError,
+)
+
+
+def normalize_answers(raw_answers: dict[str, Any]) -> dict[str, str]:
+    """Coerces answer values to strings; lists become multiline answers."""
+    return {
+        variable: "\n".join(f"  - {_scalar(variable, item)}" for item in value)
+        if isinstance(value, list)
+        else _scalar(variable, value)
+        for variable, value in raw_answers.items()
+    }
+
+
+def _scalar(variable: str, value: Any) -> str:
+    # Booleans keep their JSON/TOML spelling instead of Python's True/False.
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    raise WizardError(
+        f"Answer '{variable}' must be a string, number, boolean or list, "
+        f"not {type(value).__name__}"
+    )
+
+
+class AnswerSpecLoader:
+    """Loads answer specs from JSON/TOML files, directories of them or JSONL streams.
+
+    A spec is either a flat mapping of VARIABLE -> value, or a mapping with an
+    `answers` table plus optional `name` and `output` keys. List values are
+    rendered like multiline answers.
+
+    A file or JSONL line that cannot be parsed yields a spec carrying `error`
+    instead of raising, so one bad source does not abort the whole batch.
+    """
+
+    def __init__(self, output_dir: str) -> None:
+        self._output_dir = Path(output_dir)
+
+    def load(self, sources: list[str]) -> Iterator[AnswerSpec]:
+        for source in sources:
+            if source == STDIN_PATH:
+                yield from self._load_jsonl(sys.stdin, "stdin")
+                continue
+            path = Path(source)
+            if path.is_dir():
+                for child in sorted(path.iterdir()):
+                    if child.suffix in SPEC_SUFFIXES or child.suffix == ".jsonl":
+                        yield from self._load_file(child)
+            else:
+                yield from self._load_file(path)
+
+    def _load_file(self, path: Path) -> Iterator[AnswerSpec]:
+        if path.suffix == ".jsonl":
+            try:
+                with path.open(encoding="utf-8") as stream:
+                    yield from self._load_jsonl(stream, path.stem)
+            except (OSError, UnicodeDecodeError) as error:
+                yield self._failed(path.stem, error)
+            return
+        try:
+            match path.suffix:
+                case ".json":
+                    data = json.loads(path.read_text(encoding="utf-8"))
+                case ".toml":
+                    data = tomllib.loads(path.read_text(encoding="utf-8"))
+                case _:
+                    raise WizardError(f"Unsupported answer file: {path}")
+            spec = self._to_spec(data, path.stem)
+        except PARSE_ERRORS as error:
+            spec = self._failed(path.stem, error)
+        yield spec
+
+    def _load_jsonl(self, stream, default_prefix: str) -> Iterator[AnswerSpec]:
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            name = f"{default_prefix}-{line_number}"
+            try:
+                spec = self._to_spec(json.loads(line), name)
+            except PARSE_ERRORS as error:
+                spec = self._failed(name, error)
+            yield spec
+
+    @staticmethod
+    def _failed(name: str, error: Exception) -> AnswerSpec:
+        return AnswerSpec(
+            name=name,
+            answers={},
+            output_path="",
+            error=f"{type(error).__name__}: {error}",
+        )
+
+    def _to_spec(self, data: dict[str, Any], default_name: str) -> AnswerSpec:
+        if not isinstance(data, dict):
+            raise WizardError(f"Answer spec '{default_name}' must be an object")
+        raw_answers = data.get("answers")
+        if isinstance(raw_answers, dict):
+            name = str(data.get("name") or default_name)
+            output = data.get("output")
+        else:
+            raw_answers, name, output = data, default_name, None
+
+        answers = normalize_answers(raw_answers)
+        output_path = output or str(self._output_dir / name / "project.md")
+        return AnswerSpec(name=name, answers=answers, output_path=str(output_path))
@@ -0,0 +1,148 @@
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from vibecrafter.application.use_cases.regenerate_project import RegenerateProject
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.infrastructure.batch.answer_spec import AnswerSpec
+from vibecrafter.infrastructure.batch.batch_report import BatchReport
+from vibecrafter.infrastructure.config.catalog_loader import (
+    catalog_snapshot,
+    load_doc_search,
+    load_docs_index,
+    load_instructions,
+    load_render_cache,
+    load_step_catalog,
+)
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.emitters.output_targets import create_emitters
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.cached_doc_reader import CachedDocReader
+from vibecrafter.infrastructure.repositories.indexed_file_scanner import (
+    IndexedFileScanner,
+)
+from vibecrafter.infrastructure.repositories.json_generation_state_store import (
+    JsonGenerationStateStore,
+)
+from vibecrafter.infrastructure.writers.file_template_writer import FileTemplateWriter
+
+_worker: "_SpecWorker | None" = None
+
+
+class _SpecWorker:
+    """Per-process wizard pipeline, built once and reused for every spec."""
+
+    def __init__(
+        self,
+        paths: GeneratorPaths,
+        fsync: bool,
+        bundle: bool,
+        render_cache: bool,
+        targets: tuple[str, ...],
+        suggest_docs: bool,
+    ) -> None:
+        docs_index = load_docs_index(paths)
+        self._run_wizard = RunWizard(
+            step_repository=load_step_catalog(paths),
+            user_prompter=HeadlessPrompter(),
+            file_scanner=IndexedFileScanner(docs_index),
+        )
+        writer = FileTemplateWriter(fsync=fsync)
+        render_template = RenderTemplate(
+            template_writer=writer,
+            instructions_content=load_instructions(paths),
+            doc_reader=(
+                CachedDocReader(str(paths.docs_dir), docs_index) if bundle else None
+            ),
+            render_cache=load_render_cache(paths) if render_cache else None,
+            catalog_version=catalog_snapshot(paths).key,
+            doc_search=load_doc_search(paths) if suggest_docs else None,
+        )
+        # Re-running a batch leaves outputs whose content did not change untouched.
+        self._regenerate_project = RegenerateProject(
+            run_wizard=self._run_wizard,
+            render_template=render_template,
+            template_writer=writer,
+            state_store=JsonGenerationStateStore(),
+            emitters=create_emitters(targets),
+        )
+
+    def generate(self, spec: AnswerSpec) -> tuple[str, str | None]:
+        if spec.error is not None:
+            return spec.name, spec.error
+        try:
+            session = self._run_wizard.execute(spec.answers)
+            Path(spec.output_path).parent.mkdir(parents=True, exist_ok=True)
+            self._regenerate_project.write(session, spec.output_path)
+        except Exception as error:
+            return spec.name, f"{type(error).__name__}: {error}"
+        return spec.name, None
+
+
+def _init_worker(
+    paths: GeneratorPaths,
+    fsync: bool,
+    bundle: bool,
+    render_cache: bool,
+    targets: tuple[str, ...],
+    suggest_docs: bool,
+) -> None:
+    global _worker
+    _worker = _SpecWorker(paths, fsync, bundle, render_cache, targets, suggest_docs)
+
+
+def _generate(spec: AnswerSpec) -> tuple[str, str | None]:
+    assert _worker is not None
+    return _worker.generate(spec)
+
+
+class BatchGenerator:
+    def __init__(
+        self,
+        paths: GeneratorPaths,
+        workers: int | None = None,
+        chunksize: int = 8,
+        fsync: bool = False,
+        bundle: bool = False,
+        render_cache: bool = False,
+        targets: tuple[str, ...] = (),
+        suggest_docs: bool = False,
+    ) -> None:
+        self._paths = paths
+        self._workers = workers
+        self._chunksize = chunksize
+        self._fsync = fsync
+        self._bundle = bundle
+        self._render_cache = render_cache
+        self._targets = targets
+        self._suggest_docs = suggest_docs
+
+    def execute(self, specs: Iterable[AnswerSpec]) -> BatchReport:
+        report = BatchReport()
+        started = time.perf_counter()
+        # Warm the snapshot and docs indexes so workers never race to rebuild them.
+        load_step_catalog(self._paths)
+        load_docs_index(self._paths)
+        if self._suggest_docs:
+            load_doc_search(self._paths)
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(
+                self._paths,
+                self._fsync,
+                self._bundle,
+                self._render_cache,
+                self._targets,
+                self._suggest_docs,
+            ),
+        ) as executor:
+            for name, error in executor.map(_generate, specs, chunksize=self._chunksize):
+                if error is None:
+                    report.succeeded += 1
+                else:
+                    report.failures.append((name, error))
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
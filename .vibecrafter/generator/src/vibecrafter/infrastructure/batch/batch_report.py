@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BatchReport:
+    succeeded: int = 0
+    failures: list[tuple[str, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return self.succeeded + len(self.failures)
+
+    @property
+    def specs_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total / self.elapsed_seconds
+
+    def summary(self) -> str:
+        return (
+            f"{self.total} specs in {self.elapsed_seconds:.2f}s "
+            f"({self.specs_per_second:.1f} specs/sec), "
+            f"{self.succeeded} ok, {len(self.failures)} failed"
+        )
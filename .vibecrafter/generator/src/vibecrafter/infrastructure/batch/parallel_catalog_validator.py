@@ -0,0 +1,71 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.application.use_cases.validate_catalog import ValidateCatalog
+from vibecrafter.domain.models.catalog_issue import CatalogIssue
+from vibecrafter.infrastructure.config.catalog_loader import load_step_catalog
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.cached_doc_reader import CachedDocReader
+from vibecrafter.infrastructure.repositories.file_scanner_impl import FileScannerImpl
+from vibecrafter.infrastructure.repositories.memoized_file_scanner import (
+    MemoizedFileScanner,
+)
+
+_validator: ValidateCatalog | None = None
+
+
+def _create_validator(paths: GeneratorPaths) -> ValidateCatalog:
+    # Validation reads steps.db and the live docs tree; no snapshot or manifest.
+    step_repository = load_step_catalog(paths, use_snapshot=False)
+    file_scanner = MemoizedFileScanner(FileScannerImpl(str(paths.docs_dir)))
+    return ValidateCatalog(
+        run_wizard=RunWizard(
+            step_repository=step_repository,
+            user_prompter=HeadlessPrompter(),
+            file_scanner=file_scanner,
+        ),
+        step_repository=step_repository,
+        file_scanner=file_scanner,
+        doc_reader=CachedDocReader(str(paths.docs_dir)),
+    )
+
+
+def _init_worker(paths: GeneratorPaths) -> None:
+    global _validator
+    _validator = _create_validator(paths)
+
+
+def _check_path(answers: dict[str, str]) -> set[CatalogIssue]:
+    assert _validator is not None
+    return _validator.check_path(answers)
+
+
+class ParallelCatalogValidator:
+    """Enumerates paths in this process and checks them on a process pool."""
+
+    def __init__(
+        self, paths: GeneratorPaths, workers: int | None = None, chunksize: int = 64
+    ) -> None:
+        self._paths = paths
+        self._workers = workers
+        self._chunksize = chunksize
+        self.paths_checked = 0
+        self.elapsed_seconds = 0.0
+
+    def execute(self) -> list[CatalogIssue]:
+        started = time.perf_counter()
+        all_paths, issues = _create_validator(self._paths).enumerate_paths()
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._paths,),
+        ) as executor:
+            for path_issues in executor.map(
+                _check_path, all_paths, chunksize=self._chunksize
+            ):
+                issues |= path_issues
+        self.paths_checked = len(all_paths)
+        self.elapsed_seconds = time.perf_counter() - started
+        return sorted(issues)
@@ -0,0 +1,79 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from vibecrafter.application.use_cases.enumerate_paths import EnumeratePaths
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.models.document_skeleton import DocumentSkeleton
+from vibecrafter.domain.models.skeleton_catalog import SkeletonCatalog
+from vibecrafter.infrastructure.config.catalog_loader import (
+    load_docs_index,
+    load_step_catalog,
+)
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.indexed_file_scanner import (
+    IndexedFileScanner,
+)
+from vibecrafter.infrastructure.writers.file_template_writer import FileTemplateWriter
+
+_worker: "_SkeletonWorker | None" = None
+
+
+def _create_run_wizard(paths: GeneratorPaths) -> RunWizard:
+    return RunWizard(
+        step_repository=load_step_catalog(paths),
+        user_prompter=HeadlessPrompter(),
+        file_scanner=IndexedFileScanner(load_docs_index(paths)),
+    )
+
+
+class _SkeletonWorker:
+    def __init__(self, paths: GeneratorPaths) -> None:
+        self._instructions = paths.instructions_path.read_text(encoding="utf-8")
+        self._run_wizard = _create_run_wizard(paths)
+        self._render_template = RenderTemplate(
+            template_writer=FileTemplateWriter(),
+            instructions_content=self._instructions,
+        )
+
+    def render(self, answers: dict[str, str]) -> DocumentSkeleton:
+        session = self._run_wizard.execute(answers)
+        text = "".join(self._render_template.render(session))
+        # The instructions are identical for every path; the catalog keeps one copy.
+        return DocumentSkeleton.parse(text.removesuffix(self._instructions))
+
+
+def _init_worker(paths: GeneratorPaths) -> None:
+    global _worker
+    _worker = _SkeletonWorker(paths)
+
+
+def _render(answers: dict[str, str]) -> DocumentSkeleton:
+    assert _worker is not None
+    return _worker.render(answers)
+
+
+class SkeletonPrerenderer:
+    """Renders the skeleton of every reachable wizard path on a process pool."""
+
+    def __init__(
+        self, paths: GeneratorPaths, workers: int | None = None, chunksize: int = 32
+    ) -> None:
+        self._paths = paths
+        self._workers = workers
+        self._chunksize = chunksize
+
+    def execute(self) -> SkeletonCatalog:
+        all_paths = list(EnumeratePaths(_create_run_wizard(self._paths)).execute())
+        catalog = SkeletonCatalog(
+            tail=self._paths.instructions_path.read_text(encoding="utf-8")
+        )
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._paths,),
+        ) as executor:
+            skeletons = executor.map(_render, all_paths, chunksize=self._chunksize)
+            for answers, skeleton in zip(all_paths, skeletons):
+                catalog.add(answers, skeleton)
+        return catalog
@@ -0,0 +1,79 @@
+import os
+import threading
+from pathlib import Path
+
+from vibecrafter.application.ports.render_cache import RenderCache
+
+ENTRY_SUFFIX = ".md"
+
+
+class DiskRenderCache(RenderCache):
+    """One file per key under `cache_dir`, bounded by total size.
+
+    A hit bumps the entry's mtime, so eviction drops the least recently used
+    files first. Entries are written atomically, so several processes can
+    share the directory; each one only accounts for the sizes it has seen.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._entries())
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        data = content.encode("utf-8")
+        if len(data) > self._max_bytes:
+            return
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            replaced = self._size_of(path)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._size += len(data) - replaced
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if self._size <= self._max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            self._size -= size
+
+    @staticmethod
+    def _size_of(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _entries(self) -> list[Path]:
+        return list(self._cache_dir.glob(f"*{ENTRY_SUFFIX}"))
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}{ENTRY_SUFFIX}"
@@ -0,0 +1,44 @@
+import threading
+from collections import OrderedDict
+
+from vibecrafter.application.ports.render_cache import RenderCache
+
+
+class LruRenderCache(RenderCache):
+    """In-memory LRU bounded by the total size of the cached documents."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        # Each entry keeps its UTF-8 size, so eviction never re-encodes it.
+        self._entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, content: str) -> None:
+        size = len(content.encode("utf-8"))
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (content, size)
+            self._size += size
+            while self._size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
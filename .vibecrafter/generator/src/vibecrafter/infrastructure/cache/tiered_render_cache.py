@@ -0,0 +1,22 @@
+from vibecrafter.application.ports.render_cache import RenderCache
+
+
+class TieredRenderCache(RenderCache):
+    """Checks `memory` first, then `disk`; disk hits are promoted to memory."""
+
+    def __init__(self, memory: RenderCache, disk: RenderCache) -> None:
+        self._memory = memory
+        self._disk = disk
+
+    def get(self, key: str) -> str | None:
+        content = self._memory.get(key)
+        if content is not None:
+            return content
+        content = self._disk.get(key)
+        if content is not None:
+            self._memory.put(key, content)
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        self._memory.put(key, content)
+        self._disk.put(key, content)
@@ -0,0 +1,76 @@
+import os
+
+from vibecrafter.domain.models.static_segment import StaticSegment
+from vibecrafter.domain.models.step import Step
+from vibecrafter.infrastructure.cache.disk_render_cache import DiskRenderCache
+from vibecrafter.infrastructure.cache.lru_render_cache import LruRenderCache
+from vibecrafter.infrastructure.cache.tiered_render_cache import TieredRenderCache
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.repositories.bm25_doc_index import Bm25DocIndex
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+from vibecrafter.infrastructure.repositories.docs_index import DocsIndex
+from vibecrafter.infrastructure.repositories.sqlite_step_repository import (
+    SqliteStepRepository,
+)
+from vibecrafter.infrastructure.repositories.step_catalog_snapshot import (
+    StepCatalogSnapshot,
+)
+
+RENDER_CACHE_MEMORY_BYTES = 64 * 1024 * 1024
+RENDER_CACHE_DISK_BYTES = 256 * 1024 * 1024
+
+
+def catalog_snapshot(paths: GeneratorPaths) -> StepCatalogSnapshot:
+    return StepCatalogSnapshot(
+        str(paths.snapshot_path), [str(paths.seed_path), str(paths.db_path)]
+    )
+
+
+def load_step_catalog(
+    paths: GeneratorPaths, use_snapshot: bool = True
+) -> CachedStepRepository:
+    if not use_snapshot:
+        return CachedStepRepository(_read_all_steps(paths))
+    steps = catalog_snapshot(paths).load_or_build(lambda: _read_all_steps(paths))
+    return CachedStepRepository(steps)
+
+
+def _read_all_steps(paths: GeneratorPaths) -> list[Step]:
+    repository = SqliteStepRepository(str(paths.db_path), read_only=True)
+    try:
+        return repository.find_all()
+    finally:
+        repository.close()
+
+
+def load_docs_index(paths: GeneratorPaths) -> DocsIndex:
+    return DocsIndex.load(str(paths.docs_dir), str(paths.docs_index_path))
+
+
+def load_doc_search(paths: GeneratorPaths) -> Bm25DocIndex:
+    return Bm25DocIndex.load(str(paths.docs_dir), str(paths.doc_search_path))
+
+
+def load_render_cache(paths: GeneratorPaths) -> TieredRenderCache:
+    return TieredRenderCache(
+        memory=LruRenderCache(RENDER_CACHE_MEMORY_BYTES),
+        disk=DiskRenderCache(str(paths.render_cache_dir), RENDER_CACHE_DISK_BYTES),
+    )
+
+
+def load_instructions(paths: GeneratorPaths) -> StaticSegment:
+    """Reads instructions.md once, keeping its bytes for writers to splice.
+
+    Files with CR line endings are normalised like `read_text` does, so their
+    segment can no longer be copied from disk byte for byte.
+    """
+    path = paths.instructions_path
+    with open(path, "rb") as source:
+        stat = os.fstat(source.fileno())
+        data = source.read()
+    text = data.decode("utf-8")
+    if "\r" in text:
+        return StaticSegment(text.replace("\r\n", "\n").replace("\r", "\n"))
+    return StaticSegment(text, str(path), (stat.st_size, stat.st_mtime_ns))
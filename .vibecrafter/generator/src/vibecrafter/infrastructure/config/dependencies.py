@@ -1,46 +1,217 @@
-from pathlib import Path
+import os
+import sys
+from contextlib import nullcontext
 
+from vibecrafter.application.ports.file_scanner import FileScanner
+from vibecrafter.application.ports.user_prompter import UserPrompter
+from vibecrafter.application.use_cases.regenerate_project import RegenerateProject
 from vibecrafter.application.use_cases.render_template import RenderTemplate
 from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.infrastructure.batch.batch_generator import BatchGenerator
+from vibecrafter.infrastructure.batch.skeleton_prerenderer import SkeletonPrerenderer
+from vibecrafter.infrastructure.config.catalog_loader import (
+    catalog_snapshot,
+    load_doc_search,
+    load_docs_index,
+    load_instructions,
+    load_render_cache,
+    load_step_catalog,
+)
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
 from vibecrafter.infrastructure.config.wizard_runner import WizardRunner
-from vibecrafter.infrastructure.prompters.console_prompter import ConsolePrompter
+from vibecrafter.infrastructure.emitters.output_targets import create_emitters
+from vibecrafter.infrastructure.http.wizard_server import WizardServer
+from vibecrafter.infrastructure.prefetch.thread_prefetcher import ThreadPrefetcher
+from vibecrafter.infrastructure.prompters.ansi_prompter import AnsiPrompter
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.prompters.plain_prompter import PlainPrompter
+from vibecrafter.infrastructure.repositories.cached_doc_reader import CachedDocReader
+from vibecrafter.infrastructure.repositories.file_answer_journal import (
+    FileAnswerJournal,
+)
 from vibecrafter.infrastructure.repositories.file_scanner_impl import FileScannerImpl
-from vibecrafter.infrastructure.repositories.sqlite_step_repository import (
-    SqliteStepRepository,
+from vibecrafter.infrastructure.repositories.indexed_file_scanner import (
+    IndexedFileScanner,
+)
+from vibecrafter.infrastructure.repositories.json_generation_state_store import (
+    JsonGenerationStateStore,
 )
+from vibecrafter.infrastructure.repositories.memoized_file_scanner import (
+    MemoizedFileScanner,
+)
+from vibecrafter.infrastructure.tracing.span import PHASE
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
+from vibecrafter.infrastructure.tracing.traced_port import TracedPort
 from vibecrafter.infrastructure.writers.file_template_writer import FileTemplateWriter
 
+PROMPTER_WAIT_METHODS = frozenset(
+    {"show_welcome", "ask_text", "ask_multiline", "ask_select"}
+)
+PROMPTER_UIS = ("rich", "ansi", "plain")
+
 
-def create_wizard_runner() -> WizardRunner:
-    generator_dir = Path(__file__).resolve().parent.parent.parent.parent.parent
-    vibecrafter_dir = generator_dir.parent
-    project_dir = vibecrafter_dir.parent
+def create_prompter(ui: str = "rich") -> UserPrompter:
+    """rich redraws full panels; ansi repaints only changed rows; plain never
+    redraws and writes no escape codes (dumb terminals, logs)."""
+    if ui == "plain" or not _supports_escapes():
+        return PlainPrompter()
+    if ui == "ansi":
+        return AnsiPrompter()
+    # Imported here so headless entry points never load rich.
+    from vibecrafter.infrastructure.prompters.console_prompter import ConsolePrompter
 
-    docs_dir = vibecrafter_dir / "docs"
-    db_path = generator_dir / "steps.db"
-    instructions_path = generator_dir / "instructions.md"
-    output_path = project_dir / "project.md"
+    return ConsolePrompter()
 
-    instructions_content = instructions_path.read_text(encoding="utf-8")
 
-    step_repo = SqliteStepRepository(str(db_path))
-    prompter = ConsolePrompter()
-    file_scanner = FileScannerImpl(str(docs_dir))
+def _supports_escapes() -> bool:
+    """Dumb terminals and redirected output would get raw escape codes."""
+    return os.environ.get("TERM") != "dumb" and sys.stdout.isatty()
+
+
+def create_wizard_runner(
+    recorder: SpanRecorder | None = None,
+    bundle: bool = False,
+    prefetch: bool = False,
+    targets: tuple[str, ...] = (),
+    ui: str = "rich",
+    suggest_docs: bool = False,
+) -> WizardRunner:
+    paths = GeneratorPaths.default()
+
+    with recorder.span("phase.catalog_load", PHASE) if recorder else nullcontext():
+        instructions_content = load_instructions(paths)
+        step_repo = load_step_catalog(paths)
+        docs_index = load_docs_index(paths) if bundle or not prefetch else None
+        file_scanner: FileScanner
+        prefetcher: ThreadPrefetcher | None = None
+        if prefetch:
+            # Scan the live docs tree lazily; the scans hide behind open prompts.
+            file_scanner = MemoizedFileScanner(FileScannerImpl(str(paths.docs_dir)))
+            prefetcher = ThreadPrefetcher(step_repo, file_scanner)
+        else:
+            file_scanner = IndexedFileScanner(docs_index)
+    doc_reader = CachedDocReader(str(paths.docs_dir), docs_index) if bundle else None
+    prompter = create_prompter(ui)
     writer = FileTemplateWriter()
+    journal = FileAnswerJournal(str(paths.journal_path))
+
+    if recorder:
+        step_repo = TracedPort(step_repo, "step_repository", recorder)
+        file_scanner = TracedPort(file_scanner, "file_scanner", recorder)
+        prompter = TracedPort(prompter, "prompter", recorder, PROMPTER_WAIT_METHODS)
+        writer = TracedPort(writer, "template_writer", recorder)
 
     run_wizard = RunWizard(
         step_repository=step_repo,
         user_prompter=prompter,
         file_scanner=file_scanner,
+        journal=journal,
+        prefetcher=prefetcher,
     )
     render_template = RenderTemplate(
         template_writer=writer,
         instructions_content=instructions_content,
+        doc_reader=doc_reader,
+        doc_search=load_doc_search(paths) if suggest_docs else None,
+    )
+    regenerate_project = RegenerateProject(
+        run_wizard=run_wizard,
+        render_template=render_template,
+        template_writer=writer,
+        state_store=JsonGenerationStateStore(),
+        emitters=create_emitters(targets),
     )
 
     return WizardRunner(
         run_wizard=run_wizard,
-        render_template=render_template,
+        regenerate_project=regenerate_project,
         prompter=prompter,
-        output_path=str(output_path),
+        output_path=str(paths.output_path),
+        recorder=recorder,
+        journal=journal,
+        prefetcher=prefetcher,
+    )
+
+
+def create_batch_generator(
+    workers: int | None = None,
+    fsync: bool = False,
+    bundle: bool = False,
+    render_cache: bool = False,
+    targets: tuple[str, ...] = (),
+    suggest_docs: bool = False,
+) -> BatchGenerator:
+    return BatchGenerator(
+        paths=GeneratorPaths.default(),
+        workers=workers,
+        fsync=fsync,
+        bundle=bundle,
+        render_cache=render_cache,
+        targets=targets,
+        suggest_docs=suggest_docs,
+    )
+
+
+def create_regenerator(
+    bundle: bool = False, targets: tuple[str, ...] = (), suggest_docs: bool = False
+) -> RegenerateProject:
+    paths = GeneratorPaths.default()
+    docs_index = load_docs_index(paths)
+    writer = FileTemplateWriter()
+
+    run_wizard = RunWizard(
+        step_repository=load_step_catalog(paths),
+        user_prompter=HeadlessPrompter(),
+        file_scanner=IndexedFileScanner(docs_index),
+    )
+    render_template = RenderTemplate(
+        template_writer=writer,
+        instructions_content=load_instructions(paths),
+        doc_reader=CachedDocReader(str(paths.docs_dir), docs_index) if bundle else None,
+        doc_search=load_doc_search(paths) if suggest_docs else None,
+    )
+    return RegenerateProject(
+        run_wizard=run_wizard,
+        render_template=render_template,
+        template_writer=writer,
+        state_store=JsonGenerationStateStore(),
+        emitters=create_emitters(targets),
+    )
+
+
+def create_wizard_server(
+    recorder: SpanRecorder | None = None,
+    prerender: bool = False,
+    workers: int | None = None,
+    render_cache: bool = True,
+    suggest_docs: bool = False,
+) -> WizardServer:
+    paths = GeneratorPaths.default()
+    skeletons = SkeletonPrerenderer(paths, workers).execute() if prerender else None
+
+    step_repo = load_step_catalog(paths)
+    file_scanner = MemoizedFileScanner(IndexedFileScanner(load_docs_index(paths)))
+    if recorder:
+        step_repo = TracedPort(step_repo, "step_repository", recorder)
+        file_scanner = TracedPort(file_scanner, "file_scanner", recorder)
+
+    run_wizard = RunWizard(
+        step_repository=step_repo,
+        user_prompter=HeadlessPrompter(),
+        file_scanner=file_scanner,
+    )
+    render_template = RenderTemplate(
+        template_writer=FileTemplateWriter(),
+        instructions_content=load_instructions(paths),
+        render_cache=load_render_cache(paths) if render_cache else None,
+        catalog_version=catalog_snapshot(paths).key,
+        # Skeletons are filled without re-rendering, so they cannot carry
+        # suggestions derived from the free-text answers.
+        doc_search=load_doc_search(paths) if suggest_docs and not prerender else None,
+    )
+    return WizardServer(
+        run_wizard=run_wizard,
+        render_template=render_template,
+        recorder=recorder,
+        skeletons=skeletons,
     )
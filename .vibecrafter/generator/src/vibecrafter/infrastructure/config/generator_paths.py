@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class GeneratorPaths:
+    generator_dir: Path
+    docs_dir: Path
+    docs_index_path: Path
+    doc_search_path: Path
+    db_path: Path
+    seed_path: Path
+    migrations_dir: Path
+    snapshot_path: Path
+    instructions_path: Path
+    output_path: Path
+    journal_path: Path
+    render_cache_dir: Path
+
+    @classmethod
+    def default(cls) -> "GeneratorPaths":
+        generator_dir = Path(__file__).resolve().parent.parent.parent.parent.parent
+        vibecrafter_dir = generator_dir.parent
+        project_dir = vibecrafter_dir.parent
+        return cls(
+            generator_dir=generator_dir,
+            docs_dir=vibecrafter_dir / "docs",
+            docs_index_path=generator_dir / "docs_index.json",
+            doc_search_path=generator_dir / "docs_search.json",
+            db_path=generator_dir / "steps.db",
+            seed_path=generator_dir / "seed.sql",
+            migrations_dir=generator_dir / "migrations",
+            snapshot_path=generator_dir / "steps.snapshot",
+            instructions_path=generator_dir / "instructions.md",
+            output_path=project_dir / "project.md",
+            journal_path=generator_dir / "session.journal",
+            render_cache_dir=generator_dir / "render_cache",
+        )
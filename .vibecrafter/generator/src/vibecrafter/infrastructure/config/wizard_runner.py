@@ -1,23 +1,87 @@
+from contextlib import AbstractContextManager, nullcontext
+
+from vibecrafter.application.ports.answer_journal import AnswerJournal
+from vibecrafter.application.ports.prefetcher import Prefetcher
 from vibecrafter.application.ports.user_prompter import UserPrompter
-from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.regenerate_project import RegenerateProject
 from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.infrastructure.tracing.span import PHASE
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
 
 
 class WizardRunner:
     def __init__(
         self,
         run_wizard: RunWizard,
-        render_template: RenderTemplate,
+        regenerate_project: RegenerateProject,
         prompter: UserPrompter,
         output_path: str,
+        recorder: SpanRecorder | None = None,
+        journal: AnswerJournal | None = None,
+        prefetcher: Prefetcher | None = None,
     ) -> None:
         self._run_wizard = run_wizard
-        self._render_template = render_template
+        self._regenerate_project = regenerate_project
         self._prompter = prompter
         self._output_path = output_path
+        self._recorder = recorder
+        self._journal = journal
+        self._prefetcher = prefetcher
+
+    def execute(self, resume: bool = False) -> None:
+        """With `resume`, journaled answers are replayed and only the rest asked."""
+        answers: dict[str, str] = {}
+        if self._journal is not None:
+            if resume:
+                answers = self._journal.replay()
+            else:
+                self._journal.clear()
 
-    def execute(self) -> None:
-        session = self._run_wizard.execute()
-        self._render_template.execute(session, self._output_path)
+        try:
+            with self._phase("phase.wizard"):
+                session = self._run_wizard.execute(answers)
+        finally:
+            # Queued scans would otherwise keep the interpreter alive at exit.
+            if self._prefetcher is not None:
+                self._prefetcher.close()
+        with self._phase("phase.render_write"):
+            self._regenerate_project.write(session, self._output_path)
+        if self._journal is not None:
+            self._journal.clear()
         self._prompter.show_summary(session.all_results())
         self._prompter.show_success(self._output_path)
+
+    def discard_stale_answers(self) -> str | None:
+        """Drops journaled answers from the first one the catalog now rejects.
+
+        Docs or steps may have changed since the session was journaled. The
+        journal is rewritten with the answers that still replay, and the
+        variable the wizard will ask again from is returned (None if all fit).
+        """
+        if self._journal is None:
+            return None
+        answers = self._journal.replay()
+        try:
+            self._run_wizard.next_step(answers)
+            return None
+        except WizardError:
+            pass
+        kept: dict[str, str] = {}
+        rejected = None
+        for variable, value in answers.items():
+            try:
+                self._run_wizard.next_step({**kept, variable: value})
+            except WizardError:
+                rejected = variable
+                break
+            kept[variable] = value
+        self._journal.clear()
+        for variable, value in kept.items():
+            self._journal.append(variable, value)
+        return rejected
+
+    def _phase(self, name: str) -> AbstractContextManager[None]:
+        if self._recorder is None:
+            return nullcontext()
+        return self._recorder.span(name, PHASE)
@@ -0,0 +1,26 @@
+import json
+from collections.abc import Iterator
+
+from vibecrafter.application.ports.document_emitter import DocumentEmitter
+from vibecrafter.domain.models.project_document import ProjectDocument
+
+
+class JsonDocumentEmitter(DocumentEmitter):
+    """Machine-readable answers per section plus the docs they point to."""
+
+    def emit(self, document: ProjectDocument) -> Iterator[str]:
+        payload = {
+            "project": document.project_name,
+            "sections": [
+                {
+                    "id": section.id,
+                    "header": section.header,
+                    "answers": dict(section.answers),
+                }
+                for section in document.sections
+            ],
+            "references": [
+                f".vibecrafter/docs/{reference}" for reference in document.references
+            ],
+        }
+        yield json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
@@ -0,0 +1,21 @@
+from collections.abc import Iterator
+
+from vibecrafter.application.ports.document_emitter import DocumentEmitter
+from vibecrafter.domain.models.project_document import ProjectDocument
+
+
+class MarkdownEmitter(DocumentEmitter):
+    """project.md layout under another title, for agent-specific rule files.
+
+    `title` may contain `{name}`, replaced with the project name.
+    """
+
+    def __init__(self, title: str) -> None:
+        self._title = title
+
+    def emit(self, document: ProjectDocument) -> Iterator[str]:
+        yield self._title.replace("{name}", document.project_name) + "\n\n"
+        for section in document.sections:
+            yield section.text
+        yield "---\n\n"
+        yield document.instructions
@@ -0,0 +1,26 @@
+from collections.abc import Callable, Iterable
+
+from vibecrafter.application.ports.document_emitter import DocumentEmitter
+from vibecrafter.infrastructure.emitters.json_document_emitter import (
+    JsonDocumentEmitter,
+)
+from vibecrafter.infrastructure.emitters.markdown_emitter import MarkdownEmitter
+
+# Extra outputs written beside project.md: target -> (file name, emitter factory).
+OUTPUT_TARGETS: dict[str, tuple[str, Callable[[], DocumentEmitter]]] = {
+    "agents": ("AGENTS.md", lambda: MarkdownEmitter("# AGENTS.md - {name}")),
+    "cursor": (
+        ".cursorrules",
+        lambda: MarkdownEmitter("# Reglas del proyecto {name}"),
+    ),
+    "json": ("project.json", JsonDocumentEmitter),
+}
+
+
+def create_emitters(targets: Iterable[str]) -> dict[str, DocumentEmitter]:
+    """Maps each target's file name to a fresh emitter, keeping the given order."""
+    emitters: dict[str, DocumentEmitter] = {}
+    for target in targets:
+        filename, factory = OUTPUT_TARGETS[target]
+        emitters[filename] = factory()
+    return emitters
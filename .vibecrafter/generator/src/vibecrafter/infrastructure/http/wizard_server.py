@@ -0,0 +1,211 @@
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any
+
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.domain.models.skeleton_catalog import SkeletonCatalog
+from vibecrafter.domain.models.static_segment import encode_chunks
+from vibecrafter.infrastructure.batch.answer_spec_loader import normalize_answers
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
+
+MAX_BODY_BYTES = 1024 * 1024
+# Span labels come from this fixed set so client-chosen paths cannot grow them.
+ROUTES = frozenset({"/health", "/next-step", "/render", "/metrics"})
+METHODS = frozenset({"GET", "POST"})
+
+
+class _HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class WizardServer:
+    """Minimal asyncio HTTP/1.1 front end for the wizard.
+
+    Every dependency is preloaded by the caller, so a request only walks the
+    in-memory step graph and renders; no SQLite or file access happens here.
+
+    POST /next-step  {"answers": {...}} -> next unanswered step or {"complete": true}
+    POST /render     {"answers": {...}} -> project.md as text/markdown
+    GET  /health
+    GET  /metrics    Prometheus text summary (only when a recorder is given)
+
+    With a SkeletonCatalog, /render fills the prebuilt skeleton for the answered
+    path and only falls back to walking and rendering when none fits.
+    """
+
+    def __init__(
+        self,
+        run_wizard: RunWizard,
+        render_template: RenderTemplate,
+        recorder: SpanRecorder | None = None,
+        skeletons: SkeletonCatalog | None = None,
+    ) -> None:
+        self._run_wizard = run_wizard
+        self._render_template = render_template
+        self._recorder = recorder
+        self._skeletons = skeletons
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.Server:
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = await self._read_headers(reader)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                    path = target.split("?", 1)[0]
+                    body = await self._read_body(reader, headers)
+                    if self._recorder is None:
+                        status, content_type, payload = await self._dispatch(
+                            method, path, body
+                        )
+                    else:
+                        with self._recorder.span(self._span_name(method, path)):
+                            status, content_type, payload = await self._dispatch(
+                                method, path, body
+                            )
+                except _HttpError as error:
+                    keep_alive = False
+                    status, content_type, payload = self._json(
+                        error.status, {"error": str(error)}
+                    )
+                except ValueError:
+                    keep_alive = False
+                    status, content_type, payload = self._json(
+                        HTTPStatus.BAD_REQUEST, {"error": "Malformed request"}
+                    )
+                except Exception:
+                    keep_alive = False
+                    status, content_type, payload = self._json(
+                        HTTPStatus.INTERNAL_SERVER_ERROR,
+                        {"error": "Internal server error"},
+                    )
+                writer.write(self._response(status, content_type, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(
+        self, method: str, path: str, body: bytes
+    ) -> tuple[HTTPStatus, str, bytes]:
+        match (method, path):
+            case ("GET", "/health"):
+                return self._json(HTTPStatus.OK, {"status": "ok"})
+            case ("GET", "/metrics") if self._recorder is not None:
+                metrics = self._recorder.to_prometheus().encode("utf-8")
+                return HTTPStatus.OK, "text/plain; version=0.0.4", metrics
+            case ("POST", "/next-step"):
+                return self._next_step(self._answers(body))
+            case ("POST", "/render"):
+                # Rendering can take a while; keep the loop free for other clients.
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    None, self._render, self._answers(body)
+                )
+            case (_, "/health" | "/next-step" | "/render"):
+                raise _HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed")
+            case _:
+                raise _HttpError(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+
+    def _next_step(self, answers: dict[str, str]) -> tuple[HTTPStatus, str, bytes]:
+        try:
+            pending = self._run_wizard.next_step(answers)
+        except WizardError as error:
+            raise _HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, str(error)) from error
+        if pending is None:
+            return self._json(HTTPStatus.OK, {"complete": True})
+        step = pending.step
+        return self._json(
+            HTTPStatus.OK,
+            {
+                "complete": False,
+                "step": {
+                    "number": pending.number,
+                    "variable": step.variable,
+                    "type": step.type.value,
+                    "question": step.question,
+                    "options": pending.options,
+                },
+            },
+        )
+
+    def _render(self, answers: dict[str, str]) -> tuple[HTTPStatus, str, bytes]:
+        content = self._skeletons.render(answers) if self._skeletons else None
+        if content is not None:
+            payload = content.encode("utf-8")
+        else:
+            try:
+                session = self._run_wizard.execute(answers)
+            except WizardError as error:
+                raise _HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, str(error)) from error
+            payload = encode_chunks(self._render_template.render(session))
+        return HTTPStatus.OK, "text/markdown; charset=utf-8", payload
+
+    def _answers(self, body: bytes) -> dict[str, str]:
+        payload: Any = json.loads(body or b"{}")
+        answers = payload.get("answers", {}) if isinstance(payload, dict) else None
+        if not isinstance(answers, dict):
+            raise _HttpError(HTTPStatus.BAD_REQUEST, "'answers' must be an object")
+        try:
+            return normalize_answers(answers)
+        except WizardError as error:
+            raise _HttpError(HTTPStatus.BAD_REQUEST, str(error)) from error
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def _read_body(
+        self, reader: asyncio.StreamReader, headers: dict[str, str]
+    ) -> bytes:
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_BODY_BYTES:
+            raise _HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Body too large")
+        return await reader.readexactly(length) if length else b""
+
+    @staticmethod
+    def _span_name(method: str, path: str) -> str:
+        route = path if path in ROUTES else "other"
+        return f"http {method if method in METHODS else 'OTHER'} {route}"
+
+    @staticmethod
+    def _json(status: HTTPStatus, payload: dict[str, Any]) -> tuple[HTTPStatus, str, bytes]:
+        return status, "application/json", json.dumps(payload).encode("utf-8")
+
+    @staticmethod
+    def _response(
+        status: HTTPStatus, content_type: str, payload: bytes, keep_alive: bool
+    ) -> bytes:
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + payload
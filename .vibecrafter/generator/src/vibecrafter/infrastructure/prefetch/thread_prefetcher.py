@@ -0,0 +1,64 @@
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from vibecrafter.application.ports.file_scanner import FileScanner
+from vibecrafter.application.ports.prefetcher import Prefetcher
+from vibecrafter.application.ports.step_repository import StepRepository
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+
+
+class ThreadPrefetcher(Prefetcher):
+    """Warms children and their option scans on a worker thread.
+
+    Results are not kept here: the repository and scanner it is given are
+    expected to memoize (e.g. MemoizedFileScanner), so the main thread finds
+    them warm. Work queued for a previous prompt is cancelled when a new one
+    opens. Failures are swallowed; the main thread will simply do the work.
+    """
+
+    def __init__(
+        self,
+        step_repository: StepRepository,
+        file_scanner: FileScanner,
+        max_workers: int = 2,
+    ) -> None:
+        self._step_repository = step_repository
+        self._file_scanner = file_scanner
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prefetch"
+        )
+        self._futures: list[Future[None]] = []
+
+    def prefetch(
+        self, step: Step, options: list[str], values: Mapping[str, str]
+    ) -> None:
+        for future in self._futures:
+            future.cancel()
+        snapshot = dict(values)
+        self._futures = [
+            self._executor.submit(self._warm, step, option, snapshot)
+            for option in options
+        ]
+
+    def wait(self) -> None:
+        for future in self._futures:
+            if not future.cancelled():
+                future.result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _warm(self, step: Step, option: str, values: dict[str, str]) -> None:
+        # The session keeps the first value per variable, like setdefault.
+        lookup = {step.variable: option, **values}.get
+        try:
+            for child in self._step_repository.find_children(step.id, option):
+                source = child.option_source
+                if child.type != StepType.SELECT or source is None:
+                    continue
+                scan_path = source.resolve_scan_path(lookup)
+                if scan_path:
+                    self._file_scanner.list_md_files(scan_path)
+        except Exception:
+            pass
@@ -0,0 +1,240 @@
+import re
+import shutil
+import sys
+import unicodedata
+from typing import TextIO
+
+from vibecrafter.application.ports.user_prompter import UserPrompter
+from vibecrafter.domain.models.option_index import build_option_index
+from vibecrafter.domain.models.step_result import StepResult
+from vibecrafter.infrastructure.prompters.cbreak import cbreak
+from vibecrafter.infrastructure.prompters.option_search import (
+    SEARCH_RESULTS,
+    SEARCH_THRESHOLD,
+)
+from vibecrafter.infrastructure.prompters.summary_lines import summary_lines
+
+CSI = "\x1b["
+BOLD = f"{CSI}1m"
+RESET = f"{CSI}0m"
+CYAN = f"{CSI}36m"
+GREEN = f"{CSI}32m"
+YELLOW = f"{CSI}33m"
+RED = f"{CSI}31m"
+
+BANNER = (f"{BOLD}{CYAN}Generador de Proyecto - Arquitectura Hexagonal{RESET}", "")
+KEY_UP = "\x1b[A"
+KEY_DOWN = "\x1b[B"
+# Captured, so splitting a row keeps its colour codes as separate parts.
+SGR = re.compile(r"(\x1b\[[0-9;]*m)")
+
+
+def _char_width(char: str) -> int:
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def visible_width(text: str) -> int:
+    """Columns `text` takes on screen, ignoring its SGR colour codes."""
+    return sum(_char_width(char) for char in SGR.sub("", text))
+
+
+def fit(row: str, columns: int) -> str:
+    """Truncates `row` so it never reaches the last column and wraps."""
+    limit = columns - 1
+    if visible_width(row) <= limit:
+        return row
+    out: list[str] = []
+    used = 0
+    for part in SGR.split(row):
+        if SGR.fullmatch(part):
+            out.append(part)
+            continue
+        for char in part:
+            width = _char_width(char)
+            if used + width >= limit:
+                return "".join(out) + f"…{RESET}"
+            out.append(char)
+            used += width
+    return "".join(out)
+
+
+class AnsiPrompter(UserPrompter):
+    """Raw-ANSI prompter for slow links (SSH to build hosts).
+
+    The banner is drawn once. Every step then repaints only the rows of the
+    step area that differ from what is on screen, in a single write, so a step
+    costs the same no matter how many came before. Rows wider than the terminal
+    are truncated, so each one keeps to the screen row it is addressed by.
+
+    Long selects become a type-to-search list: every keystroke narrows the
+    option index and redraws only the result rows that changed.
+    """
+
+    def __init__(
+        self,
+        stdin: TextIO = sys.stdin,
+        stdout: TextIO = sys.stdout,
+        rows: int | None = None,
+        columns: int | None = None,
+    ) -> None:
+        self._stdin = stdin
+        self._stdout = stdout
+        size = shutil.get_terminal_size()
+        self._rows = rows or size.lines
+        self._columns = columns or size.columns
+        # Rows of the step area as last drawn, and whether the terminal still
+        # shows them where we put them (a frame taller than the screen scrolls).
+        self._lines: list[str] = []
+        self._synced = False
+        self._pending: list[str] = []
+
+    def show_welcome(self) -> None:
+        self._synced = False
+        self._ask(
+            [
+                "Este asistente te guiara para definir tu proyecto.",
+                f"Al finalizar se generara {BOLD}project.md{RESET} "
+                "con toda la informacion.",
+                "",
+            ],
+            "  Pulsa Enter para comenzar...",
+        )
+
+    def show_step_header(self, step_number: int, question: str) -> None:
+        # Held back and drawn together with the question in one frame.
+        self._pending = [f"{YELLOW}▸ Paso {step_number}{RESET}", ""]
+
+    def ask_text(self, question: str) -> str:
+        return self._ask(self._step_frame([f"{BOLD}{question}{RESET}", ""]), "  > ")
+
+    def ask_multiline(self, question: str) -> str:
+        frame = self._step_frame(
+            [
+                f"{BOLD}{question}{RESET}",
+                "  (Escribe las funcionalidades. Linea vacia para terminar)",
+                "",
+            ]
+        )
+        lines: list[str] = []
+        while True:
+            line = self._ask(frame, "  > ")
+            if not line:
+                break
+            lines.append(f"  - {line}")
+            frame = self._lines
+        return "\n".join(lines)
+
+    def ask_select(self, question: str, options: list[str]) -> str:
+        if len(options) > SEARCH_THRESHOLD:
+            return self._search_select(question, options)
+        frame = self._step_frame(
+            [f"{BOLD}{question}{RESET}", ""]
+            + [f"  {GREEN}{i}){RESET} {option}" for i, option in enumerate(options, 1)]
+            + [""]
+        )
+        while True:
+            choice = self._ask(frame, f"  Selecciona [1-{len(options)}]: ")
+            if choice.isdigit() and 1 <= int(choice) <= len(options):
+                return options[int(choice) - 1]
+            frame = self._lines + [f"  {RED}Opcion no valida. Intenta de nuevo.{RESET}"]
+
+    def show_summary(self, results: list[StepResult]) -> None:
+        self._draw(
+            self._lines + ["", f"{BOLD}  Resumen:{RESET}", *summary_lines(results)]
+        )
+
+    def show_success(self, output_path: str) -> None:
+        self._draw(
+            self._lines
+            + [
+                "",
+                f"{BOLD}{GREEN}project.md generado correctamente!{RESET}",
+                "",
+                f"  {YELLOW}Siguiente paso:{RESET} Abre project.md con tu agente "
+                "de IA (Claude Code, Cursor, etc.)",
+                "  y pidele que lo lea para comenzar a construir tu proyecto.",
+                "",
+            ]
+        )
+
+    def _search_select(self, question: str, options: list[str]) -> str:
+        index = build_option_index(tuple(options))
+        header = self._step_frame([f"{BOLD}{question}{RESET}", ""])
+        hint = f"  ({len(options)} opciones; escribe para filtrar, flechas y Enter)"
+        query, selected = "", 0
+        with cbreak(self._stdin):
+            while True:
+                results = index.search(query, SEARCH_RESULTS)
+                selected = min(selected, max(len(results) - 1, 0))
+                rows = [
+                    f"  {GREEN}> {option}{RESET}" if i == selected else f"    {option}"
+                    for i, option in enumerate(results)
+                ] or [f"  {RED}Sin coincidencias{RESET}"]
+                frame = header + [hint, ""] + rows + [""]
+                prompt = f"  Buscar: {query}"
+                self._draw(frame, prompt)
+                key = self._read_key()
+                if key in ("\r", "\n") and results:
+                    self._lines = self._lines + [fit(prompt, self._columns)]
+                    return results[selected]
+                if key in ("\x7f", "\b"):
+                    query, selected = query[:-1], 0
+                elif key == KEY_UP:
+                    selected = max(selected - 1, 0)
+                elif key == KEY_DOWN:
+                    selected += 1
+                elif key.isprintable():
+                    query, selected = query + key, 0
+
+    def _read_key(self) -> str:
+        key = self._stdin.read(1)
+        if not key:
+            raise EOFError
+        if key == "\x1b":
+            key += self._stdin.read(2)
+        return key
+
+    def _step_frame(self, lines: list[str]) -> list[str]:
+        frame = self._pending + lines
+        self._pending = []
+        return frame
+
+    def _ask(self, frame: list[str], prompt: str) -> str:
+        self._draw(frame, prompt)
+        line = self._stdin.readline()
+        if not line:
+            raise EOFError
+        answer = line.rstrip("\r\n")
+        # Enter leaves the echoed answer on screen and the cursor one row down.
+        echoed = fit(prompt, self._columns) + answer
+        if visible_width(echoed) >= self._columns:
+            # The terminal wrapped the echo; rows below it are no longer known.
+            self._synced = False
+        self._lines = self._lines + [fit(echoed, self._columns)]
+        return answer
+
+    def _draw(self, frame: list[str], prompt: str = "") -> None:
+        """Writes the minimal diff from the rows on screen, in a single write."""
+        frame = [fit(row, self._columns) for row in frame]
+        top = len(BANNER) + 1
+        if top + len(frame) >= self._rows:
+            # Too tall to address by row: repaint plainly and let it scroll.
+            out = [f"{CSI}2J{CSI}H", *(f"{row}\n" for row in frame)]
+            self._synced = False
+        elif not self._synced:
+            banner = [fit(row, self._columns) for row in BANNER]
+            out = [f"{CSI}2J{CSI}H", *(f"{row}\n" for row in (*banner, *frame))]
+            self._synced = True
+        else:
+            out = [
+                f"{CSI}{top + index};1H{row}{CSI}K"
+                for index, row in enumerate(frame)
+                if index >= len(self._lines) or self._lines[index] != row
+            ]
+            out.append(f"{CSI}{top + len(frame)};1H{CSI}J")
+        self._lines = frame
+        out.append(fit(prompt, self._columns))
+        self._stdout.write("".join(out))
+        self._stdout.flush()
@@ -0,0 +1,24 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TextIO
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: keys are still read one by one, just echoed.
+    termios = None  # type: ignore[assignment]
+
+
+@contextmanager
+def cbreak(stream: TextIO) -> Iterator[None]:
+    """Key-at-a-time input without echo; a no-op unless `stream` is a terminal."""
+    if termios is None or not stream.isatty():
+        yield
+        return
+    fd = stream.fileno()
+    saved = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    try:
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
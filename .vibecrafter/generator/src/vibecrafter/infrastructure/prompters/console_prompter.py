@@ -3,7 +3,13 @@ from rich.panel import Panel
 from rich.text import Text
 
 from vibecrafter.application.ports.user_prompter import UserPrompter
+from vibecrafter.domain.models.option_index import build_option_index
 from vibecrafter.domain.models.step_result import StepResult
+from vibecrafter.infrastructure.prompters.option_search import (
+    SEARCH_RESULTS,
+    SEARCH_THRESHOLD,
+    narrow,
+)
 
 console = Console()
 
@@ -45,6 +51,8 @@ class ConsolePrompter(UserPrompter):
         return "\n".join(lines)
 
     def ask_select(self, question: str, options: list[str]) -> str:
+        if len(options) > SEARCH_THRESHOLD:
+            return self._search_select(question, options)
         console.print(f"[bold]{question}[/bold]\n")
         for i, option in enumerate(options, 1):
             console.print(f"  [green]{i})[/green] {option}")
@@ -58,6 +66,22 @@ class ConsolePrompter(UserPrompter):
                     return options[idx - 1]
             console.print("  [red]Opcion no valida. Intenta de nuevo.[/red]")
 
+    def _search_select(self, question: str, options: list[str]) -> str:
+        index = build_option_index(tuple(options))
+        console.print(f"[bold]{question}[/bold]")
+        console.print(f"  ({len(options)} opciones; escribe para filtrar)\n")
+        shown = index.search("", SEARCH_RESULTS)
+        while True:
+            for i, option in enumerate(shown, 1):
+                console.print(f"  [green]{i})[/green] {option}")
+            if not shown:
+                console.print("  [red]Sin coincidencias.[/red]")
+            choice, shown = narrow(
+                index, shown, console.input("\n  Filtro o numero: ")
+            )
+            if choice is not None:
+                return choice
+
     def show_summary(self, results: list[StepResult]) -> None:
         console.print()
         console.print("[bold]  Resumen:[/bold]")
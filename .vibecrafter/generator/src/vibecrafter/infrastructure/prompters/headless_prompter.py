@@ -0,0 +1,28 @@
+from vibecrafter.application.ports.user_prompter import UserPrompter
+from vibecrafter.domain.exceptions.wizard_error import MissingAnswerError
+from vibecrafter.domain.models.step_result import StepResult
+
+
+class HeadlessPrompter(UserPrompter):
+    """Prompter for scripted runs: every answer must come from the answer set."""
+
+    def show_welcome(self) -> None:
+        pass
+
+    def show_step_header(self, step_number: int, question: str) -> None:
+        pass
+
+    def ask_text(self, question: str) -> str:
+        raise MissingAnswerError(f"No answer provided for: {question}")
+
+    def ask_multiline(self, question: str) -> str:
+        raise MissingAnswerError(f"No answer provided for: {question}")
+
+    def ask_select(self, question: str, options: list[str]) -> str:
+        raise MissingAnswerError(f"No answer provided for: {question}")
+
+    def show_summary(self, results: list[StepResult]) -> None:
+        pass
+
+    def show_success(self, output_path: str) -> None:
+        pass
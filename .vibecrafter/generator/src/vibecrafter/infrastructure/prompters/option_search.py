@@ -0,0 +1,17 @@
+from vibecrafter.domain.models.option_index import OptionIndex
+
+# Selects with more options than this become searchable.
+SEARCH_THRESHOLD = 15
+SEARCH_RESULTS = 10
+
+
+def narrow(
+    index: OptionIndex, shown: list[str], answer: str
+) -> tuple[str | None, list[str]]:
+    """Line-mode search step: a number picks from `shown`, any other text filters.
+
+    Returns the chosen option, if any, and the results to show next.
+    """
+    if answer.isdigit() and 1 <= int(answer) <= len(shown):
+        return shown[int(answer) - 1], shown
+    return None, index.search(answer, SEARCH_RESULTS)
@@ -0,0 +1,110 @@
+import sys
+from typing import TextIO
+
+from vibecrafter.application.ports.user_prompter import UserPrompter
+from vibecrafter.domain.models.option_index import build_option_index
+from vibecrafter.domain.models.step_result import StepResult
+from vibecrafter.infrastructure.prompters.option_search import (
+    SEARCH_RESULTS,
+    SEARCH_THRESHOLD,
+    narrow,
+)
+from vibecrafter.infrastructure.prompters.summary_lines import summary_lines
+
+TITLE = "Generador de Proyecto - Arquitectura Hexagonal"
+
+
+class PlainPrompter(UserPrompter):
+    """Line-by-line prompter without escape codes, for dumb terminals and logs.
+
+    Nothing is ever redrawn; each step is written in one go before its prompt.
+    """
+
+    def __init__(self, stdin: TextIO = sys.stdin, stdout: TextIO = sys.stdout) -> None:
+        self._stdin = stdin
+        self._stdout = stdout
+        self._pending: list[str] = []
+
+    def show_welcome(self) -> None:
+        self._ask(
+            "Pulsa Enter para comenzar...",
+            [
+                TITLE,
+                "",
+                "Este asistente te guiara para definir tu proyecto.",
+                "Al finalizar se generara project.md con toda la informacion.",
+                "",
+            ],
+        )
+
+    def show_step_header(self, step_number: int, question: str) -> None:
+        self._pending = ["", f"[Paso {step_number}]"]
+
+    def ask_text(self, question: str) -> str:
+        return self._ask("> ", [question])
+
+    def ask_multiline(self, question: str) -> str:
+        intro = [question, "(Escribe las funcionalidades. Linea vacia para terminar)"]
+        lines: list[str] = []
+        while True:
+            line = self._ask("> ", [] if lines else intro)
+            if not line:
+                break
+            lines.append(f"  - {line}")
+        return "\n".join(lines)
+
+    def ask_select(self, question: str, options: list[str]) -> str:
+        if len(options) > SEARCH_THRESHOLD:
+            return self._search_select(question, options)
+        shown = [question] + [
+            f"  {i}) {option}" for i, option in enumerate(options, 1)
+        ]
+        while True:
+            choice = self._ask(f"Selecciona [1-{len(options)}]: ", shown)
+            if choice.isdigit() and 1 <= int(choice) <= len(options):
+                return options[int(choice) - 1]
+            shown = ["Opcion no valida. Intenta de nuevo."]
+
+    def _search_select(self, question: str, options: list[str]) -> str:
+        index = build_option_index(tuple(options))
+        intro = [question, f"({len(options)} opciones; escribe para filtrar)"]
+        results = index.search("", SEARCH_RESULTS)
+        while True:
+            listed = [f"  {i}) {option}" for i, option in enumerate(results, 1)]
+            answer = self._ask(
+                "Filtro o numero: ", intro + (listed or ["Sin coincidencias."])
+            )
+            choice, results = narrow(index, results, answer)
+            if choice is not None:
+                return choice
+            intro = []
+
+    def show_summary(self, results: list[StepResult]) -> None:
+        self._write(["", "Resumen:", *summary_lines(results)])
+
+    def show_success(self, output_path: str) -> None:
+        self._write(
+            [
+                "",
+                "project.md generado correctamente!",
+                "Siguiente paso: abre project.md con tu agente de IA "
+                "(Claude Code, Cursor, etc.)",
+                "y pidele que lo lea para comenzar a construir tu proyecto.",
+            ]
+        )
+
+    def _write(self, lines: list[str]) -> None:
+        self._stdout.write("\n".join(self._pending + lines) + "\n")
+        self._stdout.flush()
+        self._pending = []
+
+    def _ask(self, prompt: str, lines: list[str]) -> str:
+        """Writes pending output, `lines` and the prompt in a single write."""
+        shown = self._pending + lines
+        self._stdout.write("".join(f"{line}\n" for line in shown) + prompt)
+        self._stdout.flush()
+        self._pending = []
+        line = self._stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
@@ -0,0 +1,14 @@
+from vibecrafter.domain.models.step_result import StepResult
+
+
+def summary_lines(results: list[StepResult]) -> list[str]:
+    """The answers summary as plain text rows, as ConsolePrompter prints it."""
+    lines: list[str] = []
+    for result in results:
+        if result.value.strip():
+            label = result.step.variable.replace("_", " ").capitalize()
+            value = result.value
+            if "\n" in value:
+                value = "(ver project.md)"
+            lines.append(f"  {label + ':':<16} {value}")
+    return lines
@@ -0,0 +1,201 @@
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from vibecrafter.application.ports.doc_search_index import DocSearchIndex
+from vibecrafter.domain.models.option_index import normalize
+
+INDEX_VERSION = 1
+K1 = 1.2
+B = 0.75
+# Fraction of the best score a doc needs to still be suggested.
+RELATIVE_CUTOFF = 0.35
+MIN_SCORE = 1.0
+# The "# Title" line is counted this many times; it says what the doc is about.
+TITLE_WEIGHT = 3
+
+# Truncation stemming: "mensajes"/"mensajeria" and "queue"/"queues" collide.
+STEM_LENGTH = 6
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    """
+    las los una unos unas del con por para que como sus sin sobre entre cada
+    este esta estos estas ese esa eso todo toda todos todas pero solo tambien
+    mas muy hay ser son est the and for with from that this are not you your
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Normalised terms, stop words dropped, truncated to a crude stem."""
+    terms: list[str] = []
+    for token in TOKEN_PATTERN.findall(normalize(text)):
+        if len(token) < 3 or token in STOPWORDS:
+            continue
+        terms.append(token[:STEM_LENGTH])
+    return terms
+
+
+@dataclass(frozen=True)
+class IndexedDoc:
+    mtime_ns: int
+    size: int
+    length: int
+    terms: dict[str, int]
+
+
+class Bm25DocIndex(DocSearchIndex):
+    """BM25 inverted index over every .md under the docs root.
+
+    Persisted as JSON with per-doc term frequencies keyed by POSIX paths
+    relative to the docs root. A refresh stats every doc and re-tokenizes only
+    those whose mtime or size changed; postings are rebuilt in memory.
+    """
+
+    def __init__(self, docs_base_path: str, index_path: str | None = None) -> None:
+        self._docs_base = Path(docs_base_path)
+        self._index_path = Path(index_path) if index_path else None
+        self._docs: dict[str, IndexedDoc] = {}
+        self._postings: dict[str, list[tuple[str, int]]] = {}
+        self._average_length = 0.0
+
+    @classmethod
+    def load(cls, docs_base_path: str, index_path: str | None = None) -> "Bm25DocIndex":
+        index = cls(docs_base_path, index_path)
+        index._read_index()
+        if index.refresh() and index_path:
+            try:
+                index.save()
+            except OSError:
+                pass
+        return index
+
+    def refresh(self) -> bool:
+        previous = self._docs
+        current: dict[str, IndexedDoc] = {}
+        changed = False
+        for directory, _, files in os.walk(self._docs_base):
+            for name in files:
+                if not name.endswith(".md"):
+                    continue
+                path = Path(directory) / name
+                relative = path.relative_to(self._docs_base).as_posix()
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entry = previous.get(relative)
+                if (
+                    entry is None
+                    or entry.mtime_ns != stat.st_mtime_ns
+                    or entry.size != stat.st_size
+                ):
+                    try:
+                        entry = self._index_doc(path, stat.st_mtime_ns, stat.st_size)
+                    except (OSError, UnicodeDecodeError):
+                        # Unreadable or not UTF-8: leave it out, like a vanished doc.
+                        continue
+                    changed = True
+                current[relative] = entry
+
+        changed = changed or current.keys() != previous.keys()
+        self._docs = current
+        self._build_postings()
+        return changed
+
+    def search(self, text: str, limit: int) -> list[str]:
+        scores: dict[str, float] = {}
+        total = len(self._docs)
+        for term in set(tokenize(text)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for relative, frequency in postings:
+                norm = 1 - B + B * self._docs[relative].length / self._average_length
+                scores[relative] = scores.get(relative, 0.0) + idf * (
+                    frequency * (K1 + 1) / (frequency + K1 * norm)
+                )
+        if not scores:
+            return []
+        best = max(scores.values())
+        cutoff = max(MIN_SCORE, best * RELATIVE_CUTOFF)
+        ranked = heapq.nsmallest(
+            limit,
+            (
+                (-score, relative)
+                for relative, score in scores.items()
+                if score >= cutoff
+            ),
+        )
+        return [relative for _, relative in ranked]
+
+    def version(self) -> str:
+        stamps = sorted(
+            (relative, doc.mtime_ns, doc.size) for relative, doc in self._docs.items()
+        )
+        return hashlib.sha256(json.dumps(stamps).encode("utf-8")).hexdigest()
+
+    def save(self) -> None:
+        if self._index_path is None:
+            return
+        payload = {
+            "version": INDEX_VERSION,
+            "docs": {
+                relative: {
+                    "mtime_ns": doc.mtime_ns,
+                    "size": doc.size,
+                    "length": doc.length,
+                    "terms": doc.terms,
+                }
+                for relative, doc in sorted(self._docs.items())
+            },
+        }
+        tmp_path = self._index_path.with_name(
+            f"{self._index_path.name}.{os.getpid()}.tmp"
+        )
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self._index_path)
+
+    def _read_index(self) -> None:
+        if self._index_path is None:
+            return
+        try:
+            payload = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("version") != INDEX_VERSION:
+            return
+        self._docs = {
+            relative: IndexedDoc(
+                mtime_ns=raw["mtime_ns"],
+                size=raw["size"],
+                length=raw["length"],
+                terms=raw["terms"],
+            )
+            for relative, raw in payload.get("docs", {}).items()
+        }
+
+    def _build_postings(self) -> None:
+        postings: dict[str, list[tuple[str, int]]] = {}
+        for relative, doc in self._docs.items():
+            for term, frequency in doc.terms.items():
+                postings.setdefault(term, []).append((relative, frequency))
+        self._postings = postings
+        lengths = [doc.length for doc in self._docs.values()]
+        self._average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    @staticmethod
+    def _index_doc(path: Path, mtime_ns: int, size: int) -> IndexedDoc:
+        text = path.read_text(encoding="utf-8")
+        title = text.split("\n", 1)[0] if text.startswith("# ") else ""
+        terms = tokenize(text) + tokenize(title) * (TITLE_WEIGHT - 1)
+        return IndexedDoc(
+            mtime_ns=mtime_ns, size=size, length=len(terms), terms=dict(Counter(terms))
+        )
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import threading
+from pathlib import Path, PurePosixPath
+
+from vibecrafter.application.ports.doc_reader import DocReader
+from vibecrafter.infrastructure.repositories.docs_index import DocsIndex
+
+
+class CachedDocReader(DocReader):
+    """Content-addressed doc cache.
+
+    Each path is stat'ed on read; while (mtime, size) is unchanged the cached
+    blob is reused without touching the file. Blobs are immutable bytes keyed
+    by SHA-256, so identical docs under different paths share one copy and a
+    later write to either file never shows through the other.
+    """
+
+    def __init__(self, docs_base_path: str, index: DocsIndex | None = None) -> None:
+        self._docs_base = Path(docs_base_path).resolve()
+        self._index = index
+        self._lock = threading.Lock()
+        self._paths: dict[str, tuple[tuple[int, int], str]] = {}
+        self._blobs: dict[str, bytes] = {}
+
+    def read(self, relative_path: str) -> str | None:
+        blob = self.read_bytes(relative_path)
+        return None if blob is None else str(blob, "utf-8")
+
+    def read_bytes(self, relative_path: str) -> bytes | None:
+        path = self._resolve(relative_path)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._paths.get(relative_path)
+            if cached is not None and cached[0] == signature:
+                return self._blobs[cached[1]]
+
+        try:
+            signature, blob = self._load(path)
+        except OSError:
+            return None
+        digest = hashlib.sha256(blob).hexdigest()
+        with self._lock:
+            blob = self._blobs.setdefault(digest, blob)
+            previous = self._paths.get(relative_path)
+            self._paths[relative_path] = (signature, digest)
+            if previous is not None:
+                self._release(previous[1])
+            return blob
+
+    def list_md(self, relative_dir: str) -> list[str]:
+        base = PurePosixPath(relative_dir)
+        if self._index is not None:
+            directory = self._index.directory(relative_dir)
+            stems = directory.md_stems if directory else []
+        else:
+            target = self._resolve(relative_dir)
+            if target is None or not target.is_dir():
+                return []
+            stems = sorted(f.stem for f in target.glob("*.md") if f.is_file())
+        return [(base / f"{stem}.md").as_posix() for stem in stems]
+
+    def cached_blob_count(self) -> int:
+        with self._lock:
+            return len(self._blobs)
+
+    def _release(self, digest: str) -> None:
+        # Callers may still hold the bytes; dropping the entry only frees the cache.
+        if not any(d == digest for _, d in self._paths.values()):
+            self._blobs.pop(digest, None)
+
+    def _resolve(self, relative_path: str) -> Path | None:
+        path = (self._docs_base / relative_path).resolve()
+        if path != self._docs_base and self._docs_base not in path.parents:
+            return None
+        return path
+
+    @staticmethod
+    def _load(path: Path) -> tuple[tuple[int, int], bytes]:
+        """Reads the file, stamping it from the same descriptor it was read from."""
+        with path.open("rb") as doc:
+            stat = os.fstat(doc.fileno())
+            return (stat.st_mtime_ns, stat.st_size), doc.read()
@@ -0,0 +1,43 @@
+from collections.abc import Iterable
+
+from vibecrafter.application.ports.step_repository import StepRepository
+from vibecrafter.domain.models.step import Step
+
+
+class CachedStepRepository(StepRepository):
+    """In-memory step graph; children are indexed by (parent_id, trigger_value)."""
+
+    def __init__(self, steps: Iterable[Step]) -> None:
+        self._steps = sorted(steps, key=lambda step: step.id)
+        self._roots = self._sorted(s for s in self._steps if s.parent_id is None)
+        self._children: dict[tuple[int, str | None], list[Step]] = {}
+        self._build_index()
+
+    def find_roots(self) -> list[Step]:
+        return list(self._roots)
+
+    def find_all(self) -> list[Step]:
+        return list(self._steps)
+
+    def find_children(self, parent_id: int, trigger_value: str) -> list[Step]:
+        children = self._children.get((parent_id, trigger_value))
+        if children is None:
+            children = self._children.get((parent_id, None), [])
+        return list(children)
+
+    def _build_index(self) -> None:
+        by_trigger: dict[tuple[int, str | None], list[Step]] = {}
+        for step in self._steps:
+            if step.parent_id is not None:
+                by_trigger.setdefault((step.parent_id, step.trigger_value), []).append(step)
+
+        for (parent_id, trigger_value), steps in by_trigger.items():
+            if trigger_value is None:
+                self._children[(parent_id, None)] = self._sorted(steps)
+            else:
+                always = by_trigger.get((parent_id, None), [])
+                self._children[(parent_id, trigger_value)] = self._sorted(always + steps)
+
+    @staticmethod
+    def _sorted(steps: Iterable[Step]) -> list[Step]:
+        return sorted(steps, key=lambda step: (step.order, step.id))
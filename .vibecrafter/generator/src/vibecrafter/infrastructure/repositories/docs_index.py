@@ -0,0 +1,120 @@
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class DocsDirectory:
+    mtime_ns: int
+    md_stems: list[str]
+    subdirs: list[str]
+
+
+class DocsIndex:
+    """Manifest of the docs tree: every directory with its .md stems and subdirectories.
+
+    Persisted as JSON keyed by POSIX paths relative to the docs root ("" is the
+    root). A refresh stats each directory and rescans only those whose mtime
+    changed, so unchanged trees cost one stat per directory.
+    """
+
+    def __init__(self, docs_base_path: str, manifest_path: str | None = None) -> None:
+        self._docs_base = Path(docs_base_path)
+        self._manifest_path = Path(manifest_path) if manifest_path else None
+        self._directories: dict[str, DocsDirectory] = {}
+
+    @classmethod
+    def load(cls, docs_base_path: str, manifest_path: str | None = None) -> "DocsIndex":
+        index = cls(docs_base_path, manifest_path)
+        index._read_manifest()
+        if index.refresh() and manifest_path:
+            try:
+                index.save()
+            except OSError:
+                pass
+        return index
+
+    def directory(self, relative_path: str) -> DocsDirectory | None:
+        return self._directories.get(self._normalize(relative_path))
+
+    def directories(self) -> dict[str, DocsDirectory]:
+        return dict(self._directories)
+
+    def refresh(self) -> bool:
+        previous = self._directories
+        current: dict[str, DocsDirectory] = {}
+        changed = False
+        pending = [""]
+        while pending:
+            relative = pending.pop()
+            try:
+                mtime_ns = os.stat(self._docs_base / relative).st_mtime_ns
+            except OSError:
+                continue
+            entry = previous.get(relative)
+            if entry is None or entry.mtime_ns != mtime_ns:
+                entry = self._scan(relative, mtime_ns)
+                changed = True
+            current[relative] = entry
+            pending.extend(self._join(relative, name) for name in entry.subdirs)
+
+        changed = changed or current.keys() != previous.keys()
+        self._directories = current
+        return changed
+
+    def save(self) -> None:
+        if self._manifest_path is None:
+            return
+        payload = {
+            "version": MANIFEST_VERSION,
+            "directories": {
+                relative: {
+                    "mtime_ns": entry.mtime_ns,
+                    "md": entry.md_stems,
+                    "dirs": entry.subdirs,
+                }
+                for relative, entry in sorted(self._directories.items())
+            },
+        }
+        tmp_path = self._manifest_path.with_name(f"{self._manifest_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self._manifest_path)
+
+    def _read_manifest(self) -> None:
+        if self._manifest_path is None:
+            return
+        try:
+            payload = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("version") != MANIFEST_VERSION:
+            return
+        self._directories = {
+            relative: DocsDirectory(
+                mtime_ns=raw["mtime_ns"], md_stems=raw["md"], subdirs=raw["dirs"]
+            )
+            for relative, raw in payload.get("directories", {}).items()
+        }
+
+    def _scan(self, relative: str, mtime_ns: int) -> DocsDirectory:
+        md_stems: list[str] = []
+        subdirs: list[str] = []
+        with os.scandir(self._docs_base / relative) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subdirs.append(entry.name)
+                elif entry.name.endswith(".md"):
+                    md_stems.append(entry.name[: -len(".md")])
+        return DocsDirectory(mtime_ns=mtime_ns, md_stems=sorted(md_stems), subdirs=sorted(subdirs))
+
+    @staticmethod
+    def _join(relative: str, name: str) -> str:
+        return f"{relative}/{name}" if relative else name
+
+    @staticmethod
+    def _normalize(relative_path: str) -> str:
+        normalized = PurePosixPath(relative_path).as_posix()
+        return "" if normalized == "." else normalized
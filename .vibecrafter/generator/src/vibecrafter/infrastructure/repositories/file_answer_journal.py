@@ -0,0 +1,51 @@
+import json
+import os
+from pathlib import Path
+from typing import IO
+
+from vibecrafter.application.ports.answer_journal import AnswerJournal
+
+
+class FileAnswerJournal(AnswerJournal):
+    """Append-only JSONL journal, one `["VARIABLE", "value"]` line per answer.
+
+    Each line is flushed as it is written (and fsync'ed when `fsync` is set), so
+    a dropped connection loses at most the answer being typed. A torn last
+    line is ignored on replay.
+    """
+
+    def __init__(self, journal_path: str, fsync: bool = False) -> None:
+        self._path = Path(journal_path)
+        self._fsync = fsync
+        self._file: IO[str] | None = None
+
+    def append(self, variable: str, value: str) -> None:
+        if self._file is None:
+            self._file = self._path.open("a", encoding="utf-8")
+        self._file.write(json.dumps([variable, value], ensure_ascii=False) + "\n")
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def replay(self) -> dict[str, str]:
+        answers: dict[str, str] = {}
+        try:
+            lines = self._path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return answers
+        for line in lines:
+            try:
+                variable, value = json.loads(line)
+            except ValueError:
+                break
+            answers.setdefault(variable, value)
+        return answers
+
+    def clear(self) -> None:
+        self.close()
+        self._path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
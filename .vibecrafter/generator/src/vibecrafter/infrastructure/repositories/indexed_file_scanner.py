@@ -0,0 +1,17 @@
+from vibecrafter.application.ports.file_scanner import FileScanner
+from vibecrafter.infrastructure.repositories.docs_index import DocsIndex
+
+
+class IndexedFileScanner(FileScanner):
+    """FileScanner answering from a DocsIndex instead of touching the filesystem."""
+
+    def __init__(self, index: DocsIndex) -> None:
+        self._index = index
+
+    def list_md_files(self, relative_path: str) -> list[str]:
+        directory = self._index.directory(relative_path)
+        if directory is None:
+            return []
+        if directory.md_stems:
+            return list(directory.md_stems)
+        return list(directory.subdirs)
@@ -0,0 +1,52 @@
+import json
+import os
+from pathlib import Path
+
+from vibecrafter.application.ports.generation_state_store import GenerationStateStore
+from vibecrafter.domain.models.generation_state import GenerationState
+from vibecrafter.domain.models.rendered_section import RenderedSection
+
+STATE_VERSION = 1
+
+
+class JsonGenerationStateStore(GenerationStateStore):
+    """Keeps the state next to its output as a hidden `.<name>.state.json` file."""
+
+    def load(self, output_path: str) -> GenerationState | None:
+        try:
+            raw = self.state_path(output_path).read_text(encoding="utf-8")
+            payload = json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != STATE_VERSION:
+            return None
+        return GenerationState(
+            answers=dict(payload["answers"]),
+            content_digest=payload["content_digest"],
+            sections={
+                section_id: RenderedSection(digest=entry["digest"], text=entry["text"])
+                for section_id, entry in payload["sections"].items()
+            },
+        )
+
+    def save(self, output_path: str, state: GenerationState) -> None:
+        path = self.state_path(output_path)
+        payload = {
+            "version": STATE_VERSION,
+            "answers": state.answers,
+            "content_digest": state.content_digest,
+            "sections": {
+                section_id: {"digest": section.digest, "text": section.text}
+                for section_id, section in state.sections.items()
+            },
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def state_path(output_path: str) -> Path:
+        output = Path(output_path)
+        return output.with_name(f".{output.name}.state.json")
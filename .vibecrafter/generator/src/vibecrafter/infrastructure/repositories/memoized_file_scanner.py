@@ -0,0 +1,29 @@
+import threading
+
+from vibecrafter.application.ports.file_scanner import FileScanner
+
+
+class MemoizedFileScanner(FileScanner):
+    """Caches another scanner's results per resolved path until invalidated."""
+
+    def __init__(self, scanner: FileScanner) -> None:
+        self._scanner = scanner
+        self._results: dict[str, tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def list_md_files(self, relative_path: str) -> list[str]:
+        with self._lock:
+            cached = self._results.get(relative_path)
+        if cached is None:
+            cached = tuple(self._scanner.list_md_files(relative_path))
+            with self._lock:
+                self._results[relative_path] = cached
+        return list(cached)
+
+    def invalidate(self, relative_path: str | None = None) -> None:
+        """Forgets one path, or every path when none is given."""
+        with self._lock:
+            if relative_path is None:
+                self._results.clear()
+            else:
+                self._results.pop(relative_path, None)
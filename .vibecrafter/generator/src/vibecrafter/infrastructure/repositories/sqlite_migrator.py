@@ -0,0 +1,67 @@
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+
+MIGRATION_PATTERN = re.compile(r"^(\d+)_[\w-]+\.sql$")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    path: Path
+
+
+class SqliteMigrator:
+    """Applies numbered `NNNN_name.sql` migrations, tracked in PRAGMA user_version.
+
+    Each migration runs in its own transaction together with the version bump,
+    so an interrupted upgrade resumes from the last applied migration.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, migrations_dir: str) -> None:
+        self._connection = connection
+        self._migrations_dir = Path(migrations_dir)
+
+    def current_version(self) -> int:
+        return self._connection.execute("PRAGMA user_version").fetchone()[0]
+
+    def pending(self) -> list[Migration]:
+        current = self.current_version()
+        return [m for m in self._available() if m.version > current]
+
+    def migrate(self) -> list[int]:
+        applied: list[int] = []
+        for migration in self.pending():
+            sql = migration.path.read_text(encoding="utf-8")
+            self._run_in_transaction(
+                f"{sql}\nPRAGMA user_version = {migration.version};"
+            )
+            applied.append(migration.version)
+        return applied
+
+    def seed(self, seed_sql: str) -> None:
+        """Replaces the catalog rows with the contents of a seed script."""
+        self._run_in_transaction(f"DELETE FROM steps;\n{seed_sql}")
+
+    def _run_in_transaction(self, script: str) -> None:
+        try:
+            self._connection.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+        except sqlite3.Error:
+            if self._connection.in_transaction:
+                self._connection.execute("ROLLBACK")
+            raise
+
+    def _available(self) -> list[Migration]:
+        migrations: dict[int, Migration] = {}
+        for path in self._migrations_dir.glob("*.sql"):
+            match = MIGRATION_PATTERN.match(path.name)
+            if not match:
+                continue
+            version = int(match.group(1))
+            if version in migrations:
+                raise WizardError(f"Duplicate migration version {version}: {path.name}")
+            migrations[version] = Migration(version=version, path=path)
+        return [migrations[v] for v in sorted(migrations)]
@@ -1,23 +1,57 @@
 import sqlite3
+import threading
+from pathlib import Path
 
 from vibecrafter.application.ports.step_repository import StepRepository
 from vibecrafter.domain.models.step import Step
 from vibecrafter.domain.models.step_type import StepType
 
+DEFAULT_CACHED_STATEMENTS = 256
+
 
 class SqliteStepRepository(StepRepository):
-    def __init__(self, db_path: str) -> None:
-        self._connection = sqlite3.connect(db_path)
-        self._connection.row_factory = sqlite3.Row
+    """Step catalog backed by SQLite.
+
+    By default a single connection is shared by the owning thread. With
+    `thread_local=True` every thread lazily opens its own connection, so a
+    pool of workers can query in parallel. `read_only` opens the file with
+    `mode=ro`; `immutable` additionally tells SQLite the file cannot change
+    while open, skipping locking entirely.
+    """
+
+    _local: threading.local | None = None
+
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        immutable: bool = False,
+        thread_local: bool = False,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+    ) -> None:
+        self._db_path = db_path
+        self._read_only = read_only or immutable
+        self._immutable = immutable
+        self._cached_statements = cached_statements
+        self._opened: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        if thread_local:
+            self._local = threading.local()
+        else:
+            self._connection = self._connect(check_same_thread=True)
 
     def find_roots(self) -> list[Step]:
-        cursor = self._connection.execute(
+        cursor = self._current_connection().execute(
             'SELECT * FROM steps WHERE parent_id IS NULL ORDER BY "order"'
         )
         return [self._row_to_step(row) for row in cursor.fetchall()]
 
+    def find_all(self) -> list[Step]:
+        cursor = self._current_connection().execute("SELECT * FROM steps ORDER BY id")
+        return [self._row_to_step(row) for row in cursor.fetchall()]
+
     def find_children(self, parent_id: int, trigger_value: str) -> list[Step]:
-        cursor = self._connection.execute(
+        cursor = self._current_connection().execute(
             "SELECT * FROM steps "
             "WHERE parent_id = ? AND (trigger_value IS NULL OR trigger_value = ?) "
             'ORDER BY "order"',
@@ -25,6 +59,45 @@ class SqliteStepRepository(StepRepository):
         )
         return [self._row_to_step(row) for row in cursor.fetchall()]
 
+    def close(self) -> None:
+        with self._lock:
+            opened, self._opened = self._opened, []
+        for connection in opened:
+            connection.close()
+        if self._local is not None:
+            self._local = threading.local()
+
+    def _current_connection(self) -> sqlite3.Connection:
+        if self._local is None:
+            return self._connection
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect(check_same_thread=False)
+            self._local.connection = connection
+        return connection
+
+    def _connect(self, check_same_thread: bool) -> sqlite3.Connection:
+        if self._read_only:
+            uri = Path(self._db_path).resolve().as_uri() + "?mode=ro"
+            if self._immutable:
+                uri += "&immutable=1"
+            connection = sqlite3.connect(
+                uri,
+                uri=True,
+                check_same_thread=check_same_thread,
+                cached_statements=self._cached_statements,
+            )
+        else:
+            connection = sqlite3.connect(
+                self._db_path,
+                check_same_thread=check_same_thread,
+                cached_statements=self._cached_statements,
+            )
+        connection.row_factory = sqlite3.Row
+        with self._lock:
+            self._opened.append(connection)
+        return connection
+
     def _row_to_step(self, row: sqlite3.Row) -> Step:
         return Step(
             id=row["id"],
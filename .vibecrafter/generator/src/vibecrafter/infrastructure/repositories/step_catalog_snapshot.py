@@ -0,0 +1,63 @@
+import hashlib
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+
+from vibecrafter.domain.models.step import Step
+
+SNAPSHOT_FORMAT = 3
+
+
+class StepCatalogSnapshot:
+    """Pickled, already-validated step list keyed by a hash of its source files.
+
+    Loading a snapshot bypasses SQLite and Step validation entirely; any change
+    to a source file (or to the snapshot format) changes the key and forces a
+    rebuild.
+    """
+
+    def __init__(self, snapshot_path: str, source_paths: list[str]) -> None:
+        self._snapshot_path = Path(snapshot_path)
+        self._source_paths = [Path(p) for p in source_paths]
+        self._key: str | None = None
+
+    @property
+    def key(self) -> str:
+        if self._key is None:
+            digest = hashlib.sha256(f"format:{SNAPSHOT_FORMAT}".encode())
+            for path in self._source_paths:
+                digest.update(str(path.name).encode())
+                if path.is_file():
+                    with path.open("rb") as source:
+                        digest.update(hashlib.file_digest(source, "sha256").digest())
+                else:
+                    digest.update(b"<missing>")
+            self._key = digest.hexdigest()
+        return self._key
+
+    def load(self) -> list[Step] | None:
+        try:
+            with self._snapshot_path.open("rb") as snapshot:
+                payload = pickle.load(snapshot)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(payload, dict) or payload.get("key") != self.key:
+            return None
+        return payload["steps"]
+
+    def save(self, steps: list[Step]) -> None:
+        tmp_path = self._snapshot_path.with_name(f"{self._snapshot_path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as snapshot:
+            pickle.dump({"key": self.key, "steps": steps}, snapshot, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._snapshot_path)
+
+    def load_or_build(self, build: Callable[[], list[Step]]) -> list[Step]:
+        steps = self.load()
+        if steps is None:
+            steps = build()
+            try:
+                self.save(steps)
+            except OSError:
+                pass
+        return steps
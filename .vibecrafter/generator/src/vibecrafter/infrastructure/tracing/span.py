@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+COMPUTE = "compute"
+USER_WAIT = "user_wait"
+PHASE = "phase"
+
+
+@dataclass(frozen=True)
+class Span:
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
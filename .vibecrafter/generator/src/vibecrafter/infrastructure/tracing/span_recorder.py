@@ -0,0 +1,105 @@
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from vibecrafter.infrastructure.tracing.span import COMPUTE, Span
+
+SpanHook = Callable[[Span], None]
+
+DEFAULT_MAX_SPANS = 100_000
+
+
+def _escape(label: str) -> str:
+    """Escapes a label value as the Prometheus text format requires."""
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class SpanRecorder:
+    """Collects timed spans, keeps per-name totals and fans spans out to hooks.
+
+    Raw spans are kept in a bounded buffer (for JSON traces); totals are kept
+    for every span ever recorded (for the Prometheus summary), so long-lived
+    processes stay bounded in memory as long as span names come from a fixed
+    set.
+    """
+
+    def __init__(
+        self,
+        hooks: list[SpanHook] | None = None,
+        max_spans: int = DEFAULT_MAX_SPANS,
+    ) -> None:
+        self._hooks = list(hooks or [])
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._totals: dict[tuple[str, str], list[int]] = {}
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def add_hook(self, hook: SpanHook) -> None:
+        self._hooks.append(hook)
+
+    @contextmanager
+    def span(self, name: str, category: str = COMPUTE) -> Iterator[None]:
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(
+                Span(
+                    name=name,
+                    category=category,
+                    start_ns=start_ns - self._origin_ns,
+                    duration_ns=time.perf_counter_ns() - start_ns,
+                    thread_id=threading.get_ident(),
+                )
+            )
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+            totals = self._totals.setdefault((span.name, span.category), [0, 0])
+            totals[0] += 1
+            totals[1] += span.duration_ns
+        for hook in self._hooks:
+            hook(span)
+
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def totals(self) -> dict[tuple[str, str], tuple[int, int]]:
+        """Returns (count, total_ns) per (name, category)."""
+        with self._lock:
+            return {key: (count, total) for key, (count, total) in self._totals.items()}
+
+    def to_chrome_trace(self) -> dict:
+        """Trace Event Format, loadable in chrome://tracing or Perfetto."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                }
+                for span in self.spans()
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# HELP vibecrafter_span_seconds Time spent in instrumented spans.",
+            "# TYPE vibecrafter_span_seconds summary",
+        ]
+        for (name, category), (count, total_ns) in sorted(self.totals().items()):
+            labels = f'name="{_escape(name)}",category="{_escape(category)}"'
+            lines.append(f"vibecrafter_span_seconds_sum{{{labels}}} {total_ns / 1e9:.9f}")
+            lines.append(f"vibecrafter_span_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,39 @@
+from typing import Any
+
+from vibecrafter.infrastructure.tracing.span import COMPUTE, USER_WAIT
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
+
+
+class TracedPort:
+    """Proxy that records a span named `<label>.<method>` around every port call.
+
+    Methods listed in `wait_methods` are tagged as user wait time instead of
+    compute, so interactive runs separate thinking time from work.
+    """
+
+    def __init__(
+        self,
+        target: Any,
+        label: str,
+        recorder: SpanRecorder,
+        wait_methods: frozenset[str] = frozenset(),
+    ) -> None:
+        self._target = target
+        self._label = label
+        self._recorder = recorder
+        self._wait_methods = wait_methods
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+
+        span_name = f"{self._label}.{name}"
+        category = USER_WAIT if name in self._wait_methods else COMPUTE
+        recorder = self._recorder
+
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            with recorder.span(span_name, category):
+                return attribute(*args, **kwargs)
+
+        return traced
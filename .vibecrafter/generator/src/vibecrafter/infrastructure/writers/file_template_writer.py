@@ -1,8 +1,152 @@
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterable
 from pathlib import Path
+from typing import BinaryIO
 
 from vibecrafter.application.ports.template_writer import TemplateWriter
+from vibecrafter.domain.models.static_segment import StaticSegment
+
+
+def _default_file_mode() -> int:
+    # os.umask can only be read by setting it, which races with files other
+    # threads create meanwhile; this runs once, at import, before any of them.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+DEFAULT_FILE_MODE = _default_file_mode()
 
 
 class FileTemplateWriter(TemplateWriter):
-    def write(self, path: str, content: str) -> None:
-        Path(path).write_text(content, encoding="utf-8")
+    """Streams chunks into a temp file beside the target and renames it into place.
+
+    Readers see either the previous file or the complete new one, never a
+    partial write. With `fsync` the data and the rename are flushed to disk.
+
+    StaticSegment chunks are not re-encoded: they are copied in the kernel from
+    their source file (copy_file_range, else sendfile) when it is unchanged, and
+    written from their preloaded bytes otherwise.
+    """
+
+    def __init__(self, fsync: bool = False) -> None:
+        self._fsync = fsync
+
+    def write(self, path: str, chunks: Iterable[str]) -> None:
+        target = Path(path)
+        tmp_path, _ = self._stream(target, chunks)
+        self._commit(tmp_path, target)
+
+    def write_if_changed(
+        self, path: str, chunks: Iterable[str], force: bool = False
+    ) -> tuple[str, bool]:
+        target = Path(path)
+        tmp_path, content_digest = self._stream(target, chunks)
+        if not force and self.digest(path) == content_digest:
+            Path(tmp_path).unlink(missing_ok=True)
+            return content_digest, False
+        self._commit(tmp_path, target)
+        return content_digest, True
+
+    def digest(self, path: str) -> str | None:
+        try:
+            with open(path, "rb") as current:
+                return hashlib.file_digest(current, "sha256").hexdigest()
+        except OSError:
+            return None
+
+    def _stream(self, target: Path, chunks: Iterable[str]) -> tuple[str, str]:
+        """Writes the chunks to a temp file beside `target`; returns it and its hash."""
+        if isinstance(chunks, str):
+            chunks = (chunks,)
+        content_hash = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                for chunk in chunks:
+                    if isinstance(chunk, StaticSegment):
+                        self._write_segment(tmp_file, chunk)
+                        data = chunk.encoded
+                    else:
+                        data = chunk.encode("utf-8")
+                        tmp_file.write(data)
+                    content_hash.update(data)
+                tmp_file.flush()
+                if self._fsync:
+                    os.fsync(tmp_file.fileno())
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return tmp_path, content_hash.hexdigest()
+
+    def _commit(self, tmp_path: str, target: Path) -> None:
+        try:
+            os.chmod(tmp_path, self._target_mode(target))
+            os.replace(tmp_path, target)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        if self._fsync:
+            self._fsync_directory(target.parent)
+
+    def _write_segment(self, out: BinaryIO, segment: StaticSegment) -> None:
+        copied = 0
+        if segment.source_path is not None:
+            out.flush()
+            copied = self._copy_from_source(
+                segment.source_path,
+                segment.source_stamp,
+                len(segment.encoded),
+                out.fileno(),
+            )
+        out.write(memoryview(segment.encoded)[copied:])
+
+    @staticmethod
+    def _copy_from_source(
+        source_path: str, stamp: tuple[int, int] | None, total: int, out_fd: int
+    ) -> int:
+        """Copies as much of the segment as the kernel allows; returns the count."""
+        try:
+            src_fd = os.open(source_path, os.O_RDONLY)
+        except OSError:
+            return 0
+        try:
+            stat = os.fstat(src_fd)
+            if (stat.st_size, stat.st_mtime_ns) != stamp:
+                return 0
+            copied = 0
+            while copied < total:
+                try:
+                    if hasattr(os, "copy_file_range"):
+                        sent = os.copy_file_range(
+                            src_fd, out_fd, total - copied, offset_src=copied
+                        )
+                    else:
+                        sent = os.sendfile(out_fd, src_fd, copied, total - copied)
+                except OSError:
+                    break
+                if sent == 0:
+                    break
+                copied += sent
+            return copied
+        finally:
+            os.close(src_fd)
+
+    @staticmethod
+    def _target_mode(target: Path) -> int:
+        try:
+            return target.stat().st_mode & 0o777
+        except FileNotFoundError:
+            return DEFAULT_FILE_MODE
+
+    @staticmethod
+    def _fsync_directory(directory: Path) -> None:
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
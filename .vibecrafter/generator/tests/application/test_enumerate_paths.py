@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+from vibecrafter.application.use_cases.enumerate_paths import EnumeratePaths
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.models.document_skeleton import slot_marker
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+
+
+def _step(
+    id: int,
+    variable: str,
+    type: StepType = StepType.TEXT,
+    options: str | None = None,
+    parent_id: int | None = None,
+    trigger_value: str | None = None,
+) -> Step:
+    return Step(
+        id=id,
+        parent_id=parent_id,
+        trigger_value=trigger_value,
+        order=id,
+        type=type,
+        question=f"{variable}?",
+        options=options,
+        variable=variable,
+        md_section="datos_proyecto",
+        md_template="- {value}",
+        md_order=id,
+    )
+
+
+def test_execute_yields_every_path_with_text_slots():
+    steps = [
+        _step(1, "NOMBRE"),
+        _step(2, "LENGUAJE", StepType.SELECT, "python|go"),
+        _step(3, "AUTH", StepType.SELECT, "JWT|No", parent_id=2, trigger_value="python"),
+    ]
+    run_wizard = RunWizard(
+        step_repository=CachedStepRepository(steps),
+        user_prompter=HeadlessPrompter(),
+        file_scanner=Mock(),
+    )
+
+    paths = list(EnumeratePaths(run_wizard).execute())
+
+    name = slot_marker("NOMBRE")
+    assert paths == [
+        {"NOMBRE": name, "LENGUAJE": "python", "AUTH": "JWT"},
+        {"NOMBRE": name, "LENGUAJE": "python", "AUTH": "No"},
+        {"NOMBRE": name, "LENGUAJE": "go"},
+    ]
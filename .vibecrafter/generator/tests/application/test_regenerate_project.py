@@ -0,0 +1,219 @@
+import hashlib
+from unittest.mock import Mock
+
+import pytest
+
+from vibecrafter.application.use_cases.regenerate_project import RegenerateProject
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+
+
+def _step(id: int, variable: str, md_section: str, md_template: str) -> Step:
+    return Step(
+        id=id,
+        parent_id=None,
+        trigger_value=None,
+        order=id,
+        type=StepType.TEXT,
+        question=f"{variable}?",
+        options=None,
+        variable=variable,
+        md_section=md_section,
+        md_template=md_template,
+        md_order=id,
+    )
+
+
+class _MemoryStateStore:
+    def __init__(self) -> None:
+        self.states = {}
+
+    def load(self, output_path):
+        return self.states.get(output_path)
+
+    def save(self, output_path, state):
+        self.states[output_path] = state
+
+
+def _writer() -> Mock:
+    """Mock writer that remembers what it wrote, as if on disk."""
+    files: dict[str, bytes] = {}
+    writer = Mock()
+    writer.files = files
+    writer.write.side_effect = lambda path, chunks: files.__setitem__(
+        path, "".join(chunks).encode("utf-8")
+    )
+    writer.digest.side_effect = lambda path: (
+        hashlib.sha256(files[path]).hexdigest() if path in files else None
+    )
+
+    def write_if_changed(path, chunks, force=False):
+        chunks = list(chunks)
+        content_digest = hashlib.sha256("".join(chunks).encode("utf-8")).hexdigest()
+        if not force and writer.digest(path) == content_digest:
+            return content_digest, False
+        writer.write(path, chunks)
+        return content_digest, True
+
+    writer.write_if_changed.side_effect = write_if_changed
+    return writer
+
+
+def _run_wizard() -> RunWizard:
+    steps = [
+        _step(1, "NOMBRE", "datos_proyecto", "- **Nombre:** {value}"),
+        _step(2, "NOTAS", "contexto", "- **Notas:** {value}"),
+    ]
+    return RunWizard(
+        step_repository=CachedStepRepository(steps),
+        user_prompter=HeadlessPrompter(),
+        file_scanner=Mock(),
+    )
+
+
+def _create_use_case(writer, store) -> RegenerateProject:
+    return RegenerateProject(
+        run_wizard=_run_wizard(),
+        render_template=RenderTemplate(writer, "# Instrucciones"),
+        template_writer=writer,
+        state_store=store,
+    )
+
+
+def _seed(uc, writer, answers):
+    session = _run_wizard().execute(answers)
+    uc.write(session, "/tmp/project.md")
+    writer.reset_mock()
+
+
+def test_write_without_state_writes_and_records_answers():
+    writer, store = _writer(), _MemoryStateStore()
+    uc = _create_use_case(writer, store)
+    session = _run_wizard().execute({"NOMBRE": "App", "NOTAS": "x"})
+
+    outcome = uc.write(session, "/tmp/project.md")
+
+    assert outcome.written
+    assert outcome.rendered_sections == ["datos_proyecto", "contexto"]
+    # Chunks reach the writer lazily, never gathered into a list first.
+    assert not isinstance(writer.write_if_changed.call_args[0][1], list)
+    assert "- **Notas:** x" in "".join(writer.write.call_args[0][1])
+    assert store.states["/tmp/project.md"].answers == {"NOMBRE": "App", "NOTAS": "x"}
+
+
+def test_execute_rerenders_only_changed_section():
+    writer, store = _writer(), _MemoryStateStore()
+    uc = _create_use_case(writer, store)
+    _seed(uc, writer, {"NOMBRE": "App", "NOTAS": "x"})
+
+    outcome = uc.execute("/tmp/project.md", {"NOTAS": "y"})
+
+    assert outcome.written
+    assert outcome.rendered_sections == ["contexto"]
+    content = "".join(writer.write.call_args[0][1])
+    assert "- **Nombre:** App" in content
+    assert "- **Notas:** y" in content
+
+
+def test_execute_skips_write_when_content_is_unchanged():
+    writer, store = _writer(), _MemoryStateStore()
+    uc = _create_use_case(writer, store)
+    _seed(uc, writer, {"NOMBRE": "App", "NOTAS": "x"})
+
+    outcome = uc.execute("/tmp/project.md", {"NOTAS": "x"})
+
+    assert not outcome.written
+    assert outcome.rendered_sections == []
+    writer.write.assert_not_called()
+
+
+def test_execute_force_writes_unchanged_content():
+    writer, store = _writer(), _MemoryStateStore()
+    uc = _create_use_case(writer, store)
+    _seed(uc, writer, {"NOMBRE": "App", "NOTAS": "x"})
+
+    outcome = uc.execute("/tmp/project.md", {}, force=True)
+
+    assert outcome.written
+    writer.write.assert_called_once()
+
+
+def test_execute_without_recorded_state_raises():
+    uc = _create_use_case(_writer(), _MemoryStateStore())
+
+    with pytest.raises(WizardError):
+        uc.execute("/tmp/project.md", {"NOTAS": "y"})
+
+
+def test_write_renders_extra_targets_beside_project_md():
+    writer, store = _writer(), _MemoryStateStore()
+    emitter = Mock()
+    emitter.emit.side_effect = lambda document: [f"agents {document.project_name}"]
+    uc = RegenerateProject(
+        run_wizard=_run_wizard(),
+        render_template=RenderTemplate(writer, "# Instrucciones"),
+        template_writer=writer,
+        state_store=store,
+        emitters={"AGENTS.md": emitter},
+    )
+    session = _run_wizard().execute({"NOMBRE": "App", "NOTAS": "x"})
+
+    uc.write(session, "/tmp/out/project.md")
+    second = uc.write(session, "/tmp/out/project.md")
+
+    written = {call[0][0]: "".join(call[0][1]) for call in writer.write.call_args_list}
+    assert set(written) == {"/tmp/out/project.md", "/tmp/out/AGENTS.md"}
+    assert written["/tmp/out/AGENTS.md"] == "agents App"
+    assert not second.written
+
+
+def test_adding_a_target_rewrites_unchanged_answers():
+    writer, store = _writer(), _MemoryStateStore()
+    _seed(_create_use_case(writer, store), writer, {"NOMBRE": "App", "NOTAS": "x"})
+    uc = RegenerateProject(
+        run_wizard=_run_wizard(),
+        render_template=RenderTemplate(writer, "# Instrucciones"),
+        template_writer=writer,
+        state_store=store,
+        emitters={"project.json": Mock(emit=Mock(return_value=["{}"]))},
+    )
+
+    outcome = uc.execute("/tmp/project.md", {})
+
+    assert outcome.written
+    assert writer.write.call_args[0][0] == "/tmp/project.json"
+
+
+def test_write_restores_deleted_or_edited_outputs():
+    writer, store = _writer(), _MemoryStateStore()
+    emitter = Mock(emit=Mock(return_value=["agents"]))
+    uc = RegenerateProject(
+        run_wizard=_run_wizard(),
+        render_template=RenderTemplate(writer, "# Instrucciones"),
+        template_writer=writer,
+        state_store=store,
+        emitters={"AGENTS.md": emitter},
+    )
+    session = _run_wizard().execute({"NOMBRE": "App", "NOTAS": "x"})
+    uc.write(session, "/tmp/out/project.md")
+    original = dict(writer.files)
+    writer.reset_mock()
+
+    del writer.files["/tmp/out/project.md"]
+    writer.files["/tmp/out/AGENTS.md"] = b"edited by hand"
+    outcome = uc.write(session, "/tmp/out/project.md")
+
+    assert outcome.written
+    assert writer.files == original
+    assert writer.write.call_count == 2
+
+    writer.reset_mock()
+    assert not uc.write(session, "/tmp/out/project.md").written
+    writer.write.assert_not_called()
@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
 from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.domain.models.static_segment import StaticSegment
 from vibecrafter.domain.models.step import Step
 from vibecrafter.domain.models.step_result import StepResult
 from vibecrafter.domain.models.step_type import StepType
@@ -45,7 +46,7 @@ def test_execute_renders_markdown_with_correct_sections():
     uc = _create_use_case(writer=writer)
     uc.execute(session, "/tmp/out.md")
 
-    content = writer.write.call_args[0][1]
+    content = "".join(writer.write.call_args[0][1])
     assert "# Proyecto: MiApp" in content
     assert "## 1. Datos del proyecto" in content
     assert "## 2. Contexto adicional" in content
@@ -64,7 +65,7 @@ def test_execute_replaces_value_placeholder():
     uc = _create_use_case(writer=writer)
     uc.execute(session, "/tmp/out.md")
 
-    content = writer.write.call_args[0][1]
+    content = "".join(writer.write.call_args[0][1])
     assert "- **Lenguaje:** Python" in content
     assert "{value}" not in content
 
@@ -80,7 +81,7 @@ def test_execute_appends_instructions_content():
     uc = _create_use_case(writer=writer, instructions="# INSTRUCCIONES AQUI")
     uc.execute(session, "/tmp/out.md")
 
-    content = writer.write.call_args[0][1]
+    content = "".join(writer.write.call_args[0][1])
     assert "# INSTRUCCIONES AQUI" in content
 
 
@@ -99,7 +100,7 @@ def test_execute_handles_empty_optional_values():
     uc = _create_use_case(writer=writer)
     uc.execute(session, "/tmp/out.md")
 
-    content = writer.write.call_args[0][1]
+    content = "".join(writer.write.call_args[0][1])
     assert "- **Notas:** Ninguna" in content
 
 
@@ -129,7 +130,7 @@ def test_execute_converts_escaped_newlines_to_real_newlines():
     uc = _create_use_case(writer=writer)
     uc.execute(session, "/tmp/out.md")
 
-    content = writer.write.call_args[0][1]
+    content = "".join(writer.write.call_args[0][1])
     assert "- **Lenguaje:** python\n  > Docs: `.vibecrafter/docs/languages/python/`" in content
 
 
@@ -148,5 +149,309 @@ def test_execute_renders_doc_reference_with_value():
     uc = _create_use_case(writer=writer)
     uc.execute(session, "/tmp/out.md")
 
-    content = writer.write.call_args[0][1]
+    content = "".join(writer.write.call_args[0][1])
     assert "`.vibecrafter/docs/designs/material-ui.md`" in content
+
+
+def test_execute_resolves_other_session_variables_in_template():
+    writer = Mock()
+    session = WizardSession()
+    session.add_result(StepResult(
+        step=_step("LENGUAJE", "datos_proyecto", "- **Lenguaje:** {value}", 1),
+        value="python",
+    ))
+    session.add_result(StepResult(
+        step=_step("AUTH", "contexto", '- **Auth:** {value}\\n  > `.vibecrafter/docs/languages/{LENGUAJE}/auth.md`', 1),
+        value="JWT",
+    ))
+
+    uc = _create_use_case(writer=writer)
+    uc.execute(session, "/tmp/out.md")
+
+    content = "".join(writer.write.call_args[0][1])
+    assert "`.vibecrafter/docs/languages/python/auth.md`" in content
+
+
+def test_render_yields_same_document_as_joined_lines():
+    session = WizardSession()
+    session.add_result(StepResult(
+        step=_step("NOMBRE", "datos_proyecto", "- {value}", 1),
+        value="App",
+    ))
+    session.add_result(StepResult(
+        step=_step("NOTAS", "contexto", "- {value}", 1),
+        value="n",
+    ))
+
+    uc = _create_use_case(instructions="# I")
+    chunks = list(uc.render(session))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == (
+        "# Proyecto: App\n\n## 1. Datos del proyecto\n\n- App\n\n"
+        "## 2. Contexto adicional\n\n- n\n\n---\n\n# I"
+    )
+
+
+def test_render_without_doc_reader_has_no_bundle():
+    session = WizardSession()
+    uc = _create_use_case(instructions="Lee `.vibecrafter/docs/guia.md`")
+
+    content = "".join(uc.render(session))
+
+    assert "Anexo" not in content
+
+
+def test_render_bundles_referenced_docs_once():
+    reader = Mock()
+    reader.read.side_effect = lambda path: f"contenido de {path}"
+    session = WizardSession()
+    session.add_result(StepResult(
+        step=_step("LANG", "datos_proyecto", "- Ver `.vibecrafter/docs/{value}.md`", 1),
+        value="python",
+    ))
+    uc = RenderTemplate(
+        template_writer=Mock(),
+        instructions_content=(
+            "Lee `.vibecrafter/docs/guia.md` y `.vibecrafter/docs/python.md`"
+        ),
+        doc_reader=reader,
+    )
+
+    content = "".join(uc.render(session))
+
+    assert "## Anexo: documentacion incluida" in content
+    assert "### `.vibecrafter/docs/guia.md`\n\ncontenido de guia.md\n" in content
+    assert content.count("contenido de python.md") == 1
+    assert [c.args[0] for c in reader.read.call_args_list] == ["guia.md", "python.md"]
+
+
+def test_render_bundle_expands_directories_and_skips_missing():
+    reader = Mock()
+    reader.list_md.return_value = ["stacks/a.md", "stacks/b.md"]
+    reader.read.side_effect = lambda path: None if path == "stacks/b.md" else "A"
+    uc = RenderTemplate(
+        template_writer=Mock(),
+        instructions_content="Ver `.vibecrafter/docs/stacks/`",
+        doc_reader=reader,
+    )
+
+    content = "".join(uc.render(WizardSession()))
+
+    reader.list_md.assert_called_once_with("stacks/")
+    assert "### `.vibecrafter/docs/stacks/a.md`" in content
+    assert "stacks/b.md" not in content
+
+
+def test_section_digests_change_only_for_affected_section():
+    uc = _create_use_case()
+
+    def _session(notes: str) -> WizardSession:
+        session = WizardSession()
+        session.add_result(StepResult(
+            step=_step("NOMBRE", "datos_proyecto", "- {value}", 1), value="App"
+        ))
+        session.add_result(StepResult(
+            step=_step("NOTAS", "contexto", "- {value}", 1), value=notes
+        ))
+        return session
+
+    before = uc.section_digests(_session("a"))
+    after = uc.section_digests(_session("b"))
+
+    assert before["datos_proyecto"] == after["datos_proyecto"]
+    assert before["contexto"] != after["contexto"]
+
+
+def test_section_digest_tracks_referenced_variables():
+    uc = _create_use_case()
+
+    def _session(lang: str) -> WizardSession:
+        session = WizardSession()
+        session.add_result(StepResult(
+            step=_step("LENGUAJE", "datos_proyecto", "- {value}", 1), value=lang
+        ))
+        session.add_result(StepResult(
+            step=_step("AUTH", "contexto", "- docs/{LENGUAJE}/{value}", 1),
+            value="jwt",
+        ))
+        return session
+
+    assert (
+        uc.section_digests(_session("python"))["contexto"]
+        != uc.section_digests(_session("go"))["contexto"]
+    )
+
+
+def test_render_uses_given_section_text():
+    session = WizardSession()
+    session.add_result(StepResult(
+        step=_step("NOTAS", "contexto", "- {value}", 1), value="nuevo"
+    ))
+    uc = _create_use_case()
+
+    content = "".join(uc.render(session, {"contexto": "## cacheado\n"}))
+
+    assert "## cacheado\n" in content
+    assert "nuevo" not in content
+    assert uc.render_section(session, "contexto").startswith("## 2. Contexto adicional")
+
+
+def _notes_session(notes: str) -> WizardSession:
+    session = WizardSession()
+    session.add_result(StepResult(
+        step=_step("NOTAS", "contexto", "- {value}", 1), value=notes
+    ))
+    return session
+
+
+def test_render_serves_cache_hits_without_rendering():
+    cache = Mock()
+    cache.get.return_value = "cacheado"
+    uc = RenderTemplate(Mock(), "# I", render_cache=cache, catalog_version="v1")
+
+    content = "".join(uc.render(_notes_session("a")))
+
+    assert content == "cacheado# I"
+    cache.put.assert_not_called()
+
+
+def test_render_stores_misses_in_cache():
+    cache = Mock()
+    cache.get.return_value = None
+    uc = RenderTemplate(Mock(), "# I", render_cache=cache, catalog_version="v1")
+
+    content = "".join(uc.render(_notes_session("a")))
+
+    # The instructions are not stored; a hit yields them again as given.
+    assert content.endswith("# I")
+    cache.put.assert_called_once_with(
+        uc.cache_key(_notes_session("a")), content.removesuffix("# I")
+    )
+
+
+def test_render_cache_hit_yields_the_instructions_segment_itself():
+    cache = Mock()
+    cache.get.return_value = "cacheado"
+    instructions = StaticSegment("# I", "/tmp/instructions.md", (3, 1))
+    uc = RenderTemplate(Mock(), instructions, render_cache=cache)
+
+    chunks = list(uc.render(_notes_session("a")))
+
+    assert chunks == ["cacheado", "# I"]
+    assert chunks[-1] is instructions
+
+
+def test_cache_key_depends_on_answers_catalog_and_instructions():
+    uc = RenderTemplate(Mock(), "# I", catalog_version="v1")
+    key = uc.cache_key(_notes_session("a"))
+
+    assert key == uc.cache_key(_notes_session("a"))
+    assert key != uc.cache_key(_notes_session("b"))
+    other_catalog = RenderTemplate(Mock(), "# I", catalog_version="v2")
+    assert key != other_catalog.cache_key(_notes_session("a"))
+    other_instructions = RenderTemplate(Mock(), "# J", catalog_version="v1")
+    assert key != other_instructions.cache_key(_notes_session("a"))
+
+
+def test_render_with_doc_reader_bypasses_cache():
+    cache = Mock()
+    reader = Mock()
+    reader.read.return_value = None
+    uc = RenderTemplate(Mock(), "# I", doc_reader=reader, render_cache=cache)
+
+    "".join(uc.render(_notes_session("a")))
+
+    cache.get.assert_not_called()
+
+
+def test_build_document_groups_answers_and_collects_references():
+    session = WizardSession()
+    session.add_result(StepResult(
+        step=_step("LENGUAJE", "datos_proyecto", "`.vibecrafter/docs/{value}.md`", 1),
+        value="python",
+    ))
+    uc = _create_use_case(instructions="Lee `.vibecrafter/docs/common/a.md`")
+
+    document = uc.build_document(session)
+
+    assert document.project_name == "Sin nombre"
+    assert [s.id for s in document.sections] == ["datos_proyecto"]
+    assert document.sections[0].answers == (("LENGUAJE", "python"),)
+    assert document.references == ("common/a.md", "python.md")
+
+
+def test_render_document_matches_render():
+    session = _notes_session("Usar Docker")
+    uc = _create_use_case()
+    assert "".join(uc.render_document(uc.build_document(session))) == "".join(
+        uc.render(session)
+    )
+
+
+def _features_session(features: str) -> WizardSession:
+    step = Step(
+        id=3,
+        parent_id=None,
+        trigger_value=None,
+        order=3,
+        type=StepType.MULTILINE,
+        question="Funcionalidades:",
+        options=None,
+        variable="DESC_DETALLADA",
+        md_section="datos_proyecto",
+        md_template="`.vibecrafter/docs/languages/python/conventions.md`",
+        md_order=3,
+    )
+    session = WizardSession()
+    session.add_result(StepResult(step=step, value=features))
+    return session
+
+
+def test_build_document_suggests_docs_per_feature_line():
+    doc_search = Mock()
+    doc_search.search.side_effect = lambda line, limit: {
+        "  - cola de mensajes": [
+            "languages/kotlin/messaging.md",
+            "languages/python/messaging.md",
+        ],
+        "  - modo offline": [
+            "languages/python/conventions.md",
+            "databases/sqlite.md",
+        ],
+    }[line]
+    uc = RenderTemplate(Mock(), "# Instrucciones", doc_search=doc_search)
+
+    document = uc.build_document(
+        _features_session("  - cola de mensajes\n\n  - modo offline")
+    )
+
+    suggestions = document.sections[-1]
+    assert suggestions.id == "sugerencias"
+    assert "- `.vibecrafter/docs/languages/python/messaging.md`" in suggestions.text
+    assert "- `.vibecrafter/docs/databases/sqlite.md`" in suggestions.text
+    assert "kotlin" not in suggestions.text
+    assert "conventions.md`\n" not in suggestions.text
+    assert "languages/python/messaging.md" in document.references
+
+
+def test_build_document_without_hits_has_no_suggestions_section():
+    doc_search = Mock()
+    doc_search.search.return_value = []
+    uc = RenderTemplate(Mock(), "# Instrucciones", doc_search=doc_search)
+
+    document = uc.build_document(_features_session("  - algo"))
+
+    assert [section.id for section in document.sections] == ["datos_proyecto"]
+
+
+def test_cache_key_depends_on_docs_version():
+    doc_search = Mock()
+    doc_search.version.return_value = "v1"
+    uc = RenderTemplate(Mock(), "# Instrucciones", doc_search=doc_search)
+    session = _features_session("  - algo")
+
+    before = uc.cache_key(session)
+    doc_search.version.return_value = "v2"
+
+    assert uc.cache_key(session) != before
@@ -1,6 +1,9 @@
 from unittest.mock import Mock
 
+import pytest
+
 from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.exceptions.wizard_error import InvalidAnswerError
 from vibecrafter.domain.models.step import Step
 from vibecrafter.domain.models.step_type import StepType
 
@@ -159,3 +162,107 @@ def test_execute_processes_root_steps_in_order():
     results = session.all_results()
     assert results[0].step.variable == "A"
     assert results[1].step.variable == "B"
+
+
+def test_execute_with_answers_skips_prompting_for_answered_steps():
+    repo = Mock()
+    prompter = Mock()
+    step1 = _step(id=1, variable="A", order=1)
+    step2 = _step(id=2, variable="B", order=2)
+
+    repo.find_roots.return_value = [step1, step2]
+    repo.find_children.return_value = []
+    prompter.ask_text.return_value = "val_b"
+
+    uc = _create_use_case(repo=repo, prompter=prompter)
+    session = uc.execute({"A": "val_a"})
+
+    prompter.ask_text.assert_called_once_with("Pregunta?")
+    assert session.get_value("A") == "val_a"
+    assert session.get_value("B") == "val_b"
+
+
+def test_execute_with_invalid_select_answer_raises_error():
+    repo = Mock()
+    step = _step(type=StepType.SELECT, options="A|B", variable="CHOICE")
+    repo.find_roots.return_value = [step]
+    repo.find_children.return_value = []
+
+    uc = _create_use_case(repo=repo)
+
+    with pytest.raises(InvalidAnswerError, match="CHOICE"):
+        uc.execute({"CHOICE": "Z"})
+
+
+def test_next_step_returns_first_unanswered_step_with_options():
+    repo = Mock()
+    prompter = Mock()
+    parent = _step(id=1, type=StepType.SELECT, options="web|cli", variable="TIPO")
+    child = _step(id=2, type=StepType.SELECT, options="A|B", variable="FRONT", parent_id=1)
+
+    repo.find_roots.return_value = [parent]
+    repo.find_children.side_effect = lambda pid, tv: [child] if pid == 1 and tv == "web" else []
+
+    uc = _create_use_case(repo=repo, prompter=prompter)
+    pending = uc.next_step({"TIPO": "web"})
+
+    assert pending.step.variable == "FRONT"
+    assert pending.number == 2
+    assert pending.options == ["A", "B"]
+    prompter.ask_select.assert_not_called()
+
+
+def test_next_step_with_complete_answers_returns_none():
+    repo = Mock()
+    repo.find_roots.return_value = [_step(variable="NOMBRE")]
+    repo.find_children.return_value = []
+
+    uc = _create_use_case(repo=repo)
+    assert uc.next_step({"NOMBRE": "App"}) is None
+
+
+def test_execute_journals_prompted_answers_only():
+    repo = Mock()
+    prompter = Mock()
+    journal = Mock()
+    repo.find_roots.return_value = [
+        _step(id=1, variable="NOMBRE"),
+        _step(id=2, variable="NOTAS", order=2),
+    ]
+    repo.find_children.return_value = []
+    prompter.ask_text.return_value = "nuevo"
+
+    uc = RunWizard(
+        step_repository=repo,
+        user_prompter=prompter,
+        file_scanner=Mock(),
+        journal=journal,
+    )
+    session = uc.execute({"NOMBRE": "App"})
+
+    journal.append.assert_called_once_with("NOTAS", "nuevo")
+    prompter.ask_text.assert_called_once()
+    assert session.get_value("NOMBRE") == "App"
+
+
+def test_execute_prefetches_before_asking_select():
+    repo = Mock()
+    prompter = Mock()
+    prefetcher = Mock()
+    step = _step(variable="LENGUAJE", type=StepType.SELECT, options="python|go")
+    repo.find_roots.return_value = [step]
+    repo.find_children.return_value = []
+    prompter.ask_select.side_effect = lambda q, o: (
+        prefetcher.prefetch.assert_called_once_with(step, ["python", "go"], {})
+        or "go"
+    )
+
+    uc = RunWizard(
+        step_repository=repo,
+        user_prompter=prompter,
+        file_scanner=Mock(),
+        prefetcher=prefetcher,
+    )
+    session = uc.execute()
+
+    assert session.get_value("LENGUAJE") == "go"
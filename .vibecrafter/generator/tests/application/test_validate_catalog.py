@@ -0,0 +1,118 @@
+from unittest.mock import Mock
+
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.application.use_cases.validate_catalog import ValidateCatalog
+from vibecrafter.domain.models.catalog_issue import (
+    MISSING_DOC,
+    MISSING_SCAN_PATH,
+    UNREACHABLE_TRIGGER,
+    UNRESOLVED_PLACEHOLDER,
+)
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+
+DOCS = {
+    "languages": ["python"],
+    "languages/python/project_types": ["cli"],
+    "databases": ["sqlite"],
+}
+EXISTING_DOCS = {"languages/python/project_types/cli.md", "databases/sqlite.md"}
+
+
+def _step(
+    id: int,
+    variable: str,
+    type: StepType = StepType.SELECT,
+    options: str | None = None,
+    md_template: str | None = "- {value}",
+    parent_id: int | None = None,
+    trigger_value: str | None = None,
+) -> Step:
+    return Step(
+        id=id,
+        parent_id=parent_id,
+        trigger_value=trigger_value,
+        order=id,
+        type=type,
+        question=f"{variable}?",
+        options=options,
+        variable=variable,
+        md_section="datos_proyecto",
+        md_template=md_template,
+        md_order=id,
+    )
+
+
+def _validate(steps: list[Step]):
+    repo = CachedStepRepository(steps)
+    scanner = Mock()
+    scanner.list_md_files.side_effect = lambda path: DOCS.get(path, [])
+    doc_reader = Mock()
+    doc_reader.read.side_effect = lambda path: "x" if path in EXISTING_DOCS else None
+    doc_reader.list_md.return_value = []
+    run_wizard = RunWizard(repo, HeadlessPrompter(), scanner)
+    return ValidateCatalog(run_wizard, repo, scanner, doc_reader).execute()
+
+
+def test_valid_catalog_has_no_issues():
+    issues = _validate([
+        _step(1, "NOMBRE", StepType.TEXT),
+        _step(2, "LENGUAJE", options="@scan:languages"),
+        _step(
+            3,
+            "TIPO",
+            options="@scan:languages/{LENGUAJE}/project_types",
+            md_template="`.vibecrafter/docs/languages/{LENGUAJE}/project_types/{value}.md`",
+        ),
+        _step(
+            4,
+            "BD",
+            options="@scan:databases|Ninguna",
+            md_template="`.vibecrafter/docs/databases/{value}.md`",
+        ),
+    ])
+
+    assert issues == []
+
+
+def test_reports_placeholder_used_before_it_is_answered():
+    issues = _validate([
+        _step(1, "TIPO", options="@scan:languages/{LENGUAJE}/project_types|Otro"),
+        _step(2, "LENGUAJE", options="@scan:languages"),
+    ])
+
+    assert [(i.step_id, i.kind) for i in issues] == [(1, UNRESOLVED_PLACEHOLDER)]
+
+
+def test_reports_scan_path_without_options():
+    issues = _validate([_step(1, "DISENO", options="@scan:designs|Ninguno")])
+
+    assert [(i.step_id, i.kind) for i in issues] == [(1, MISSING_SCAN_PATH)]
+
+
+def test_reports_trigger_no_option_can_produce():
+    issues = _validate([
+        _step(1, "TIPO", options="api|cli"),
+        _step(2, "FRONT", options="a|b", parent_id=1, trigger_value="webapp"),
+    ])
+
+    assert [(i.step_id, i.kind) for i in issues] == [(2, UNREACHABLE_TRIGGER)]
+
+
+def test_reports_missing_doc_reference():
+    issues = _validate([
+        _step(1, "LENGUAJE", options="@scan:languages"),
+        _step(
+            2,
+            "AUTH",
+            options="No|JWT",
+            md_template="`.vibecrafter/docs/languages/{LENGUAJE}/auth.md`",
+        ),
+    ])
+
+    assert {(i.step_id, i.kind) for i in issues} == {(2, MISSING_DOC)}
+    assert "languages/python/auth.md" in issues[0].message
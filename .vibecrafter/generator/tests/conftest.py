@@ -7,6 +7,9 @@ from vibecrafter.domain.models.step import Step
 from vibecrafter.domain.models.step_result import StepResult
 from vibecrafter.domain.models.step_type import StepType
 from vibecrafter.domain.models.wizard_session import WizardSession
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
+
+GENERATOR_DIR = Path(__file__).resolve().parent.parent
 
 
 @pytest.fixture
@@ -52,8 +55,9 @@ def sample_session(sample_step: Step) -> WizardSession:
 
 @pytest.fixture
 def in_memory_db() -> sqlite3.Connection:
-    seed_path = Path(__file__).resolve().parent.parent / "seed.sql"
     conn = sqlite3.connect(":memory:")
     conn.row_factory = sqlite3.Row
-    conn.executescript(seed_path.read_text(encoding="utf-8"))
+    migrator = SqliteMigrator(conn, str(GENERATOR_DIR / "migrations"))
+    migrator.migrate()
+    migrator.seed((GENERATOR_DIR / "seed.sql").read_text(encoding="utf-8"))
     return conn
@@ -0,0 +1,27 @@
+from vibecrafter.domain.models.compiled_template import compile_template
+
+
+def test_compile_splits_literals_and_placeholders():
+    template = compile_template("- **Lenguaje:** {value} ({LENGUAJE})")
+    assert template.literals == ("- **Lenguaje:** ", " (", ")")
+    assert template.placeholders == ("value", "LENGUAJE")
+
+
+def test_render_resolves_value_and_session_variables():
+    template = compile_template("> `.vibecrafter/docs/languages/{LENGUAJE}/{value}.md`")
+    rendered = template.render("auth", {"LENGUAJE": "python"})
+    assert rendered == "> `.vibecrafter/docs/languages/python/auth.md`"
+
+
+def test_render_keeps_unknown_placeholders_literal():
+    template = compile_template("{value} {UNKNOWN}")
+    assert template.render("x", {}) == "x {UNKNOWN}"
+
+
+def test_compile_converts_escaped_newlines_in_literals_only():
+    template = compile_template("- {value}\\n  > ok")
+    assert template.render("a\\nb", {}) == "- a\\nb\n  > ok"
+
+
+def test_compile_reuses_cached_template():
+    assert compile_template("- {value}") is compile_template("- {value}")
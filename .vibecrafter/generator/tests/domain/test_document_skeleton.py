@@ -0,0 +1,32 @@
+from vibecrafter.domain.models.document_skeleton import (
+    DocumentSkeleton,
+    is_slot_marker,
+    slot_marker,
+)
+
+
+def test_parse_splits_literals_and_slots():
+    text = f"# {slot_marker('NOMBRE')}\n- {slot_marker('NOTAS')}\n"
+
+    skeleton = DocumentSkeleton.parse(text)
+
+    assert skeleton.slots == ("NOMBRE", "NOTAS")
+    assert skeleton.literals == ("# ", "\n- ", "\n")
+
+
+def test_fill_substitutes_values_verbatim():
+    skeleton = DocumentSkeleton.parse(f"- {slot_marker('NOTAS')} y {{X}}")
+
+    assert skeleton.fill({"NOTAS": "usa {LENGUAJE}"}) == "- usa {LENGUAJE} y {X}"
+
+
+def test_fill_returns_none_for_missing_or_blank_values():
+    skeleton = DocumentSkeleton.parse(f"- {slot_marker('NOTAS')}")
+
+    assert skeleton.fill({}) is None
+    assert skeleton.fill({"NOTAS": "  "}) is None
+
+
+def test_is_slot_marker():
+    assert is_slot_marker(slot_marker("NOTAS"))
+    assert not is_slot_marker("python")
@@ -0,0 +1,39 @@
+from vibecrafter.domain.models.option_index import OptionIndex, build_option_index
+
+DESIGNS = (
+    "vercel",
+    "material-ui",
+    "tailwind-ui",
+    "Ñandú Design",
+    "material",
+    "ant-design",
+)
+
+
+def test_empty_query_keeps_original_order_and_limit():
+    assert OptionIndex(DESIGNS).search("", limit=2) == ["vercel", "material-ui"]
+
+
+def test_search_ranks_exact_then_prefix_then_word_prefix_then_substring():
+    index = OptionIndex(("ant-design", "design-x", "xdesign", "design"))
+    assert index.search("design") == ["design", "design-x", "ant-design", "xdesign"]
+
+
+def test_search_ignores_case_and_accents():
+    assert OptionIndex(DESIGNS).search("nandu") == ["Ñandú Design"]
+
+
+def test_search_matches_mid_word_text_through_trigrams():
+    assert OptionIndex(DESIGNS).search("teria") == ["material-ui", "material"]
+
+
+def test_search_tolerates_typos():
+    assert OptionIndex(DESIGNS).search("vercle") == ["vercel"]
+
+
+def test_search_without_match_returns_nothing():
+    assert OptionIndex(DESIGNS).search("zzzz") == []
+
+
+def test_build_option_index_reuses_index_for_same_options():
+    assert build_option_index(DESIGNS) is build_option_index(tuple(DESIGNS))
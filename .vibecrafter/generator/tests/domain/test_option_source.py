@@ -29,3 +29,18 @@ def test_scan_path_without_directive_returns_none():
 def test_static_options_excludes_scan_directives():
     source = OptionSource("@scan:designs/|Ninguno")
     assert source.static_options() == ["Ninguno"]
+
+
+def test_placeholders_lists_scan_path_variables_once():
+    source = OptionSource("@scan:languages/{LENGUAJE}/{TIPO}/{LENGUAJE}|Otro")
+    assert source.placeholders == ("LENGUAJE", "TIPO")
+
+
+def test_resolve_scan_path_substitutes_known_variables_only():
+    source = OptionSource("@scan:languages/{LENGUAJE}/{TIPO}")
+    values = {"LENGUAJE": "python"}
+    assert source.resolve_scan_path(values.get) == "languages/python/{TIPO}"
+
+
+def test_resolve_scan_path_without_directive_returns_none():
+    assert OptionSource("A|B").resolve_scan_path({}.get) is None
@@ -0,0 +1,42 @@
+from vibecrafter.domain.models.document_skeleton import DocumentSkeleton, slot_marker
+from vibecrafter.domain.models.skeleton_catalog import SkeletonCatalog
+
+
+def _catalog() -> SkeletonCatalog:
+    catalog = SkeletonCatalog(tail="# I")
+    catalog.add(
+        {"NOMBRE": slot_marker("NOMBRE"), "LENGUAJE": "python", "DISENO": "material"},
+        DocumentSkeleton.parse(f"python {slot_marker('NOMBRE')} material\n"),
+    )
+    catalog.add(
+        {"NOMBRE": slot_marker("NOMBRE"), "LENGUAJE": "go"},
+        DocumentSkeleton.parse(f"go {slot_marker('NOMBRE')}\n"),
+    )
+    return catalog
+
+
+def test_render_fills_the_skeleton_of_the_answered_path():
+    catalog = _catalog()
+
+    assert len(catalog) == 2
+    assert catalog.render({"NOMBRE": "App", "LENGUAJE": "go"}) == "go App\n# I"
+    assert (
+        catalog.render({"NOMBRE": "App", "LENGUAJE": "python", "DISENO": "material"})
+        == "python App material\n# I"
+    )
+
+
+def test_render_ignores_answers_off_the_path():
+    catalog = _catalog()
+
+    rendered = catalog.render({"NOMBRE": "App", "LENGUAJE": "go", "DISENO": "x"})
+
+    assert rendered == "go App\n# I"
+
+
+def test_render_returns_none_without_a_matching_path_or_slot_value():
+    catalog = _catalog()
+
+    assert catalog.render({"NOMBRE": "App", "LENGUAJE": "cobol"}) is None
+    assert catalog.render({"NOMBRE": "App", "LENGUAJE": "python"}) is None
+    assert catalog.render({"NOMBRE": "", "LENGUAJE": "go"}) is None
@@ -0,0 +1,26 @@
+import pickle
+
+from vibecrafter.domain.models.static_segment import StaticSegment, encode_chunks
+
+
+def test_static_segment_is_a_str_with_preencoded_bytes():
+    segment = StaticSegment("años\n", "/tmp/instructions.md", (6, 1))
+    assert segment == "años\n"
+    assert segment.encoded == "años\n".encode("utf-8")
+    assert "".join(["# A\n", segment]) == "# A\naños\n"
+
+
+def test_static_segment_without_stamp_has_no_source():
+    assert StaticSegment("texto", "/tmp/instructions.md").source_path is None
+
+
+def test_static_segment_survives_pickle_round_trip():
+    segment = StaticSegment("texto", "/tmp/instructions.md", (5, 1))
+    restored = pickle.loads(pickle.dumps(segment))
+    assert isinstance(restored, StaticSegment)
+    assert restored.source_stamp == (5, 1)
+
+
+def test_encode_chunks_matches_plain_encoding():
+    chunks = ["# Proyecto: ñ\n", StaticSegment("cola\n")]
+    assert encode_chunks(chunks) == "".join(chunks).encode("utf-8")
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from vibecrafter.domain.exceptions.wizard_error import InvalidStepError
@@ -52,3 +54,39 @@ def test_create_select_step_without_options_raises_error():
 def test_create_select_step_with_options_succeeds():
     step = _make_step(type=StepType.SELECT, options="A|B|C")
     assert step.options == "A|B|C"
+
+
+def test_step_parses_options_once_at_construction():
+    step = _make_step(
+        type=StepType.SELECT, options="@scan:languages/{LENGUAJE}|Ninguno"
+    )
+    assert step.option_source is not None
+    assert step.option_source.placeholders == ("LENGUAJE",)
+    assert step.option_source.static_options() == ["Ninguno"]
+
+
+def test_step_without_options_has_no_option_source():
+    assert _make_step().option_source is None
+
+
+def test_step_is_slotted():
+    step = _make_step()
+    assert not hasattr(step, "__dict__")
+
+
+def test_steps_share_interned_strings_and_option_sources():
+    options = "".join(["A|", "B"])
+    first = _make_step(type=StepType.SELECT, options=options, md_section="sec")
+    second = _make_step(
+        id=2, type=StepType.SELECT, options="".join(["A", "|B"]), md_section="sec"
+    )
+    assert first.options is second.options
+    assert first.question is second.question
+    assert first.option_source is second.option_source
+
+
+def test_step_survives_pickle_round_trip():
+    step = _make_step(type=StepType.SELECT, options="@scan:languages|Ninguno")
+    restored = pickle.loads(pickle.dumps(step))
+    assert restored == step
+    assert restored.option_source == step.option_source
@@ -65,3 +65,10 @@ def test_results_by_section_excludes_null_template():
 
     grouped = session.results_by_section()
     assert len(grouped) == 0
+
+
+def test_get_value_returns_first_value_for_repeated_variable():
+    session = WizardSession()
+    session.add_result(StepResult(step=_step("DISENO"), value="material"))
+    session.add_result(StepResult(step=_step("DISENO"), value="minimal"))
+    assert session.get_value("DISENO") == "material"
@@ -0,0 +1,119 @@
+import io
+
+import pytest
+
+from vibecrafter.infrastructure.prompters.ansi_prompter import (
+    AnsiPrompter,
+    fit,
+    visible_width,
+)
+
+
+class _Output(io.StringIO):
+    """Records each write separately, so frames can be told apart."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return super().write(text)
+
+
+def _prompter(
+    answers: str, rows: int = 40, columns: int = 80
+) -> tuple[AnsiPrompter, _Output]:
+    output = _Output()
+    prompter = AnsiPrompter(io.StringIO(answers), output, rows=rows, columns=columns)
+    return prompter, output
+
+
+def test_first_frame_clears_once_then_steps_only_redraw_changed_rows():
+    prompter, output = _prompter("\nApp\nBreve\n")
+    prompter.show_welcome()
+    prompter.show_step_header(1, "Nombre?")
+    assert prompter.ask_text("Nombre?") == "App"
+    prompter.show_step_header(2, "Descripcion?")
+    assert prompter.ask_text("Descripcion?") == "Breve"
+
+    assert "\x1b[2J" in output.writes[0]
+    assert len(output.writes) == 3
+    second_step = output.writes[2]
+    assert "\x1b[2J" not in second_step
+    assert "Paso 2" in second_step and "Descripcion?" in second_step
+    # The blank row under the step header is already on screen.
+    assert "\x1b[4;1H\x1b[K" not in second_step
+
+
+def test_step_cost_stays_flat_as_steps_accumulate():
+    prompter, output = _prompter("x\n" * 60)
+    sizes = []
+    for number in range(1, 61):
+        prompter.show_step_header(number, "Pregunta?")
+        prompter.ask_text("Pregunta?")
+        sizes.append(len(output.writes[-1]))
+
+    # Only the digits of the step number vary.
+    assert max(sizes[1:]) - min(sizes[1:]) <= 1
+
+
+def test_ask_select_reprompts_below_error_and_returns_option():
+    prompter, output = _prompter("9\n2\n")
+    assert prompter.ask_select("Lenguaje?", ["python", "go"]) == "go"
+    assert "Opcion no valida" in output.writes[-1]
+
+
+def test_frame_taller_than_screen_repaints_and_resyncs():
+    prompter, output = _prompter("1\nApp\n", rows=8)
+    prompter.ask_select("Lenguaje?", ["a", "b", "c", "d", "e"])
+    prompter.show_step_header(2, "Nombre?")
+    prompter.ask_text("Nombre?")
+
+    assert output.writes[0].startswith("\x1b[2J\x1b[H")
+    assert "Generador de Proyecto" in output.writes[1]
+
+
+def test_ask_text_at_end_of_input_raises_eof():
+    prompter, _ = _prompter("")
+    with pytest.raises(EOFError):
+        prompter.ask_text("Nombre?")
+
+
+def test_long_select_narrows_on_each_key_and_picks_with_arrows():
+    options = [f"design-{n}" for n in range(30)] + ["material-ui", "material"]
+    prompter, output = _prompter("mat\x1b[B\r")
+
+    assert prompter.ask_select("Diseno?", options) == "material"
+    # One frame per keystroke, each redrawing only what changed.
+    assert len(output.writes) == 5
+    assert "design-0" not in output.writes[-1]
+
+
+def test_fit_truncates_visible_text_and_keeps_colour_codes():
+    row = "\x1b[1mabcdefghij\x1b[0m"
+
+    assert fit(row, 20) == row
+    assert fit(row, 6) == "\x1b[1mabcd…\x1b[0m"
+    assert visible_width(fit("日本語のテキスト", 8)) <= 7
+
+
+def test_rows_wider_than_the_terminal_are_truncated_not_wrapped():
+    prompter, output = _prompter("1\n", columns=20)
+    prompter.show_step_header(1, "Q")
+    question = "Una pregunta bastante mas larga que la terminal?"
+    assert prompter.ask_select(question, ["x", "y"]) == "x"
+
+    rows = output.writes[-1].replace("\x1b[2J\x1b[H", "").split("\n")
+    assert all(visible_width(row) < 20 for row in rows)
+
+
+def test_wrapped_answer_echo_forces_a_full_repaint():
+    answers = "una respuesta que no cabe en la fila\nx\n"
+    prompter, output = _prompter(answers, columns=20)
+    prompter.show_step_header(1, "Nombre?")
+    prompter.ask_text("Nombre?")
+    prompter.show_step_header(2, "Notas?")
+    prompter.ask_text("Notas?")
+
+    assert "\x1b[2J" in output.writes[-1]
@@ -0,0 +1,90 @@
+import json
+import tempfile
+from pathlib import Path
+
+from vibecrafter.infrastructure.batch.answer_spec_loader import AnswerSpecLoader
+
+
+def test_load_json_file_uses_stem_as_name_and_default_output():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spec_path = Path(tmpdir) / "billing.json"
+        spec_path.write_text(json.dumps({"NOMBRE": "Billing", "LENGUAJE": "python"}))
+
+        specs = list(AnswerSpecLoader("out").load([str(spec_path)]))
+
+        assert len(specs) == 1
+        assert specs[0].name == "billing"
+        assert specs[0].answers == {"NOMBRE": "Billing", "LENGUAJE": "python"}
+        assert specs[0].output_path == str(Path("out") / "billing" / "project.md")
+
+
+def test_load_toml_file_with_answers_table_and_output():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spec_path = Path(tmpdir) / "spec.toml"
+        spec_path.write_text(
+            'name = "crm"\noutput = "/tmp/crm.md"\n\n[answers]\nNOMBRE = "CRM"\n'
+        )
+
+        spec = next(AnswerSpecLoader("out").load([str(spec_path)]))
+
+        assert spec.name == "crm"
+        assert spec.output_path == "/tmp/crm.md"
+        assert spec.answers == {"NOMBRE": "CRM"}
+
+
+def test_load_directory_reads_jsonl_lines_as_specs():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lines = [json.dumps({"NOMBRE": "A"}), "", json.dumps({"NOMBRE": "B"})]
+        (Path(tmpdir) / "many.jsonl").write_text("\n".join(lines))
+        (Path(tmpdir) / "notes.txt").write_text("ignored")
+
+        specs = list(AnswerSpecLoader("out").load([tmpdir]))
+
+        assert [spec.answers["NOMBRE"] for spec in specs] == ["A", "B"]
+        assert specs[0].name == "many-1"
+
+
+def test_load_formats_list_values_as_multiline_answer():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spec_path = Path(tmpdir) / "spec.json"
+        spec_path.write_text(json.dumps({"DESC_DETALLADA": ["Login", "Pagos"]}))
+
+        spec = next(AnswerSpecLoader("out").load([str(spec_path)]))
+
+        assert spec.answers["DESC_DETALLADA"] == "  - Login\n  - Pagos"
+
+
+def test_load_keeps_json_and_toml_boolean_spelling():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spec_path = Path(tmpdir) / "spec.toml"
+        spec_path.write_text('DOCKER = true\nPUERTO = 8080\nEXTRAS = [false, "x"]\n')
+
+        spec = next(AnswerSpecLoader("out").load([str(spec_path)]))
+
+        assert spec.answers == {
+            "DOCKER": "true",
+            "PUERTO": "8080",
+            "EXTRAS": "  - false\n  - x",
+        }
+
+
+def test_load_reports_unparseable_sources_as_failed_specs():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "a.json").write_text("{not json")
+        (Path(tmpdir) / "b.toml").write_text("NOMBRE = ")
+        (Path(tmpdir) / "c.json").write_text(json.dumps({"NOMBRE": None}))
+        lines = [json.dumps({"NOMBRE": "A"}), "{broken", json.dumps({"NOMBRE": "B"})]
+        (Path(tmpdir) / "d.jsonl").write_text("\n".join(lines))
+
+        specs = list(AnswerSpecLoader("out").load([tmpdir]))
+
+        assert [(spec.name, spec.error is None) for spec in specs] == [
+            ("a", False),
+            ("b", False),
+            ("c", False),
+            ("d-1", True),
+            ("d-2", False),
+            ("d-3", True),
+        ]
+        assert specs[0].error.startswith("JSONDecodeError")
+        assert "NOMBRE" in specs[2].error
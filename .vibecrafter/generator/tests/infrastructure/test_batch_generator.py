@@ -0,0 +1,89 @@
+import sqlite3
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+from vibecrafter.infrastructure.batch.answer_spec import AnswerSpec
+from vibecrafter.infrastructure.batch.batch_generator import BatchGenerator
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
+
+VALID_ANSWERS = {
+    "NOMBRE": "MiApp",
+    "DESC_BREVE": "Una app",
+    "DESC_DETALLADA": "  - Login",
+    "LENGUAJE": "python",
+    "TIPO_PROYECTO": "api-rest",
+    "AUTH": "JWT",
+    "BASE_DATOS": "postgresql",
+    "TESTING": "Unitarios",
+    "NOTAS": "",
+}
+
+
+def _paths(tmpdir: str) -> GeneratorPaths:
+    default = GeneratorPaths.default()
+    db_path = Path(tmpdir) / "steps.db"
+    conn = sqlite3.connect(db_path)
+    migrator = SqliteMigrator(conn, str(default.migrations_dir))
+    migrator.migrate()
+    migrator.seed(default.seed_path.read_text(encoding="utf-8"))
+    conn.close()
+    return replace(
+        default,
+        db_path=db_path,
+        snapshot_path=Path(tmpdir) / "steps.snapshot",
+        docs_index_path=Path(tmpdir) / "docs_index.json",
+        doc_search_path=Path(tmpdir) / "docs_search.json",
+        output_path=Path(tmpdir) / "project.md",
+    )
+
+
+def test_execute_generates_every_spec_and_reports_failures():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ok_output = Path(tmpdir) / "ok" / "project.md"
+        specs = [
+            AnswerSpec(name="ok", answers=VALID_ANSWERS, output_path=str(ok_output)),
+            AnswerSpec(
+                name="incomplete",
+                answers={"NOMBRE": "X"},
+                output_path=str(Path(tmpdir) / "bad" / "project.md"),
+            ),
+            AnswerSpec(
+                name="unparseable",
+                answers={},
+                output_path="",
+                error="JSONDecodeError: Expecting value",
+            ),
+        ]
+
+        report = BatchGenerator(paths=_paths(tmpdir), workers=2).execute(specs)
+
+        assert report.succeeded == 1
+        assert [name for name, _ in report.failures] == ["incomplete", "unparseable"]
+        assert "MissingAnswerError" in report.failures[0][1]
+        assert report.failures[1][1] == "JSONDecodeError: Expecting value"
+        assert "# Proyecto: MiApp" in ok_output.read_text(encoding="utf-8")
+        assert report.total == 3
+
+
+def test_doc_suggestions_are_opt_in():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = _paths(tmpdir)
+        plain = Path(tmpdir) / "plain" / "project.md"
+        suggested = Path(tmpdir) / "suggested" / "project.md"
+
+        BatchGenerator(paths=paths, workers=1).execute(
+            [AnswerSpec(name="plain", answers=VALID_ANSWERS, output_path=str(plain))]
+        )
+        assert "Documentacion sugerida" not in plain.read_text(encoding="utf-8")
+        assert not paths.doc_search_path.exists()
+
+        BatchGenerator(paths=paths, workers=1, suggest_docs=True).execute(
+            [
+                AnswerSpec(
+                    name="suggested", answers=VALID_ANSWERS, output_path=str(suggested)
+                )
+            ]
+        )
+        assert paths.doc_search_path.exists()
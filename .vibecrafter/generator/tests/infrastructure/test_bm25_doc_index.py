@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from vibecrafter.infrastructure.repositories.bm25_doc_index import (
+    Bm25DocIndex,
+    tokenize,
+)
+
+
+def _docs_tree(tmpdir: str) -> Path:
+    docs = Path(tmpdir) / "docs"
+    (docs / "languages" / "python").mkdir(parents=True)
+    (docs / "languages" / "python" / "messaging.md").write_text(
+        "# Python - Mensajeria y Eventos\n\nColas de mensajes con RabbitMQ o Kafka."
+    )
+    (docs / "languages" / "python" / "auth.md").write_text(
+        "# Python - Autenticacion\n\nLogin con JWT y refresh tokens."
+    )
+    (docs / "databases").mkdir()
+    (docs / "databases" / "sqlite.md").write_text(
+        "# SQLite\n\nBase de datos embebida, util para apps offline."
+    )
+    return docs
+
+
+def test_tokenize_normalises_and_stems():
+    assert tokenize("Mensajería de las COLAS") == ["mensaj", "colas"]
+    assert tokenize("mensajes") == ["mensaj"]
+
+
+def test_search_ranks_matching_docs_first():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        index = Bm25DocIndex.load(str(_docs_tree(tmpdir)))
+
+        assert index.search("procesar pedidos con una cola de mensajes", 2) == [
+            "languages/python/messaging.md"
+        ]
+        assert index.search("login con JWT", 2)[0] == "languages/python/auth.md"
+        assert index.search("algo sin relacion", 2) == []
+
+
+def test_load_persists_term_frequencies_and_reuses_them():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = _docs_tree(tmpdir)
+        index_path = Path(tmpdir) / "docs_search.json"
+
+        first = Bm25DocIndex.load(str(docs), str(index_path))
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+        second = Bm25DocIndex.load(str(docs), str(index_path))
+
+        assert payload["docs"]["databases/sqlite.md"]["terms"]["offlin"] == 1
+        assert not second.refresh()
+        assert second.version() == first.version()
+
+
+def test_refresh_picks_up_changed_and_removed_docs():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = _docs_tree(tmpdir)
+        index = Bm25DocIndex.load(str(docs))
+        version = index.version()
+
+        sqlite = docs / "databases" / "sqlite.md"
+        sqlite.write_text("# SQLite\n\nSincronizacion offline con replicas.")
+        os.utime(sqlite, ns=(1, 1))
+        (docs / "languages" / "python" / "auth.md").unlink()
+
+        assert index.refresh()
+        assert index.search("sincronizacion offline con replicas", 3) == ["databases/sqlite.md"]
+        assert index.search("login JWT", 3) == []
+        assert index.version() != version
+
+
+def test_load_skips_docs_that_are_not_utf8():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = _docs_tree(tmpdir)
+        latin1 = docs / "databases" / "latin1.md"
+        latin1.write_bytes("# Mensajería\n".encode("latin-1"))
+
+        index = Bm25DocIndex.load(str(docs), str(Path(tmpdir) / "search.json"))
+
+        found = index.search("mensajeria colas", 5)
+        assert found[0] == "languages/python/messaging.md"
+        assert "databases/latin1.md" not in found
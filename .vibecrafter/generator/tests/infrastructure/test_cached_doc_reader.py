@@ -0,0 +1,96 @@
+import os
+
+from vibecrafter.infrastructure.repositories.cached_doc_reader import CachedDocReader
+from vibecrafter.infrastructure.repositories.docs_index import DocsIndex
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_read_returns_content(tmp_path):
+    _write(tmp_path / "guia.md", "# Guia\n")
+    reader = CachedDocReader(str(tmp_path))
+
+    assert reader.read("guia.md") == "# Guia\n"
+
+
+def test_read_reuses_blob_while_file_is_unchanged(tmp_path):
+    _write(tmp_path / "guia.md", "# Guia\n")
+    reader = CachedDocReader(str(tmp_path))
+
+    first = reader.read_bytes("guia.md")
+    second = reader.read_bytes("guia.md")
+
+    assert first is second
+
+
+def test_identical_docs_share_one_blob(tmp_path):
+    _write(tmp_path / "a.md", "igual")
+    _write(tmp_path / "sub" / "b.md", "igual")
+    reader = CachedDocReader(str(tmp_path))
+
+    assert reader.read_bytes("a.md") is reader.read_bytes("sub/b.md")
+    assert reader.cached_blob_count() == 1
+
+
+def test_rewriting_one_of_two_identical_docs_leaves_the_other_intact(tmp_path):
+    _write(tmp_path / "a.md", "same content")
+    _write(tmp_path / "b.md", "same content")
+    reader = CachedDocReader(str(tmp_path))
+    reader.read("a.md")
+    held = reader.read_bytes("b.md")
+
+    with open(tmp_path / "a.md", "r+b") as doc:
+        doc.write(b"CHANGED!!!!!")
+
+    assert reader.read("b.md") == "same content"
+    assert held == b"same content"
+
+
+def test_read_detects_changed_file(tmp_path):
+    doc = tmp_path / "guia.md"
+    _write(doc, "v1")
+    reader = CachedDocReader(str(tmp_path))
+    reader.read("guia.md")
+
+    _write(doc, "version 2")
+    stat = doc.stat()
+    os.utime(doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert reader.read("guia.md") == "version 2"
+    assert reader.cached_blob_count() == 1
+
+
+def test_read_empty_file(tmp_path):
+    _write(tmp_path / "vacio.md", "")
+    reader = CachedDocReader(str(tmp_path))
+
+    assert reader.read("vacio.md") == ""
+
+
+def test_read_missing_or_outside_returns_none(tmp_path):
+    _write(tmp_path / "secreto.md", "x")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    reader = CachedDocReader(str(docs))
+
+    assert reader.read("no_existe.md") is None
+    assert reader.read("../secreto.md") is None
+
+
+def test_list_md_with_and_without_index(tmp_path):
+    _write(tmp_path / "stacks" / "python.md", "")
+    _write(tmp_path / "stacks" / "go.md", "")
+    _write(tmp_path / "stacks" / "notas.txt", "")
+
+    assert CachedDocReader(str(tmp_path)).list_md("stacks/") == [
+        "stacks/go.md",
+        "stacks/python.md",
+    ]
+    index = DocsIndex.load(str(tmp_path))
+    assert CachedDocReader(str(tmp_path), index).list_md("stacks/") == [
+        "stacks/go.md",
+        "stacks/python.md",
+    ]
@@ -0,0 +1,64 @@
+import sqlite3
+
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+from vibecrafter.infrastructure.repositories.sqlite_step_repository import (
+    SqliteStepRepository,
+)
+
+
+def _step(id: int, parent_id: int | None = None, trigger_value: str | None = None, order: int = 1) -> Step:
+    return Step(
+        id=id,
+        parent_id=parent_id,
+        trigger_value=trigger_value,
+        order=order,
+        type=StepType.TEXT,
+        question="q",
+        options=None,
+        variable=f"VAR_{id}",
+        md_section="sec",
+        md_template="- {value}",
+        md_order=1,
+    )
+
+
+def test_find_roots_returns_root_steps_sorted_by_order():
+    repo = CachedStepRepository([_step(2, order=2), _step(1, order=1), _step(3, parent_id=1)])
+    assert [step.id for step in repo.find_roots()] == [1, 2]
+
+
+def test_find_children_merges_null_trigger_children_sorted_by_order():
+    repo = CachedStepRepository([
+        _step(1),
+        _step(2, parent_id=1, trigger_value="web", order=2),
+        _step(3, parent_id=1, trigger_value=None, order=1),
+        _step(4, parent_id=1, trigger_value="cli", order=3),
+    ])
+    assert [step.id for step in repo.find_children(1, "web")] == [3, 2]
+
+
+def test_find_children_with_unknown_trigger_returns_only_null_trigger_children():
+    repo = CachedStepRepository([_step(1), _step(2, parent_id=1, trigger_value="web"), _step(3, parent_id=1)])
+    assert [step.id for step in repo.find_children(1, "other")] == [3]
+    assert repo.find_children(99, "web") == []
+
+
+def test_find_children_returns_copy_of_index():
+    repo = CachedStepRepository([_step(1), _step(2, parent_id=1)])
+    repo.find_children(1, "x").clear()
+    assert len(repo.find_children(1, "x")) == 1
+
+
+def test_matches_sqlite_repository_on_seed_catalog(in_memory_db: sqlite3.Connection):
+    sqlite_repo = SqliteStepRepository.__new__(SqliteStepRepository)
+    sqlite_repo._connection = in_memory_db
+    repo = CachedStepRepository(sqlite_repo.find_all())
+
+    assert repo.find_roots() == sqlite_repo.find_roots()
+    for step in sqlite_repo.find_all():
+        for trigger in ("webapp", "cli", "android-app", "python", "kotlin", "other"):
+            assert repo.find_children(step.id, trigger) == sqlite_repo.find_children(step.id, trigger)
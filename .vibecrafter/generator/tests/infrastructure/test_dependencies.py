@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from vibecrafter.infrastructure.config import dependencies
+from vibecrafter.infrastructure.config.dependencies import create_prompter
+from vibecrafter.infrastructure.prompters.ansi_prompter import AnsiPrompter
+from vibecrafter.infrastructure.prompters.plain_prompter import PlainPrompter
+
+
+class _Tty(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.mark.parametrize("ui", ["rich", "ansi"])
+def test_dumb_terminal_falls_back_to_plain_prompter(monkeypatch, ui):
+    monkeypatch.setenv("TERM", "dumb")
+    monkeypatch.setattr(dependencies.sys, "stdout", _Tty())
+
+    assert isinstance(create_prompter(ui), PlainPrompter)
+
+
+@pytest.mark.parametrize("ui", ["rich", "ansi"])
+def test_redirected_stdout_falls_back_to_plain_prompter(monkeypatch, ui):
+    monkeypatch.setenv("TERM", "xterm-256color")
+    monkeypatch.setattr(dependencies.sys, "stdout", io.StringIO())
+
+    assert isinstance(create_prompter(ui), PlainPrompter)
+
+
+def test_capable_terminal_keeps_the_requested_prompter(monkeypatch):
+    monkeypatch.setenv("TERM", "xterm-256color")
+    monkeypatch.setattr(dependencies.sys, "stdout", _Tty())
+
+    assert isinstance(create_prompter("ansi"), AnsiPrompter)
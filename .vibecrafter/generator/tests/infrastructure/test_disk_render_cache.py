@@ -0,0 +1,40 @@
+import os
+
+from vibecrafter.infrastructure.cache.disk_render_cache import DiskRenderCache
+
+
+def test_put_then_get_across_instances(tmp_path):
+    DiskRenderCache(str(tmp_path), max_bytes=100).put("k1", "# Proyecto\n")
+
+    assert DiskRenderCache(str(tmp_path), max_bytes=100).get("k1") == "# Proyecto\n"
+
+
+def test_get_missing_key_returns_none(tmp_path):
+    assert DiskRenderCache(str(tmp_path), max_bytes=100).get("k1") is None
+
+
+def test_put_evicts_least_recently_used_files(tmp_path):
+    cache = DiskRenderCache(str(tmp_path), max_bytes=10)
+    cache.put("old", "aaaa")
+    cache.put("used", "bbbb")
+    os.utime(tmp_path / "old.md", ns=(1, 1))
+    os.utime(tmp_path / "used.md", ns=(2, 2))
+    cache.get("used")
+
+    cache.put("new", "cccc")
+
+    assert cache.get("old") is None
+    assert cache.get("used") == "bbbb"
+    assert cache.get("new") == "cccc"
+
+
+def test_overwriting_a_key_does_not_trigger_eviction(tmp_path, monkeypatch):
+    cache = DiskRenderCache(str(tmp_path), max_bytes=10)
+    evictions = []
+    monkeypatch.setattr(cache, "_evict", lambda: evictions.append(True))
+
+    for _ in range(5):
+        cache.put("same", "aaaa")
+
+    assert evictions == []
+    assert cache.get("same") == "aaaa"
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from vibecrafter.infrastructure.repositories.docs_index import DocsIndex
+
+
+def _docs_tree(tmpdir: str) -> Path:
+    docs = Path(tmpdir) / "docs"
+    (docs / "designs").mkdir(parents=True)
+    (docs / "designs" / "vercel.md").write_text("content")
+    (docs / "designs" / "material-ui.md").write_text("content")
+    (docs / "languages" / "python" / "project_types").mkdir(parents=True)
+    (docs / "languages" / "python" / "project_types" / "cli.md").write_text("content")
+    return docs
+
+
+def test_load_indexes_every_directory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = _docs_tree(tmpdir)
+        index = DocsIndex.load(str(docs))
+
+        assert index.directory("designs").md_stems == ["material-ui", "vercel"]
+        assert index.directory("languages").subdirs == ["python"]
+        assert index.directory("languages/python/project_types/").md_stems == ["cli"]
+        assert index.directory("missing") is None
+
+
+def test_load_persists_manifest_as_json():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = _docs_tree(tmpdir)
+        manifest = Path(tmpdir) / "docs_index.json"
+
+        DocsIndex.load(str(docs), str(manifest))
+
+        payload = json.loads(manifest.read_text(encoding="utf-8"))
+        assert payload["directories"]["designs"]["md"] == ["material-ui", "vercel"]
+
+
+def test_refresh_rescans_only_directories_whose_mtime_changed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = _docs_tree(tmpdir)
+        manifest = Path(tmpdir) / "docs_index.json"
+        DocsIndex.load(str(docs), str(manifest))
+
+        # A stale manifest entry for an unchanged directory is trusted as-is.
+        payload = json.loads(manifest.read_text(encoding="utf-8"))
+        payload["directories"]["designs"]["md"] = ["cached"]
+        manifest.write_text(json.dumps(payload), encoding="utf-8")
+        (docs / "languages" / "kotlin").mkdir()
+        stat = (docs / "languages").stat()
+        os.utime(docs / "languages", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        index = DocsIndex.load(str(docs), str(manifest))
+
+        assert index.directory("designs").md_stems == ["cached"]
+        assert index.directory("languages").subdirs == ["kotlin", "python"]
+
+
+def test_refresh_drops_removed_directories():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = _docs_tree(tmpdir)
+        index = DocsIndex.load(str(docs))
+
+        (docs / "designs" / "vercel.md").unlink()
+        (docs / "designs" / "material-ui.md").unlink()
+        (docs / "designs").rmdir()
+
+        assert index.refresh() is True
+        assert index.directory("designs") is None
@@ -0,0 +1,43 @@
+from vibecrafter.infrastructure.repositories.file_answer_journal import (
+    FileAnswerJournal,
+)
+
+
+def test_append_then_replay(tmp_path):
+    journal = FileAnswerJournal(str(tmp_path / "session.journal"))
+
+    journal.append("NOMBRE", "App")
+    journal.append("DESC_DETALLADA", "  - uno\n  - dos")
+
+    replayed = FileAnswerJournal(str(tmp_path / "session.journal")).replay()
+    assert replayed == {"NOMBRE": "App", "DESC_DETALLADA": "  - uno\n  - dos"}
+
+
+def test_replay_ignores_torn_last_line(tmp_path):
+    path = tmp_path / "session.journal"
+    path.write_text('["NOMBRE", "App"]\n["NOTAS", "sin cerr', encoding="utf-8")
+
+    assert FileAnswerJournal(str(path)).replay() == {"NOMBRE": "App"}
+
+
+def test_replay_keeps_first_answer_per_variable(tmp_path):
+    journal = FileAnswerJournal(str(tmp_path / "session.journal"))
+    journal.append("DISENO", "material")
+    journal.append("DISENO", "minimal")
+
+    assert journal.replay() == {"DISENO": "material"}
+
+
+def test_replay_without_file_is_empty(tmp_path):
+    assert FileAnswerJournal(str(tmp_path / "session.journal")).replay() == {}
+
+
+def test_clear_removes_journal(tmp_path):
+    path = tmp_path / "session.journal"
+    journal = FileAnswerJournal(str(path), fsync=True)
+    journal.append("NOMBRE", "App")
+
+    journal.clear()
+
+    assert not path.exists()
+    assert journal.replay() == {}
@@ -1,7 +1,24 @@
+import hashlib
+import os
 import tempfile
 from pathlib import Path
 
-from vibecrafter.infrastructure.writers.file_template_writer import FileTemplateWriter
+import pytest
+
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.domain.models.static_segment import StaticSegment
+from vibecrafter.domain.models.wizard_session import WizardSession
+from vibecrafter.infrastructure.cache.lru_render_cache import LruRenderCache
+from vibecrafter.infrastructure.writers.file_template_writer import (
+    DEFAULT_FILE_MODE,
+    FileTemplateWriter,
+)
+
+
+def _segment(source: Path, text: str) -> StaticSegment:
+    source.write_text(text, encoding="utf-8")
+    stat = source.stat()
+    return StaticSegment(text, str(source), (stat.st_size, stat.st_mtime_ns))
 
 
 def test_write_creates_file_with_content():
@@ -22,3 +39,131 @@ def test_write_overwrites_existing_file():
         writer.write(path, "new content")
 
         assert Path(path).read_text(encoding="utf-8") == "new content"
+
+
+def test_write_streams_chunks_in_order():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = str(Path(tmpdir) / "output.md")
+        writer = FileTemplateWriter(fsync=True)
+        writer.write(path, (chunk for chunk in ["# A\n", "\n", "body"]))
+
+        assert Path(path).read_text(encoding="utf-8") == "# A\n\nbody"
+        assert [p.name for p in Path(tmpdir).iterdir()] == ["output.md"]
+
+
+def test_write_failure_keeps_previous_file_and_removes_temp():
+    def failing_chunks():
+        yield "partial"
+        raise RuntimeError("render failed")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "output.md"
+        path.write_text("old content")
+
+        writer = FileTemplateWriter()
+        with pytest.raises(RuntimeError):
+            writer.write(str(path), failing_chunks())
+
+        assert path.read_text(encoding="utf-8") == "old content"
+        assert [p.name for p in Path(tmpdir).iterdir()] == ["output.md"]
+
+
+def test_write_splices_static_segment_between_dynamic_chunks():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tail = "## Instrucciones ñ\n" * 500
+        segment = _segment(Path(tmpdir) / "instructions.md", tail)
+        path = Path(tmpdir) / "output.md"
+
+        FileTemplateWriter().write(str(path), ["# Proyecto\n", segment, "fin\n"])
+
+        assert path.read_text(encoding="utf-8") == "# Proyecto\n" + tail + "fin\n"
+
+
+def test_write_uses_preloaded_bytes_when_source_changed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "instructions.md"
+        segment = _segment(source, "original\n")
+        source.write_text("edited since load\n", encoding="utf-8")
+        os.utime(source, ns=(0, 0))
+        path = Path(tmpdir) / "output.md"
+
+        FileTemplateWriter().write(str(path), ["# A\n", segment])
+
+        assert path.read_text(encoding="utf-8") == "# A\noriginal\n"
+
+
+def test_write_never_touches_the_process_umask(monkeypatch):
+    def fail(_mask: int) -> int:
+        raise AssertionError("umask changed while writing")
+
+    monkeypatch.setattr(os, "umask", fail)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "output.md"
+        FileTemplateWriter().write(str(path), "content")
+
+        assert path.stat().st_mode & 0o777 == DEFAULT_FILE_MODE
+
+
+def test_digest_matches_written_bytes_and_is_none_when_missing():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = str(Path(tmpdir) / "output.md")
+        writer = FileTemplateWriter()
+        assert writer.digest(path) is None
+
+        writer.write(path, ["á", "b"])
+
+        assert writer.digest(path) == hashlib.sha256("áb".encode("utf-8")).hexdigest()
+
+
+def test_write_if_changed_keeps_identical_file_and_removes_temp():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "output.md"
+        writer = FileTemplateWriter()
+        first_digest, first_written = writer.write_if_changed(str(path), ["a", "b"])
+        os.utime(path, ns=(1, 1))
+
+        digest, written = writer.write_if_changed(str(path), iter(["a", "b"]))
+
+        assert first_written and not written
+        assert digest == first_digest == hashlib.sha256(b"ab").hexdigest()
+        assert path.stat().st_mtime_ns == 1
+        assert os.listdir(tmpdir) == ["output.md"]
+
+
+def test_write_if_changed_replaces_changed_file_or_when_forced():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "output.md"
+        writer = FileTemplateWriter()
+        writer.write_if_changed(str(path), ["old"])
+
+        assert writer.write_if_changed(str(path), ["new"])[1]
+        assert path.read_text(encoding="utf-8") == "new"
+        os.utime(path, ns=(1, 1))
+        assert writer.write_if_changed(str(path), ["new"], force=True)[1]
+        assert path.stat().st_mtime_ns != 1
+
+
+def test_cached_render_still_copies_instructions_from_disk(monkeypatch):
+    copies = []
+    copy = FileTemplateWriter._copy_from_source
+
+    def spy(*args):
+        copied = copy(*args)
+        copies.append(copied)
+        return copied
+
+    monkeypatch.setattr(FileTemplateWriter, "_copy_from_source", staticmethod(spy))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instructions = _segment(Path(tmpdir) / "instructions.md", "# Instrucciones\n")
+        writer = FileTemplateWriter()
+        render = RenderTemplate(writer, instructions, render_cache=LruRenderCache(1024))
+        session = WizardSession()
+        path = Path(tmpdir) / "project.md"
+
+        render.execute(session, str(path))
+        first = path.read_bytes()
+        render.execute(session, str(path))
+
+        assert path.read_bytes() == first
+        assert first.endswith(b"# Instrucciones\n")
+        assert len(copies) == 2
@@ -0,0 +1,22 @@
+import pytest
+
+from vibecrafter.domain.exceptions.wizard_error import MissingAnswerError
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+
+
+def test_ask_text_raises_missing_answer_error():
+    with pytest.raises(MissingAnswerError, match="Nombre"):
+        HeadlessPrompter().ask_text("Nombre del proyecto:")
+
+
+def test_ask_select_raises_missing_answer_error():
+    with pytest.raises(MissingAnswerError):
+        HeadlessPrompter().ask_select("Lenguaje?", ["python", "kotlin"])
+
+
+def test_display_methods_do_nothing():
+    prompter = HeadlessPrompter()
+    prompter.show_welcome()
+    prompter.show_step_header(1, "q")
+    prompter.show_summary([])
+    prompter.show_success("/tmp/project.md")
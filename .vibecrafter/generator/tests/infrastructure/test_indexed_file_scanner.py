@@ -0,0 +1,33 @@
+import tempfile
+from pathlib import Path
+
+from vibecrafter.infrastructure.repositories.docs_index import DocsIndex
+from vibecrafter.infrastructure.repositories.indexed_file_scanner import (
+    IndexedFileScanner,
+)
+
+
+def test_list_md_files_returns_md_stems_from_index():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        designs = Path(tmpdir) / "designs"
+        designs.mkdir()
+        (designs / "vercel.md").write_text("content")
+        (designs / "notes.txt").write_text("content")
+
+        scanner = IndexedFileScanner(DocsIndex.load(tmpdir))
+        assert scanner.list_md_files("designs") == ["vercel"]
+
+
+def test_list_md_files_falls_back_to_subdirectories():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "languages" / "python").mkdir(parents=True)
+        (Path(tmpdir) / "languages" / "go").mkdir()
+
+        scanner = IndexedFileScanner(DocsIndex.load(tmpdir))
+        assert scanner.list_md_files("languages") == ["go", "python"]
+
+
+def test_list_md_files_with_nonexistent_path_returns_empty():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scanner = IndexedFileScanner(DocsIndex.load(tmpdir))
+        assert scanner.list_md_files("nonexistent") == []
@@ -0,0 +1,43 @@
+import json
+
+from vibecrafter.domain.models.document_section import DocumentSection
+from vibecrafter.domain.models.project_document import ProjectDocument
+from vibecrafter.infrastructure.emitters.json_document_emitter import (
+    JsonDocumentEmitter,
+)
+from vibecrafter.infrastructure.emitters.output_targets import create_emitters
+
+
+def test_emit_serialises_answers_per_section_and_references():
+    document = ProjectDocument(
+        project_name="Año",
+        sections=(
+            DocumentSection(
+                id="contexto",
+                header="## 2. Contexto adicional",
+                text="...",
+                answers=(("BASE_DATOS", "postgresql"), ("NOTAS", "")),
+            ),
+        ),
+        instructions="# Instrucciones\n",
+        references=("common/hexagonal.md",),
+    )
+
+    payload = json.loads("".join(JsonDocumentEmitter().emit(document)))
+
+    assert payload == {
+        "project": "Año",
+        "sections": [
+            {
+                "id": "contexto",
+                "header": "## 2. Contexto adicional",
+                "answers": {"BASE_DATOS": "postgresql", "NOTAS": ""},
+            }
+        ],
+        "references": [".vibecrafter/docs/common/hexagonal.md"],
+    }
+
+
+def test_create_emitters_maps_targets_to_file_names():
+    emitters = create_emitters(["json", "agents", "cursor"])
+    assert list(emitters) == ["project.json", "AGENTS.md", ".cursorrules"]
@@ -0,0 +1,29 @@
+from vibecrafter.domain.models.generation_state import GenerationState
+from vibecrafter.domain.models.rendered_section import RenderedSection
+from vibecrafter.infrastructure.repositories.json_generation_state_store import (
+    JsonGenerationStateStore,
+)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    output = str(tmp_path / "project.md")
+    store = JsonGenerationStateStore()
+    state = GenerationState(
+        answers={"NOMBRE": "App", "NOTAS": "línea 1\nlínea 2"},
+        content_digest="abc",
+        sections={"contexto": RenderedSection(digest="d1", text="## 2\n")},
+    )
+
+    store.save(output, state)
+
+    assert (tmp_path / ".project.md.state.json").is_file()
+    assert store.load(output) == state
+
+
+def test_load_missing_or_corrupt_returns_none(tmp_path):
+    output = str(tmp_path / "project.md")
+    store = JsonGenerationStateStore()
+
+    assert store.load(output) is None
+    JsonGenerationStateStore.state_path(output).write_text("{no json", encoding="utf-8")
+    assert store.load(output) is None
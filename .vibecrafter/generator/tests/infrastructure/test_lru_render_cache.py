@@ -0,0 +1,43 @@
+from vibecrafter.infrastructure.cache.lru_render_cache import LruRenderCache
+
+
+def test_get_returns_cached_content():
+    cache = LruRenderCache(max_bytes=100)
+    cache.put("a", "contenido")
+
+    assert cache.get("a") == "contenido"
+    assert cache.get("b") is None
+
+
+def test_put_evicts_least_recently_used_by_size():
+    cache = LruRenderCache(max_bytes=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    cache.get("a")
+
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.size_bytes == 8
+
+
+def test_put_skips_entries_larger_than_the_bound():
+    cache = LruRenderCache(max_bytes=3)
+
+    cache.put("a", "demasiado")
+
+    assert len(cache) == 0
+
+
+def test_overwrite_and_eviction_use_the_stored_size():
+    cache = LruRenderCache(max_bytes=10)
+    cache.put("a", "ñññ")
+    cache.put("a", "ññññ")
+    assert cache.size_bytes == 8
+
+    cache.put("b", "bbbb")
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 4
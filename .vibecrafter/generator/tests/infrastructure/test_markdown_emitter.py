@@ -0,0 +1,29 @@
+from vibecrafter.domain.models.document_section import DocumentSection
+from vibecrafter.domain.models.project_document import ProjectDocument
+from vibecrafter.infrastructure.emitters.markdown_emitter import MarkdownEmitter
+
+
+def _document() -> ProjectDocument:
+    return ProjectDocument(
+        project_name="MiApp",
+        sections=(
+            DocumentSection(
+                id="datos_proyecto",
+                header="## 1. Datos del proyecto",
+                text="## 1. Datos del proyecto\n\n- **Nombre:** MiApp\n\n",
+                answers=(("NOMBRE", "MiApp"),),
+            ),
+        ),
+        instructions="# Instrucciones\n",
+        references=(),
+    )
+
+
+def test_emit_uses_title_then_sections_then_instructions():
+    content = "".join(MarkdownEmitter("# AGENTS.md - {name}").emit(_document()))
+
+    assert content == (
+        "# AGENTS.md - MiApp\n\n"
+        "## 1. Datos del proyecto\n\n- **Nombre:** MiApp\n\n"
+        "---\n\n# Instrucciones\n"
+    )
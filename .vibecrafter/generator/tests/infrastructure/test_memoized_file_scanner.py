@@ -0,0 +1,41 @@
+from unittest.mock import Mock
+
+from vibecrafter.infrastructure.repositories.memoized_file_scanner import (
+    MemoizedFileScanner,
+)
+
+
+def test_list_md_files_scans_each_path_once():
+    scanner = Mock()
+    scanner.list_md_files.return_value = ["python", "go"]
+    memoized = MemoizedFileScanner(scanner)
+
+    memoized.list_md_files("languages")
+    result = memoized.list_md_files("languages")
+
+    assert result == ["python", "go"]
+    scanner.list_md_files.assert_called_once_with("languages")
+
+
+def test_returned_list_does_not_alias_cache():
+    scanner = Mock()
+    scanner.list_md_files.return_value = ["python"]
+    memoized = MemoizedFileScanner(scanner)
+
+    memoized.list_md_files("languages").append("cobol")
+
+    assert memoized.list_md_files("languages") == ["python"]
+
+
+def test_invalidate_forces_rescan():
+    scanner = Mock()
+    scanner.list_md_files.side_effect = [["python"], ["python", "go"], ["a"], ["b"]]
+    memoized = MemoizedFileScanner(scanner)
+    memoized.list_md_files("languages")
+
+    memoized.invalidate("languages")
+    assert memoized.list_md_files("languages") == ["python", "go"]
+
+    memoized.list_md_files("designs")
+    memoized.invalidate()
+    assert memoized.list_md_files("designs") == ["b"]
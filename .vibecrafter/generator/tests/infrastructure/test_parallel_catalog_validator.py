@@ -0,0 +1,40 @@
+import sqlite3
+from dataclasses import replace
+
+from vibecrafter.domain.models.catalog_issue import MISSING_DOC
+from vibecrafter.infrastructure.batch.parallel_catalog_validator import (
+    ParallelCatalogValidator,
+)
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
+
+SEED = """
+INSERT INTO steps VALUES (1, NULL, NULL, 1, 'select', 'Lenguaje?', '@scan:languages',
+    'LENGUAJE', 'datos_proyecto', '`.vibecrafter/docs/languages/{value}/`', 1);
+INSERT INTO steps VALUES (2, NULL, NULL, 2, 'select', 'Auth?', 'No|JWT',
+    'AUTH', 'contexto', '`.vibecrafter/docs/languages/{LENGUAJE}/auth.md`', 1);
+"""
+
+
+def test_execute_checks_every_path_on_the_pool(tmp_path):
+    default = GeneratorPaths.default()
+    db_path = tmp_path / "steps.db"
+    conn = sqlite3.connect(db_path)
+    migrator = SqliteMigrator(conn, str(default.migrations_dir))
+    migrator.migrate()
+    migrator.seed(SEED)
+    conn.close()
+    docs_dir = tmp_path / "docs"
+    for language in ("go", "python"):
+        (docs_dir / "languages" / language).mkdir(parents=True)
+        (docs_dir / "languages" / language / "testing.md").write_text("t")
+    (docs_dir / "languages" / "python" / "auth.md").write_text("a")
+
+    validator = ParallelCatalogValidator(
+        replace(default, db_path=db_path, docs_dir=docs_dir), workers=2
+    )
+    issues = validator.execute()
+
+    assert validator.paths_checked == 4
+    assert [(i.step_id, i.kind) for i in issues] == [(2, MISSING_DOC)]
+    assert "languages/go/auth.md" in issues[0].message
@@ -0,0 +1,29 @@
+import io
+
+from vibecrafter.infrastructure.prompters.plain_prompter import PlainPrompter
+
+
+def test_plain_prompter_writes_no_escape_codes():
+    output = io.StringIO()
+    prompter = PlainPrompter(io.StringIO("\nApp\nx\n2\nlogin\n\n"), output)
+
+    prompter.show_welcome()
+    prompter.show_step_header(1, "Nombre?")
+    assert prompter.ask_text("Nombre?") == "App"
+    assert prompter.ask_select("Lenguaje?", ["python", "go"]) == "go"
+    assert prompter.ask_multiline("Funcionalidades?") == "  - login"
+    prompter.show_success("/tmp/project.md")
+
+    text = output.getvalue()
+    assert "\x1b" not in text
+    assert "[Paso 1]\nNombre?\n> " in text
+    assert "Opcion no valida. Intenta de nuevo.\nSelecciona [1-2]: " in text
+
+
+def test_long_select_filters_then_picks_by_number():
+    options = [f"design-{n}" for n in range(30)] + ["material-ui"]
+    output = io.StringIO()
+    prompter = PlainPrompter(io.StringIO("zzzz\nmater\n1\n"), output)
+
+    assert prompter.ask_select("Diseno?", options) == "material-ui"
+    assert "Sin coincidencias." in output.getvalue()
@@ -0,0 +1,80 @@
+import sqlite3
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.infrastructure.batch.skeleton_prerenderer import SkeletonPrerenderer
+from vibecrafter.infrastructure.config.catalog_loader import (
+    load_docs_index,
+    load_step_catalog,
+)
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.indexed_file_scanner import (
+    IndexedFileScanner,
+)
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
+from vibecrafter.infrastructure.writers.file_template_writer import FileTemplateWriter
+
+TEXT_ANSWERS = {
+    "NOMBRE": "MiApp",
+    "DESC_BREVE": "Una app",
+    "DESC_DETALLADA": "  - Login",
+    "NOTAS": "Usar Docker",
+}
+PYTHON_API = {
+    "LENGUAJE": "python",
+    "TIPO_PROYECTO": "api-rest",
+    "BASE_DATOS": "postgresql",
+    "AUTH": "JWT",
+    "TESTING": "Unitarios",
+}
+KOTLIN_ANDROID = {
+    "LENGUAJE": "kotlin",
+    "TIPO_PROYECTO": "android-app",
+    "BASE_DATOS": "Ninguna",
+    "AUTH": "OAuth2",
+    "TESTING": "E2E",
+    "DISENO": "Ninguno",
+}
+
+
+def _paths(tmpdir: str) -> GeneratorPaths:
+    default = GeneratorPaths.default()
+    db_path = Path(tmpdir) / "steps.db"
+    conn = sqlite3.connect(db_path)
+    migrator = SqliteMigrator(conn, str(default.migrations_dir))
+    migrator.migrate()
+    migrator.seed(default.seed_path.read_text(encoding="utf-8"))
+    conn.close()
+    return replace(
+        default,
+        db_path=db_path,
+        snapshot_path=Path(tmpdir) / "steps.snapshot",
+        docs_index_path=Path(tmpdir) / "docs_index.json",
+        doc_search_path=Path(tmpdir) / "docs_search.json",
+    )
+
+
+def test_filled_skeletons_match_a_full_render():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = _paths(tmpdir)
+        catalog = SkeletonPrerenderer(paths, workers=2).execute()
+
+        run_wizard = RunWizard(
+            step_repository=load_step_catalog(paths),
+            user_prompter=HeadlessPrompter(),
+            file_scanner=IndexedFileScanner(load_docs_index(paths)),
+        )
+        render_template = RenderTemplate(
+            template_writer=FileTemplateWriter(),
+            instructions_content=paths.instructions_path.read_text(encoding="utf-8"),
+        )
+
+    assert len(catalog) > 0
+    for choices in (PYTHON_API, KOTLIN_ANDROID):
+        answers = {**TEXT_ANSWERS, **choices}
+        session = run_wizard.execute(answers)
+        assert catalog.render(answers) == "".join(render_template.render(session))
@@ -0,0 +1,81 @@
+import pytest
+
+from vibecrafter.infrastructure.tracing.span import PHASE
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
+
+
+def test_span_records_name_category_and_duration():
+    recorder = SpanRecorder()
+
+    with recorder.span("phase.render", PHASE):
+        pass
+
+    [span] = recorder.spans()
+    assert span.name == "phase.render"
+    assert span.category == PHASE
+    assert span.duration_ns >= 0
+
+
+def test_span_is_recorded_when_body_raises():
+    recorder = SpanRecorder()
+
+    with pytest.raises(ValueError):
+        with recorder.span("boom"):
+            raise ValueError()
+
+    assert [s.name for s in recorder.spans()] == ["boom"]
+
+
+def test_hooks_receive_every_span():
+    seen = []
+    recorder = SpanRecorder(hooks=[seen.append])
+
+    with recorder.span("a"):
+        pass
+    with recorder.span("b"):
+        pass
+
+    assert [s.name for s in seen] == ["a", "b"]
+
+
+def test_totals_survive_bounded_span_buffer():
+    recorder = SpanRecorder(max_spans=2)
+
+    for _ in range(5):
+        with recorder.span("step_repository.find_children"):
+            pass
+
+    assert len(recorder.spans()) == 2
+    assert recorder.totals()[("step_repository.find_children", "compute")][0] == 5
+
+
+def test_to_chrome_trace_emits_complete_events():
+    recorder = SpanRecorder()
+    with recorder.span("x"):
+        pass
+
+    [event] = recorder.to_chrome_trace()["traceEvents"]
+    assert event["ph"] == "X"
+    assert event["name"] == "x"
+
+
+def test_to_prometheus_emits_sum_and_count_per_span():
+    recorder = SpanRecorder()
+    with recorder.span("file_scanner.list_md_files"):
+        pass
+
+    text = recorder.to_prometheus()
+    labels = 'name="file_scanner.list_md_files",category="compute"'
+    assert f"vibecrafter_span_seconds_count{{{labels}}} 1" in text
+    assert f"vibecrafter_span_seconds_sum{{{labels}}}" in text
+
+
+def test_to_prometheus_escapes_label_values():
+    recorder = SpanRecorder()
+    with recorder.span('a"b\\c\nd'):
+        pass
+
+    text = recorder.to_prometheus()
+
+    assert 'name="a\\"b\\\\c\\nd"' in text
+    assert len(text.splitlines()) == 4
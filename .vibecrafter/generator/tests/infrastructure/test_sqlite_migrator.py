@@ -0,0 +1,89 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from vibecrafter.domain.exceptions.wizard_error import WizardError
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
+
+GENERATOR_DIR = Path(__file__).resolve().parent.parent.parent
+MIGRATIONS_DIR = str(GENERATOR_DIR / "migrations")
+
+
+def _index_names(conn: sqlite3.Connection) -> set[str]:
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    return {row[0] for row in rows}
+
+
+def test_migrate_applies_all_migrations_on_empty_database():
+    conn = sqlite3.connect(":memory:")
+    migrator = SqliteMigrator(conn, MIGRATIONS_DIR)
+
+    applied = migrator.migrate()
+
+    assert applied == [1, 2]
+    assert migrator.current_version() == 2
+    assert {"idx_steps_children", "idx_steps_parent_order"} <= _index_names(conn)
+
+
+def test_migrate_is_idempotent():
+    conn = sqlite3.connect(":memory:")
+    migrator = SqliteMigrator(conn, MIGRATIONS_DIR)
+    migrator.migrate()
+
+    assert migrator.migrate() == []
+    assert migrator.pending() == []
+
+
+def test_migrate_upgrades_legacy_database_without_losing_rows():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript((GENERATOR_DIR / "migrations" / "0001_create_steps.sql").read_text())
+    conn.execute(
+        'INSERT INTO steps (id, parent_id, trigger_value, "order", type, question, variable) '
+        "VALUES (1, NULL, NULL, 1, 'text', 'q', 'V')"
+    )
+    conn.commit()
+
+    SqliteMigrator(conn, MIGRATIONS_DIR).migrate()
+
+    assert conn.execute("SELECT COUNT(*) FROM steps").fetchone()[0] == 1
+    assert "idx_steps_children" in _index_names(conn)
+
+
+def test_seed_replaces_catalog_rows():
+    conn = sqlite3.connect(":memory:")
+    migrator = SqliteMigrator(conn, MIGRATIONS_DIR)
+    migrator.migrate()
+    seed = (GENERATOR_DIR / "seed.sql").read_text(encoding="utf-8")
+
+    migrator.seed(seed)
+    count = conn.execute("SELECT COUNT(*) FROM steps").fetchone()[0]
+    migrator.seed(seed)
+
+    assert count > 0
+    assert conn.execute("SELECT COUNT(*) FROM steps").fetchone()[0] == count
+
+
+def test_failed_migration_rolls_back_and_keeps_version():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "0001_ok.sql").write_text("CREATE TABLE a (x INTEGER);")
+        (Path(tmpdir) / "0002_broken.sql").write_text("CREATE TABLE b (x INTEGER); NOT SQL;")
+        conn = sqlite3.connect(":memory:")
+        migrator = SqliteMigrator(conn, tmpdir)
+
+        with pytest.raises(sqlite3.Error):
+            migrator.migrate()
+
+        assert migrator.current_version() == 1
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert tables == {"a"}
+
+
+def test_duplicate_migration_versions_raise_error():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "0001_a.sql").write_text("SELECT 1;")
+        (Path(tmpdir) / "01_b.sql").write_text("SELECT 1;")
+
+        with pytest.raises(WizardError, match="Duplicate"):
+            SqliteMigrator(sqlite3.connect(":memory:"), tmpdir).migrate()
@@ -1,6 +1,12 @@
 import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
 
 from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.repositories.sqlite_migrator import SqliteMigrator
 from vibecrafter.infrastructure.repositories.sqlite_step_repository import (
     SqliteStepRepository,
 )
@@ -57,3 +63,68 @@ class TestSqliteStepRepository:
         assert first.type == StepType.TEXT
         assert first.variable == "NOMBRE"
         assert first.question == "Nombre del proyecto:"
+
+    def test_find_children_query_uses_children_index(self, in_memory_db):
+        plan = in_memory_db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM steps "
+            "WHERE parent_id = ? AND (trigger_value IS NULL OR trigger_value = ?) "
+            'ORDER BY "order"',
+            (5, "webapp"),
+        ).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_steps_" in details
+        assert "SCAN steps" not in details
+
+    def test_find_all_returns_every_step_ordered_by_id(self, in_memory_db):
+        repo = self._create_repo(in_memory_db)
+        ids = [step.id for step in repo.find_all()]
+        assert ids == sorted(ids)
+        assert len(ids) == in_memory_db.execute("SELECT COUNT(*) FROM steps").fetchone()[0]
+
+
+def _seeded_db(tmpdir: str) -> str:
+    db_path = str(Path(tmpdir) / "steps.db")
+    generator_dir = Path(__file__).resolve().parent.parent.parent
+    conn = sqlite3.connect(db_path)
+    migrator = SqliteMigrator(conn, str(generator_dir / "migrations"))
+    migrator.migrate()
+    migrator.seed((generator_dir / "seed.sql").read_text(encoding="utf-8"))
+    conn.close()
+    return db_path
+
+
+def test_thread_local_mode_serves_queries_from_worker_threads():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = SqliteStepRepository(_seeded_db(tmpdir), read_only=True, thread_local=True)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: len(repo.find_children(5, "webapp")), range(16)))
+
+        assert set(results) == {2}
+        assert 1 <= len(repo._opened) <= 4
+        repo.close()
+
+
+def test_read_only_mode_rejects_writes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = SqliteStepRepository(_seeded_db(tmpdir), read_only=True)
+
+        with pytest.raises(sqlite3.OperationalError):
+            repo._current_connection().execute("DELETE FROM steps")
+        repo.close()
+
+
+def test_read_only_mode_with_missing_database_raises_instead_of_creating_it():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        missing = Path(tmpdir) / "missing.db"
+
+        with pytest.raises(sqlite3.OperationalError):
+            SqliteStepRepository(str(missing), read_only=True)
+        assert not missing.exists()
+
+
+def test_immutable_mode_reads_catalog():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = SqliteStepRepository(_seeded_db(tmpdir), immutable=True)
+        assert repo.find_roots()[0].variable == "NOMBRE"
+        repo.close()
@@ -0,0 +1,68 @@
+import tempfile
+from pathlib import Path
+
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.repositories.step_catalog_snapshot import (
+    StepCatalogSnapshot,
+)
+
+
+def _steps() -> list[Step]:
+    return [
+        Step(
+            id=1,
+            parent_id=None,
+            trigger_value=None,
+            order=1,
+            type=StepType.SELECT,
+            question="Lenguaje?",
+            options="@scan:languages",
+            variable="LENGUAJE",
+            md_section="datos_proyecto",
+            md_template="- {value}",
+            md_order=1,
+        )
+    ]
+
+
+def _snapshot(tmpdir: str) -> tuple[StepCatalogSnapshot, Path]:
+    source = Path(tmpdir) / "seed.sql"
+    source.write_text("-- v1")
+    return StepCatalogSnapshot(str(Path(tmpdir) / "steps.snapshot"), [str(source)]), source
+
+
+def test_load_or_build_builds_once_then_reads_snapshot():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        snapshot, source = _snapshot(tmpdir)
+        calls = []
+
+        def build() -> list[Step]:
+            calls.append(1)
+            return _steps()
+
+        first = snapshot.load_or_build(build)
+        second = StepCatalogSnapshot(str(Path(tmpdir) / "steps.snapshot"), [str(source)]).load_or_build(build)
+
+        assert len(calls) == 1
+        assert first == second == _steps()
+
+
+def test_load_returns_none_when_source_changes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        snapshot, source = _snapshot(tmpdir)
+        snapshot.save(_steps())
+
+        source.write_text("-- v2")
+        changed = StepCatalogSnapshot(str(Path(tmpdir) / "steps.snapshot"), [str(source)])
+
+        assert changed.load() is None
+
+
+def test_load_with_missing_or_corrupt_snapshot_returns_none():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        snapshot, _ = _snapshot(tmpdir)
+        assert snapshot.load() is None
+
+        (Path(tmpdir) / "steps.snapshot").write_bytes(b"not a pickle")
+        assert snapshot.load() is None
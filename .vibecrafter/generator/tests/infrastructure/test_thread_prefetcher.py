@@ -0,0 +1,69 @@
+from unittest.mock import Mock
+
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.prefetch.thread_prefetcher import ThreadPrefetcher
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+
+
+def _step(id: int, variable: str, options: str, parent_id=None, trigger=None) -> Step:
+    return Step(
+        id=id,
+        parent_id=parent_id,
+        trigger_value=trigger,
+        order=id,
+        type=StepType.SELECT,
+        question=f"{variable}?",
+        options=options,
+        variable=variable,
+        md_section=None,
+        md_template=None,
+        md_order=0,
+    )
+
+
+LANGUAGE = _step(1, "LENGUAJE", "python|kotlin")
+STEPS = [
+    LANGUAGE,
+    _step(2, "TIPO", "@scan:languages/{LENGUAJE}/project_types", 1, "python"),
+    _step(3, "TIPO", "@scan:languages/{LENGUAJE}/project_types", 1, "kotlin"),
+]
+
+
+def test_prefetch_scans_child_options_for_every_answer():
+    scanner = Mock()
+    prefetcher = ThreadPrefetcher(CachedStepRepository(STEPS), scanner)
+
+    prefetcher.prefetch(LANGUAGE, ["python", "kotlin"], {"NOMBRE": "App"})
+    prefetcher.wait()
+    prefetcher.close()
+
+    scanned = sorted(c.args[0] for c in scanner.list_md_files.call_args_list)
+    assert scanned == [
+        "languages/kotlin/project_types",
+        "languages/python/project_types",
+    ]
+
+
+def test_prefetch_swallows_errors():
+    scanner = Mock()
+    scanner.list_md_files.side_effect = OSError("disco lento")
+    prefetcher = ThreadPrefetcher(CachedStepRepository(STEPS), scanner)
+
+    prefetcher.prefetch(LANGUAGE, ["python"], {})
+    prefetcher.wait()
+    prefetcher.close()
+
+
+def test_prefetch_keeps_an_already_answered_value():
+    scanner = Mock()
+    prefetcher = ThreadPrefetcher(CachedStepRepository(STEPS), scanner)
+
+    prefetcher.prefetch(LANGUAGE, ["python"], {"LENGUAJE": "kotlin"})
+    prefetcher.wait()
+    prefetcher.close()
+
+    [call] = scanner.list_md_files.call_args_list
+    assert call.args[0] == "languages/kotlin/project_types"
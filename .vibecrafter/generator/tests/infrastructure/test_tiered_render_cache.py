@@ -0,0 +1,23 @@
+from vibecrafter.infrastructure.cache.disk_render_cache import DiskRenderCache
+from vibecrafter.infrastructure.cache.lru_render_cache import LruRenderCache
+from vibecrafter.infrastructure.cache.tiered_render_cache import TieredRenderCache
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    disk = DiskRenderCache(str(tmp_path), max_bytes=100)
+    disk.put("k1", "doc")
+    memory = LruRenderCache(max_bytes=100)
+    cache = TieredRenderCache(memory=memory, disk=disk)
+
+    assert cache.get("k1") == "doc"
+    assert memory.get("k1") == "doc"
+
+
+def test_put_writes_both_tiers(tmp_path):
+    disk = DiskRenderCache(str(tmp_path), max_bytes=100)
+    memory = LruRenderCache(max_bytes=100)
+
+    TieredRenderCache(memory=memory, disk=disk).put("k1", "doc")
+
+    assert memory.get("k1") == "doc"
+    assert disk.get("k1") == "doc"
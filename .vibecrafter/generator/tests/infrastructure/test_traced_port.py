@@ -0,0 +1,28 @@
+from unittest.mock import Mock
+
+from vibecrafter.infrastructure.tracing.span import COMPUTE, USER_WAIT
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
+from vibecrafter.infrastructure.tracing.traced_port import TracedPort
+
+
+def test_call_is_forwarded_and_recorded():
+    target = Mock()
+    target.find_roots.return_value = ["root"]
+    recorder = SpanRecorder()
+
+    traced = TracedPort(target, "step_repository", recorder)
+
+    assert traced.find_roots() == ["root"]
+    [span] = recorder.spans()
+    assert span.name == "step_repository.find_roots"
+    assert span.category == COMPUTE
+
+
+def test_wait_methods_are_tagged_as_user_wait():
+    recorder = SpanRecorder()
+    traced = TracedPort(Mock(), "prompter", recorder, frozenset({"ask_text"}))
+
+    traced.ask_text("q")
+    traced.show_step_header(1, "q")
+
+    assert [s.category for s in recorder.spans()] == [USER_WAIT, COMPUTE]
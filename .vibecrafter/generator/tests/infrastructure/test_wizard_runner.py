@@ -0,0 +1,85 @@
+from unittest.mock import Mock
+
+import pytest
+
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.exceptions.wizard_error import MissingAnswerError
+from vibecrafter.domain.models.step import Step
+from vibecrafter.domain.models.step_type import StepType
+from vibecrafter.infrastructure.config.wizard_runner import WizardRunner
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+from vibecrafter.infrastructure.repositories.file_answer_journal import (
+    FileAnswerJournal,
+)
+
+
+def _step(id: int, type: StepType, variable: str, options: str | None = None) -> Step:
+    return Step(
+        id=id,
+        parent_id=None,
+        trigger_value=None,
+        order=id,
+        type=type,
+        question=f"{variable}?",
+        options=options,
+        variable=variable,
+        md_section="sec",
+        md_template="- {value}",
+        md_order=id,
+    )
+
+
+def _runner(
+    journal: FileAnswerJournal, prefetcher: Mock | None = None
+) -> WizardRunner:
+    steps = [
+        _step(1, StepType.TEXT, "NOMBRE"),
+        _step(2, StepType.SELECT, "LENGUAJE", "python|kotlin"),
+        _step(3, StepType.TEXT, "NOTAS"),
+    ]
+    run_wizard = RunWizard(
+        step_repository=CachedStepRepository(steps),
+        user_prompter=HeadlessPrompter(),
+        file_scanner=Mock(),
+    )
+    return WizardRunner(
+        run_wizard=run_wizard,
+        regenerate_project=Mock(),
+        prompter=Mock(),
+        output_path="project.md",
+        journal=journal,
+        prefetcher=prefetcher,
+    )
+
+
+def test_discard_stale_answers_keeps_journal_that_still_fits(tmp_path):
+    journal = FileAnswerJournal(str(tmp_path / "session.journal"))
+    journal.append("NOMBRE", "App")
+    journal.append("LENGUAJE", "python")
+
+    assert _runner(journal).discard_stale_answers() is None
+    assert journal.replay() == {"NOMBRE": "App", "LENGUAJE": "python"}
+
+
+def test_discard_stale_answers_drops_from_first_rejected_answer(tmp_path):
+    journal = FileAnswerJournal(str(tmp_path / "session.journal"))
+    journal.append("NOMBRE", "App")
+    journal.append("LENGUAJE", "cobol")
+    journal.append("NOTAS", "x")
+
+    assert _runner(journal).discard_stale_answers() == "LENGUAJE"
+    assert journal.replay() == {"NOMBRE": "App"}
+
+
+def test_execute_closes_the_prefetcher_even_when_the_wizard_fails(tmp_path):
+    journal = FileAnswerJournal(str(tmp_path / "session.journal"))
+    journal.append("NOMBRE", "App")
+    prefetcher = Mock()
+
+    with pytest.raises(MissingAnswerError):
+        _runner(journal, prefetcher).execute(resume=True)
+
+    prefetcher.close.assert_called_once()
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import sqlite3
+import time
+from unittest.mock import Mock
+
+from vibecrafter.application.use_cases.render_template import RenderTemplate
+from vibecrafter.application.use_cases.run_wizard import RunWizard
+from vibecrafter.domain.models.document_skeleton import DocumentSkeleton
+from vibecrafter.domain.models.skeleton_catalog import SkeletonCatalog
+from vibecrafter.infrastructure.http.wizard_server import WizardServer
+from vibecrafter.infrastructure.prompters.headless_prompter import HeadlessPrompter
+from vibecrafter.infrastructure.repositories.cached_step_repository import (
+    CachedStepRepository,
+)
+from vibecrafter.infrastructure.repositories.sqlite_step_repository import (
+    SqliteStepRepository,
+)
+from vibecrafter.infrastructure.tracing.span_recorder import SpanRecorder
+
+
+SCANS = {
+    "languages": ["kotlin", "python"],
+    "languages/python/project_types": ["api-rest", "cli", "webapp"],
+    "databases": ["postgresql"],
+}
+
+
+def _server(conn: sqlite3.Connection, recorder: SpanRecorder | None = None, skeletons: SkeletonCatalog | None = None, scan_delay: float = 0.0) -> WizardServer:
+    sqlite_repo = SqliteStepRepository.__new__(SqliteStepRepository)
+    sqlite_repo._connection = conn
+
+    def scan(path: str) -> list[str]:
+        # A slow scan leaves each walk half done while other requests run.
+        time.sleep(scan_delay)
+        return SCANS.get(path, [])
+
+    scanner = Mock()
+    scanner.list_md_files.side_effect = scan
+    run_wizard = RunWizard(
+        step_repository=CachedStepRepository(sqlite_repo.find_all()),
+        user_prompter=HeadlessPrompter(),
+        file_scanner=scanner,
+    )
+    render_template = RenderTemplate(template_writer=Mock(), instructions_content="# I")
+    return WizardServer(run_wizard=run_wizard, render_template=render_template, recorder=recorder, skeletons=skeletons)
+
+
+async def _request(port: int, method: str, path: str, payload: dict | None = None) -> tuple[int, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split(b" ")[1]), content
+
+
+def _call(conn: sqlite3.Connection, method: str, path: str, payload: dict | None = None, recorder: SpanRecorder | None = None, skeletons: SkeletonCatalog | None = None) -> tuple[int, bytes]:
+    async def scenario() -> tuple[int, bytes]:
+        server = await _server(conn, recorder, skeletons).start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await _request(port, method, path, payload)
+
+    return asyncio.run(scenario())
+
+
+ANSWERS = {
+    "NOMBRE": "MiApp",
+    "DESC_BREVE": "b",
+    "DESC_DETALLADA": ["Login"],
+    "LENGUAJE": "python",
+    "TIPO_PROYECTO": "api-rest",
+    "AUTH": "JWT",
+    "BASE_DATOS": "postgresql",
+    "TESTING": "E2E",
+    "NOTAS": "",
+}
+
+
+def test_next_step_returns_first_unanswered_step(in_memory_db):
+    status, body = _call(in_memory_db, "POST", "/next-step", {"answers": {"NOMBRE": "App", "DESC_BREVE": "b", "DESC_DETALLADA": "x"}})
+
+    payload = json.loads(body)
+    assert status == 200
+    assert payload["complete"] is False
+    assert payload["step"]["variable"] == "LENGUAJE"
+    assert payload["step"]["options"] == ["kotlin", "python"]
+
+
+def test_next_step_with_all_answers_reports_complete(in_memory_db):
+    status, body = _call(in_memory_db, "POST", "/next-step", {"answers": ANSWERS})
+    assert status == 200
+    assert json.loads(body) == {"complete": True}
+
+
+def test_render_returns_markdown_document(in_memory_db):
+    status, body = _call(in_memory_db, "POST", "/render", {"answers": ANSWERS})
+
+    content = body.decode("utf-8")
+    assert status == 200
+    assert content.startswith("# Proyecto: MiApp")
+    assert "  - Login" in content
+    assert content.endswith("# I")
+
+
+def test_render_with_invalid_answer_returns_422(in_memory_db):
+    status, body = _call(in_memory_db, "POST", "/render", {"answers": {**ANSWERS, "LENGUAJE": "cobol"}})
+    assert status == 422
+    assert "cobol" in json.loads(body)["error"]
+
+
+def test_unexpected_error_returns_500(in_memory_db):
+    async def scenario() -> tuple[int, bytes]:
+        server = _server(in_memory_db)
+        server._run_wizard._file_scanner.list_md_files.side_effect = OSError("gone")
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            return await _request(port, "POST", "/next-step", {"answers": {"NOMBRE": "App", "DESC_BREVE": "b", "DESC_DETALLADA": "x"}})
+
+    status, body = asyncio.run(scenario())
+
+    assert status == 500
+    assert json.loads(body) == {"error": "Internal server error"}
+
+
+def test_unknown_path_returns_404(in_memory_db):
+    status, _ = _call(in_memory_db, "GET", "/nope")
+    assert status == 404
+
+
+def test_concurrent_requests_are_all_served(in_memory_db):
+    async def scenario() -> list[int]:
+        server = await _server(in_memory_db).start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            results = await asyncio.gather(
+                *(_request(port, "POST", "/render", {"answers": ANSWERS}) for _ in range(10))
+            )
+        return [status for status, _ in results]
+
+    assert asyncio.run(scenario()) == [200] * 10
+
+
+def test_concurrent_renders_do_not_change_next_step_numbers(in_memory_db):
+    partial = {"NOMBRE": "App", "DESC_BREVE": "b", "DESC_DETALLADA": "x"}
+
+    async def scenario() -> list[int]:
+        server = await _server(in_memory_db, scan_delay=0.005).start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            results = await asyncio.gather(
+                *(
+                    _request(port, "POST", "/render", {"answers": ANSWERS})
+                    if i % 2
+                    else _request(port, "POST", "/next-step", {"answers": partial})
+                    for i in range(40)
+                )
+            )
+        return [
+            json.loads(body)["step"]["number"]
+            for i, (_, body) in enumerate(results)
+            if i % 2 == 0
+        ]
+
+    assert asyncio.run(scenario()) == [4] * 20
+
+
+def test_metrics_exposes_request_spans_when_recorder_given(in_memory_db):
+    recorder = SpanRecorder()
+    with recorder.span("http POST /render"):
+        pass
+
+    status, body = _call(in_memory_db, "GET", "/metrics", recorder=recorder)
+
+    assert status == 200
+    assert 'name="http POST /render"' in body.decode("utf-8")
+
+
+def test_request_spans_are_labelled_by_route_not_raw_path(in_memory_db):
+    recorder = SpanRecorder()
+
+    async def scenario() -> None:
+        server = await _server(in_memory_db, recorder).start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            for path in ("/nope", '/x"y', "/render?debug=1"):
+                await _request(port, "GET", path)
+
+    asyncio.run(scenario())
+
+    assert sorted(name for name, _ in recorder.totals()) == [
+        "http GET /render",
+        "http GET other",
+    ]
+
+
+def test_metrics_without_recorder_returns_404(in_memory_db):
+    status, _ = _call(in_memory_db, "GET", "/metrics")
+    assert status == 404
+
+
+def test_render_serves_prebuilt_skeleton_when_one_matches(in_memory_db):
+    skeletons = SkeletonCatalog(tail="# I")
+    choices = {k: ANSWERS[k] for k in ("LENGUAJE", "TIPO_PROYECTO", "AUTH", "BASE_DATOS", "TESTING")}
+    skeletons.add(choices, DocumentSkeleton.parse("prebuilt\n"))
+
+    status, body = _call(in_memory_db, "POST", "/render", {"answers": ANSWERS}, skeletons=skeletons)
+    assert status == 200
+    assert body == b"prebuilt\n# I"
+
+    status, body = _call(in_memory_db, "POST", "/render", {"answers": {**ANSWERS, "TESTING": "Unitarios"}}, skeletons=skeletons)
+    assert status == 200
+    assert b"# Proyecto: MiApp" in body
@@ -0,0 +1,42 @@
+"""VibeCrafter - Statically validate the step catalog against the docs tree."""
+
+import argparse
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+from vibecrafter.infrastructure.batch.parallel_catalog_validator import (
+    ParallelCatalogValidator,
+)
+from vibecrafter.infrastructure.config.generator_paths import GeneratorPaths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Check every reachable wizard path for catalog mistakes."
+    )
+    parser.add_argument("--db", help="steps.db to validate (default: the generator's)")
+    parser.add_argument("--docs", help="docs directory (default: .vibecrafter/docs)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    paths = GeneratorPaths.default()
+    if args.db:
+        paths = replace(paths, db_path=Path(args.db))
+    if args.docs:
+        paths = replace(paths, docs_dir=Path(args.docs))
+
+    validator = ParallelCatalogValidator(paths, workers=args.workers)
+    issues = validator.execute()
+
+    for issue in issues:
+        print(issue, file=sys.stderr)
+    print(
+        f"{validator.paths_checked} paths checked in "
+        f"{validator.elapsed_seconds:.2f}s, {len(issues)} issues"
+    )
+    sys.exit(1 if issues else 0)
+
+
+if __name__ == "__main__":
+    main()